@@ -34,10 +34,12 @@ class ExecutionContext(Context):
         self.current_path = None
         self.paused_from_state = None
         self.pump_controller = None
+        self.use_spline_streaming = False  # Upload each path as one spline instead of MoveL per point
 
         # ✅ Add these for pump adjustment
         self.pump_thread = None
         self.pump_ready_event = None
+        self.pump_loop_stats = None  # Jitter/overrun stats of the last finished pump control loop
 
     def save_progress(self, path_index: int, point_index: int):
         """Save current execution progress"""
@@ -111,6 +113,7 @@ class ExecutionContext(Context):
             "motor_started": self.motor_started,
             "generator_started": self.generator_started,
             "is_resuming": self.is_resuming,
+            "use_spline_streaming": self.use_spline_streaming,
 
             # State information
             "current_state": str(self.state_machine.state) if self.state_machine else "None",
@@ -119,6 +122,7 @@ class ExecutionContext(Context):
             # Thread state
             "pump_thread_alive": self.pump_thread.is_alive() if self.pump_thread else False,
             "pump_ready_event_set": self.pump_ready_event.is_set() if self.pump_ready_event else False,
+            "pump_loop_stats": self.pump_loop_stats,
 
             # Settings
             "has_current_settings": self.current_settings is not None,
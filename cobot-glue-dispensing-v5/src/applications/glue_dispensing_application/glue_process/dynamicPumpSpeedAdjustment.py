@@ -6,6 +6,9 @@ from applications.glue_dispensing_application.glue_process.state_machine.GluePro
 from modules.utils import files, robot_utils
 from modules.utils.custom_logging import log_debug_message
 
+# Rate of the pump speed control loop while the robot is moving
+PUMP_CONTROL_RATE_HZ = 50
+
 # State Management Functions
 def is_point_reached(currentPos, targetPoint, threshold):
     """Check if robot has reached a specific point within threshold distance"""
@@ -128,13 +131,20 @@ def calculate_pump_speed_adjustments(current_velocity, current_acceleration, glu
     
     return velocity_compensation + accel_compensation, velocity_compensation, accel_compensation
 
+def read_robot_motion(robotService):
+    """Return (position, velocity, acceleration) of the newest telemetry sample, falling back to the separate getters"""
+    sample = robotService.get_latest_telemetry()
+    if sample is not None:
+        return sample.position, sample.velocity, sample.acceleration
+    return robotService.get_current_position(), robotService.get_current_velocity(), robotService.get_current_acceleration()
+
 # Debug/Logging Functions
-def log_debug_data(robotService, current_velocity, current_acceleration, velocity_compensation, accel_compensation, adjustedPumpSpeed, last_write_time):
+def log_debug_data(current_pos, current_velocity, current_acceleration, velocity_compensation, accel_compensation, adjustedPumpSpeed, last_write_time):
     """Log comprehensive debug data to file and return updated last_write_time"""
     current_time = time.time()
     delta_time = current_time - last_write_time
     
-    message = f"dt: {delta_time} Pos {robotService.get_current_position()} Vel: {float(current_velocity):.3f}, Acc: {float(current_acceleration):.3f}, Vel Com: {float(velocity_compensation):.3f}, Acc Comp {accel_compensation:.3f}, Pump speed: {float(adjustedPumpSpeed):.3f}\n"
+    message = f"dt: {delta_time} Pos {current_pos} Vel: {float(current_velocity):.3f}, Acc: {float(current_acceleration):.3f}, Vel Com: {float(velocity_compensation):.3f}, Acc Comp {accel_compensation:.3f}, Pump speed: {float(adjustedPumpSpeed):.3f}\n"
     files.write_to_debug_file("robot_pump_values.txt", message)
     
     return current_time
@@ -149,6 +159,77 @@ class PumpAdjustmentConfig:
         self.motor_address = motor_address
         self.start_point_index = start_point_index
 
+# Control Loop Timing
+class ControlLoopTimer:
+    """
+    Fixed-period scheduler for the pump control loop.
+
+    Each cycle has an absolute deadline (start + n * period), so the loop does not drift
+    when an iteration takes longer or shorter. Jitter is how late the loop woke up
+    compared to its deadline; an overrun is a cycle whose work finished after the next
+    deadline had already passed. After an overrun the schedule is re-anchored to the
+    current time instead of running the missed cycles back-to-back.
+    """
+    def __init__(self, rate_hz=PUMP_CONTROL_RATE_HZ, clock=time.perf_counter, sleep=time.sleep):
+        if rate_hz <= 0:
+            raise ValueError(f"Control rate must be positive, got {rate_hz}")
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+        self._clock = clock
+        self._sleep = sleep
+        self._next_deadline = None
+
+        self.cycles = 0
+        self.overruns = 0
+        self.max_jitter = 0.0
+        self._total_jitter = 0.0
+        self.max_cycle_time = 0.0
+        self._cycle_start = None
+
+    def start(self):
+        """Anchor the schedule at the current time and mark the start of the first cycle"""
+        now = self._clock()
+        self._next_deadline = now + self.period
+        self._cycle_start = now
+
+    def wait_for_next_cycle(self):
+        """Sleep until the next deadline and record the timing of the cycle that just ended"""
+        if self._next_deadline is None:
+            self.start()
+            return
+
+        now = self._clock()
+        self.cycles += 1
+        self.max_cycle_time = max(self.max_cycle_time, now - self._cycle_start)
+
+        if now > self._next_deadline:
+            # Work took longer than one period - skip the missed cycles
+            self.overruns += 1
+            self._next_deadline = now + self.period
+            self._cycle_start = now
+            return
+
+        self._sleep(self._next_deadline - now)
+        woke_at = self._clock()
+        jitter = max(0.0, woke_at - self._next_deadline)
+        self._total_jitter += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+        self._next_deadline += self.period
+        self._cycle_start = woke_at
+
+    def get_stats(self):
+        """Return the loop timing statistics, times in milliseconds"""
+        on_time_cycles = self.cycles - self.overruns
+        return {
+            "rate_hz": self.rate_hz,
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "mean_jitter_ms": (self._total_jitter / on_time_cycles) * 1000 if on_time_cycles else 0.0,
+            "max_jitter_ms": self.max_jitter * 1000,
+            "max_cycle_time_ms": self.max_cycle_time * 1000,
+        }
+
 def adjustPumpSpeedDynamically(
         glueSprayService,
         robotService,
@@ -159,12 +240,17 @@ def adjustPumpSpeedDynamically(
         threshold,
         start_point_index=0,
         ready_event=None,
-        execution_context=None
+        execution_context=None,
+        loop_timer=None
 ):
     """
     Enhanced version that tracks robot progress through the entire path.
+    Runs at the fixed rate of loop_timer (PUMP_CONTROL_RATE_HZ by default).
     Returns (success, current_point_index) for precise pause/resume handling.
     """
+    if loop_timer is None:
+        loop_timer = ControlLoopTimer()
+
     print(f"adjustPumpSpeedDynamically called with start_point_index={start_point_index}")
     print(f"Path threshold: {threshold}")
 
@@ -187,23 +273,24 @@ def adjustPumpSpeedDynamically(
     first_point_reached = False
 
     # Main processing loop
+    loop_timer.start()
     while True:
         # Check if robot is paused or stopped
         should_exit, next_target_point = check_robot_state(execution_context.state_machine if execution_context else None, robotService, start_point_index, furthest_checkpoint_passed)
         if should_exit:
             return False, next_target_point
 
-        # Get current position
-        current_pos = robotService.get_current_position()
+        # Get current position, velocity and acceleration from the same state sample
+        current_pos, current_velocity, current_acceleration = read_robot_motion(robotService)
         if current_pos is None:
-            time.sleep(robotService.robot_state_manager_cycle_time)
+            loop_timer.wait_for_next_cycle()
             continue
         # Check if first point is reached
         first_point_reached, should_continue = is_first_point_reached(
             current_pos, first_point, threshold, robotService, start_point_index, first_point_reached
         )
         if not should_continue:
-            time.sleep(robotService.robot_state_manager_cycle_time)
+            loop_timer.wait_for_next_cycle()
             continue
         # Check if final point is reached
         if is_final_point_reached(current_pos, final_point, remaining_path, furthest_checkpoint_passed, threshold, robotService):
@@ -212,30 +299,34 @@ def adjustPumpSpeedDynamically(
         furthest_checkpoint_passed = update_checkpoint_progress(
             current_pos, remaining_path, furthest_checkpoint_passed, start_point_index, robotService
         )
-        # Get current robot motion data
-        current_velocity = robotService.get_current_velocity()
-        current_acceleration = robotService.get_current_acceleration()
         # Calculate pump speed adjustments
         adjusted_pump_speed, velocity_compensation, accel_compensation = calculate_pump_speed_adjustments(
             current_velocity, current_acceleration, glue_speed_coefficient, glue_acceleration_coefficient
         )
         # Log debug data
         last_write_time = log_debug_data(
-            robotService, current_velocity, current_acceleration, 
+            current_pos, current_velocity, current_acceleration,
             velocity_compensation, accel_compensation, adjusted_pump_speed, last_write_time
         )
         # Apply pump speed adjustment
         glueSprayService.adjustMotorSpeed(motorAddress=motorAddress, speed=int(adjusted_pump_speed))
+        loop_timer.wait_for_next_cycle()
     # Path completed successfully
     log_debug_message(robotService.logger_context, message="RobotService.adjustPumpSpeedWhileRobotIsMoving2 ALL POINTS REACHED! ")
+    log_debug_message(robotService.logger_context, message=f"Pump control loop stats: {loop_timer.get_stats()}")
     final_progress = start_point_index + len(remaining_path) - 1
     return True, final_progress
 
 class PumpThreadWithResult(threading.Thread):
-    """Thread wrapper that stores the result from the pump adjustment function"""
-    def __init__(self, *args, **kwargs):
+    """Thread wrapper that stores the result and control loop timing of the pump adjustment function"""
+    def __init__(self, *args, loop_timer=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.result = None
+        self.loop_timer = loop_timer
+
+    def get_loop_stats(self):
+        """Return jitter/overrun statistics of the control loop, or None if no timer is attached"""
+        return self.loop_timer.get_stats() if self.loop_timer is not None else None
     
     def run(self):
         try:
@@ -254,10 +345,13 @@ def start_dynamic_pump_speed_adjustment_thread(service,
                                                reach_end_threshold,
                                                pump_ready_event,
                                                start_point_index=0,
-                                               execution_context=None):
+                                               execution_context=None,
+                                               control_rate_hz=PUMP_CONTROL_RATE_HZ):
 
+    loop_timer = ControlLoopTimer(control_rate_hz)
     pump_thread = PumpThreadWithResult(
         target=adjustPumpSpeedDynamically,
+        loop_timer=loop_timer,
         args=(
             service,  # glueSprayService
             robotService,  # robotService
@@ -268,7 +362,8 @@ def start_dynamic_pump_speed_adjustment_thread(service,
             reach_end_threshold,  # threshold
             start_point_index,  # start_point_index
             pump_ready_event,  # ready_event
-            execution_context  # execution_context
+            execution_context,  # execution_context
+            loop_timer  # loop_timer
         )
     )
     pump_thread.start()
@@ -42,6 +42,7 @@ from modules.shared.MessageBroker import MessageBroker
 USE_SEGMENT_SETTINGS = True
 TURN_OFF_PUMP_BETWEEN_PATHS = True
 ADJUST_PUMP_SPEED_WHILE_SPRAY = True
+USE_SPLINE_STREAMING = False  # Send each path as one robot spline motion instead of MoveL per point
 
 # logging configuration
 ENABLE_GLUE_DISPENSING_LOGGING = True
@@ -133,10 +134,12 @@ class GlueDispensingOperation(IOperation):
         self.execution_context.is_resuming = False
         self.execution_context.current_settings = None
         self.execution_context.pump_controller = self.pump_controller
+        self.execution_context.use_spline_streaming = USE_SPLINE_STREAMING
 
         # ✅ Add these for pump adjustment
         self.execution_context.pump_thread = None
         self.execution_context.pump_ready_event = None
+        self.execution_context.pump_loop_stats = None
 
     def get_motor_address_for_glue_type(self, glue_type: str) -> int:
         """
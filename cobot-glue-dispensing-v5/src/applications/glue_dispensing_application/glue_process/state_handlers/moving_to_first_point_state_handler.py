@@ -40,30 +40,28 @@ def handle_moving_to_first_point_state(context, resume):
 
     cancellation_token = CancellationToken()
 
-    # Monitor state machine and cancel if needed
-    def monitor_state_machine():
-        import threading
-        import time
-        def check_state():
-            while not cancellation_token.is_cancelled():
-                if context.state_machine.state in [GlueProcessState.PAUSED, GlueProcessState.STOPPED]:
-                    reason = f"State changed to {context.state_machine.state.value}"
-                    cancellation_token.cancel(reason)
-                    break
-                time.sleep(0.01)  # Check every 10ms
-
-        monitor_thread = threading.Thread(target=check_state, daemon=True)
-        monitor_thread.start()
-
-    monitor_state_machine()
-
-    reached = context.robot_service._waitForRobotToReachPosition(
-        context.current_path[0],
-        reach_start_threshold,
-        delay=0,
-        timeout=30,
-        cancellation_token=cancellation_token
-    )
+    # Cancel the wait from the thread that pauses/stops the process, no monitor thread needed
+    def cancel_on_pause_or_stop(state):
+        if state in [GlueProcessState.PAUSED, GlueProcessState.STOPPED]:
+            cancellation_token.cancel(f"State changed to {state.name}")
+
+    state_machine = context.state_machine
+    if state_machine is not None:
+        state_machine.add_transition_listener(cancel_on_pause_or_stop)
+        # Covers a pause/stop that happened before the listener was registered
+        cancel_on_pause_or_stop(state_machine.state)
+
+    try:
+        reached = context.robot_service._waitForRobotToReachPosition(
+            context.current_path[0],
+            reach_start_threshold,
+            delay=0,
+            timeout=30,
+            cancellation_token=cancellation_token
+        )
+    finally:
+        if state_machine is not None:
+            state_machine.remove_transition_listener(cancel_on_pause_or_stop)
 
     # --- Check if movement was cancelled ---
     if cancellation_token.is_cancelled():
@@ -1,3 +1,4 @@
+import time
 from collections import namedtuple
 
 
@@ -7,6 +8,9 @@ from core.model.settings.RobotConfigKey import RobotSettingKey
 from modules.utils.custom_logging import log_debug_message, log_error_message
 from core.services.robot_service.impl.base_robot_service import CancellationToken
 
+# Global average connection time passed to NewSplineStart in spline streaming mode
+SPLINE_AVERAGE_TIME_MS = 2000
+
 HandlerResult = namedtuple(
     "HandlerResult",
     [
@@ -24,7 +28,13 @@ def handle_send_path_to_robot(context,logger_context):
     """
     Sends path points to robot with immediate pause support using cancellation tokens.
     Returns a HandlerResult describing success/failure and next FSM state.
+
+    When context.use_spline_streaming is set, the path is uploaded as a single
+    spline motion instead of one MoveL call per point.
     """
+    if context.use_spline_streaming and len(context.current_path) > 1:
+        return handle_send_path_as_spline(context, logger_context)
+
     path = context.current_path
     settings = context.current_settings
     start_point_index = context.current_point_index
@@ -82,6 +92,100 @@ def handle_send_path_to_robot(context,logger_context):
     update_context_from_handler_result(context, result)
     return result.next_state
 
+def handle_send_path_as_spline(context, logger_context):
+    """
+    Uploads the whole path segment as one spline motion (NewSplineStart/NewSplinePoint/NewSplineEnd).
+
+    The controller buffers the spline points and only starts moving after NewSplineEnd,
+    so the robot runs the segment at constant speed regardless of the RPC latency per point.
+    Pause and stop are checked between uploaded points; the pause/stop operations stop the
+    robot with StopMotion, which also discards an unfinished spline. Since no point of an
+    unfinished spline was executed, a pause during upload resumes from the segment start.
+    Once the spline is running, pause/stop are handled by WAIT_FOR_PATH_COMPLETION like in
+    the point-by-point mode.
+
+    The paths carry only TCP poses, so the SDK solves each point's joint positions with its
+    own GetInverseKin RPC (two round trips per point). The upload time is logged per segment.
+    """
+    path = context.current_path
+    settings = context.current_settings
+    start_point_index = context.current_point_index
+    path_index = context.current_path_index
+    robot = context.robot_service.robot
+    tool = context.robot_service.robot_config.robot_tool
+    user = context.robot_service.robot_config.robot_user
+    # NewSplinePoint ignores vel/acc, the speed setting is applied as the ovl percentage
+    ovl = min(max(float(settings.get(RobotSettingKey.VELOCITY.value, 10)), 0.0), 100.0)
+
+    log_debug_message(
+        logger_context,
+        message=f"Streaming {len(path)} points to robot as spline (path index {path_index})"
+    )
+
+    i = start_point_index
+    upload_start = time.perf_counter()
+    try:
+        ret = robot.start_spline(SPLINE_AVERAGE_TIME_MS)
+        if ret != 0:
+            log_error_message(logger_context, message=f"NewSplineStart failed with code {ret}")
+            result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, i, path, settings)
+            update_context_from_handler_result(context, result)
+            return result.next_state
+
+        last_offset = len(path) - 1
+        for offset, point in enumerate(path):
+            i = start_point_index + offset
+            if context.state_machine.state == GlueProcessState.PAUSED:
+                context.save_progress(path_index, start_point_index)
+                log_debug_message(logger_context, message=f"Paused while uploading spline point {i}")
+                result = HandlerResult(True, True, GlueProcessState.PAUSED, path_index, start_point_index, path, settings)
+                update_context_from_handler_result(context, result)
+                return result.next_state
+
+            if context.state_machine.state == GlueProcessState.STOPPED:
+                log_debug_message(logger_context, message=f"Stopped while uploading spline point {i}")
+                result = HandlerResult(True, False, GlueProcessState.STOPPED, path_index, start_point_index, path, settings)
+                update_context_from_handler_result(context, result)
+                return result.next_state
+
+            ret = robot.add_spline_point(
+                position=point,
+                tool=tool,
+                user=user,
+                last=offset == last_offset,
+                ovl=ovl,
+            )
+            if ret != 0:
+                log_error_message(logger_context, message=f"NewSplinePoint failed with code {ret} at point {i}")
+                context.robot_service.stop_motion()
+                result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, start_point_index, path, settings)
+                update_context_from_handler_result(context, result)
+                return result.next_state
+
+        ret = robot.end_spline()
+        if ret != 0:
+            log_error_message(logger_context, message=f"NewSplineEnd failed with code {ret}")
+            context.robot_service.stop_motion()
+            result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, start_point_index, path, settings)
+            update_context_from_handler_result(context, result)
+            return result.next_state
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        log_error_message(logger_context, message=f"Exception while streaming spline at point {i}: {e}")
+        result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, start_point_index, path, settings)
+        update_context_from_handler_result(context, result)
+        return result.next_state
+
+    upload_ms = (time.perf_counter() - upload_start) * 1000
+    log_debug_message(
+        logger_context,
+        message=f"Spline uploaded: {len(path)} points in {upload_ms:.1f} ms ({upload_ms / len(path):.1f} ms/point)"
+    )
+    result = HandlerResult(True, False, GlueProcessState.WAIT_FOR_PATH_COMPLETION, path_index, 0, path, settings)
+    update_context_from_handler_result(context, result)
+    return result.next_state
+
 def update_context_from_handler_result(context, result: HandlerResult):
     """Update context based on HandlerResult."""
     # Update context explicitly
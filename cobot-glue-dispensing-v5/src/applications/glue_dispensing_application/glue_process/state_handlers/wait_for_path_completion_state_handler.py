@@ -105,6 +105,7 @@ def handle_wait_for_path_completion(context,logger_context) -> GlueProcessState:
         update_context_from_handler_result(context, result)
         return result.next_state
     finally:
+        capture_pump_loop_stats(context, pump_thread, logger_context)
         context.pump_thread = None
 
     # ✅ The thread finished — robot reached the last point.
@@ -123,4 +124,12 @@ def handle_wait_for_path_completion(context,logger_context) -> GlueProcessState:
 def update_context_from_handler_result(context, result: HandlerResult):
     """Update context based on HandlerResult."""
     context.current_path_index = result.next_path_index
-    context.current_point_index = result.next_point_index
\ No newline at end of file
+    context.current_point_index = result.next_point_index
+
+def capture_pump_loop_stats(context, pump_thread, logger_context):
+    """Store the pump control loop jitter/overrun statistics on the context."""
+    get_loop_stats = getattr(pump_thread, "get_loop_stats", None)
+    if get_loop_stats is None:
+        return
+    context.pump_loop_stats = get_loop_stats()
+    log_debug_message(logger_context, message=f"[WAIT] Pump control loop stats: {context.pump_loop_stats}")
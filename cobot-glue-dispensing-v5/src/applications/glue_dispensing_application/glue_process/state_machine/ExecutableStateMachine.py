@@ -79,6 +79,7 @@ class ExecutableStateMachine(Generic[TState]):
         self.context: Context = context or Context()
         self._stop_requested = False
         self.state_topic = state_topic or "STATE MACHINE"
+        self._transition_listeners = []
 
         log_if_enabled(
             ENABLE_STATE_MACHINE_LOGGING,
@@ -107,8 +108,29 @@ class ExecutableStateMachine(Generic[TState]):
         self.current_state = to_state
         self._call_handler(to_state, "on_enter")
         self.on_transition_success(to_state)
+        self._notify_transition_listeners(to_state)
         return True
 
+    def add_transition_listener(self, listener: Callable[[TState], None]):
+        """Call ``listener(new_state)`` after every successful transition, on the transitioning thread."""
+        self._transition_listeners.append(listener)
+
+    def remove_transition_listener(self, listener: Callable[[TState], None]):
+        if listener in self._transition_listeners:
+            self._transition_listeners.remove(listener)
+
+    def _notify_transition_listeners(self, new_state: TState):
+        for listener in list(self._transition_listeners):
+            try:
+                listener(new_state)
+            except Exception as e:
+                log_if_enabled(
+                    ENABLE_STATE_MACHINE_LOGGING,
+                    state_machine_logger,
+                    LoggingLevel.ERROR,
+                    f"Error in transition listener for {new_state}: {e}"
+                )
+
     def _call_handler(self, state: TState, handler_type: str):
         """Call a handler if defined, passing context"""
         state_obj = self.state_registry.get(state)
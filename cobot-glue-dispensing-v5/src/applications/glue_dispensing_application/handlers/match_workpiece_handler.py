@@ -4,7 +4,8 @@ from modules.utils.contours import close_contours_if_open
 
 class WorkpieceMatcher:
     def __init__(self):
-        pass
+        # Load the comparison model at startup so the first match does not pay for it
+        CompareContours.preload_comparison_model()
     def perform_matching(self,workpieces,new_contours,debug=False):
         result,matches = self.__get_matches( workpieces, new_contours, debug)
         return result,matches
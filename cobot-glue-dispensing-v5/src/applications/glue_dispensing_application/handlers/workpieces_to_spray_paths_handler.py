@@ -81,7 +81,7 @@ class WorkpieceToSprayPathsGenerator:
         return (robot_path, main_settings)
 
     def handle_workpiece_paths(self, entries, workpiece_height, orientation=0, debug=False, label="TRANSFORMATION"):
-        paths = []
+        valid_entries = []
         for entry in entries:
             # --- Validate contour existence and content ---
             contour_data = entry.get("contour", None)
@@ -98,9 +98,13 @@ class WorkpieceToSprayPathsGenerator:
                 if debug:
                     print(f"⚠️ Skipping {label} entry: missing or empty settings -> {entry}")
                 continue
+            valid_entries.append((contour_data, settings))
 
-            # --- Process the valid entry ---
-            robot_path = self.contour_to_robot_path(contour_data,settings,workpiece_height,orientation)
+        # --- Transform all valid contours of the workpiece in one pass ---
+        robot_contours = self.transform_contours_to_robot_coordinates([contour for contour, _ in valid_entries])
+        paths = []
+        for robot_points, (_, settings) in zip(robot_contours, valid_entries):
+            robot_path = self.convert_to_robot_path(robot_points, settings, workpiece_height, orientation)
             paths.append((robot_path, settings))
         return paths
 
@@ -150,41 +154,26 @@ class WorkpieceToSprayPathsGenerator:
 
 
     def contour_to_robot_path(self,contour,settings,workpiece_height,orientation):
-        pts = flatten_and_convert_to_list(contour)
-        robot_points = self.transform_to_robot_coordinates( pts)
+        robot_points = self.transform_contours_to_robot_coordinates([contour])[0]
         robot_path = self.convert_to_robot_path( robot_points, settings, workpiece_height, orientation)
         return robot_path
 
     def transform_to_robot_coordinates(self, points):
         """Transform 2D points from camera coordinates to robot coordinates with transducer offset applied at rz=0"""
-        if not points:
+        if len(points) == 0:
             return []
+        return self.transform_contours_to_robot_coordinates([points])[0]
 
-        # Convert to numpy array for transformation
-        np_points = np.array(points, dtype=np.float32).reshape(-1, 1, 2)
-        print("Points before transformation: ", np_points)
-
-        # Apply camera to robot transformation with transducer offset correction
-        # Offset is applied at rz=0 since rotation will be handled later in robot path generation
-        # The offset parameters can be configured via settings or hardcoded based on hardware specs
-        transformed = utils.applyTransformation(
-            cameraToRobotMatrix=self.application.visionService.cameraToRobotMatrix,
-            contours=np_points,
-            apply_transducer_offset=True,  # Enable transducer offset correction
-            x_offset=self.application.get_transducer_offsets()[0],  # X offset in mm (configure based on your transducer)
-            y_offset=self.application.get_transducer_offsets()[1],
-            dynamic_offsets_config=self.application.get_dynamic_offsets_config()
-            # Y offset in mm (configure based on your transducer)
-        )
-        print("Transformed points: ", transformed)
-
-        # Convert back to list format
-        result = []
-        for point in transformed:
-            # Flatten nested point structure
-            while isinstance(point, (list, tuple, np.ndarray)) and len(point) == 1:
-                point = point[0]
-            if len(point) >= 2:
-                result.append([float(point[0]), float(point[1])])
+    def transform_contours_to_robot_coordinates(self, contours):
+        """
+        Transform several contours (point lists or arrays) with one batched homography pass.
 
-        return result
+        The transducer offset is applied at rz=0 since rotation is handled later in robot path
+        generation. Returns one [[x, y], ...] list per contour.
+        """
+        if not contours:
+            return []
+        transform = utils.get_homography_transform(self.application.visionService.cameraToRobotMatrix)
+        x_offset, y_offset = self.application.get_transducer_offsets()
+        transformed = transform.transform_contours(contours, offset=(x_offset, y_offset))
+        return [points.tolist() for points in transformed]
@@ -1,4 +1,5 @@
 from typing import List, Tuple, Optional
+import numpy as np
 from modules.utils.custom_logging import log_info_message
 from modules.shared.core.ContourStandartized import Contour
 from modules.utils import utils
@@ -55,16 +56,11 @@ class PlacementWorkflow:
         """
         log_info_message(self.logger_context, f"[transform_centroids] {centroid}")
         
-        transformed_centroid = utils.applyTransformation(
-            vision_service.cameraToRobotMatrix, [centroid]
-        )
-        centroid_for_height_measure = utils.applyTransformation(
-            vision_service.cameraToRobotMatrix, [centroid], apply_transducer_offset=False
-        )
-        
-        flat_centroid = transformed_centroid
-        while isinstance(flat_centroid, (list, tuple)) and len(flat_centroid) == 1:
-            flat_centroid = flat_centroid[0]
+        # One homography pass; the transducer offset is added to a copy for the pickup centroid
+        robot_centroid = utils.get_homography_transform(vision_service.cameraToRobotMatrix).transform_points([centroid])
+        centroid_for_height_measure = [robot_centroid.reshape(-1, 1, 2).tolist()]
+        transducer_offset = (utils.TRANSDUCER_X_OFFSET, utils.TRANSDUCER_Y_OFFSET)
+        flat_centroid = np.round(robot_centroid[0] + transducer_offset, decimals=6).tolist()
 
         return centroid_for_height_measure, flat_centroid
     
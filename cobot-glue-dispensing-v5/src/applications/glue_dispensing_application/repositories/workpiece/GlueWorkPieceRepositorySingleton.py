@@ -2,6 +2,7 @@ from applications.glue_dispensing_application.repositories.workpiece.glue_workpi
     GlueWorkpieceJsonRepository
 from applications.glue_dispensing_application.model.workpiece.GlueWorkpiece import GlueWorkpiece
 from modules.shared.GlueWorkpieceField import GlueWorkpieceField
+from modules.contour_matching.matching.workpiece_feature_index import get_workpiece_feature_index
 
 from core.application.ApplicationContext import get_workpiece_storage_path
 class GlueWorkPieceRepositorySingleton:
@@ -63,6 +64,9 @@ class GlueWorkPieceRepositorySingleton:
                       GlueWorkpieceField.OFFSET, GlueWorkpieceField.HEIGHT, GlueWorkpieceField.SPRAY_PATTERN,
                       GlueWorkpieceField.CONTOUR_AREA,
                       GlueWorkpieceField.NOZZLES]
+            # Subscribe the matching feature index before the repository publishes WORKPIECES_LOADED,
+            # so workpiece features are extracted at load time instead of during the first match
+            get_workpiece_feature_index()
             cls._instance = GlueWorkpieceJsonRepository(storage_dir, fields, GlueWorkpiece)
             
             print(f"GlueWorkPieceRepository initialized with storage: {storage_dir}")
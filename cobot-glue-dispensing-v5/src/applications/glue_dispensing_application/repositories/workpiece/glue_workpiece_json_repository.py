@@ -13,8 +13,11 @@ import datetime
 import json
 import os
 import shutil
+import tempfile
 from typing import Type
 
+from communication_layer.api.v1.topics import WorkpieceTopics
+from modules.shared.MessageBroker import MessageBroker
 from modules.shared.core.interfaces.JsonSerializable import JsonSerializable
 
 
@@ -22,6 +25,11 @@ class GlueWorkpieceJsonRepository:
     """
       A repository for loading and saving workpieces data from/to JSON files.
 
+      The repository keeps an in-memory index that maps every loaded workpiece file to its
+      workpiece ID, mtime and size. The index gives O(1) lookups by ID, lets later loadData()
+      calls re-parse only files that changed on disk and lets save_workpiece() write only the
+      affected file.
+
       Attributes:
           DATE_FORMAT (str): Format for date directories.
           TIMESTAMP_FORMAT (str): Format for unique timestamped folders.
@@ -54,6 +62,11 @@ class GlueWorkpieceJsonRepository:
         self.fields = fields
         # check if dataClass is JsonSerializable
 
+        self._file_index = {}  # relative file path -> {"id", "mtime_ns", "size"}
+        self._objects_by_path = {}  # relative file path -> deserialized object
+        self._path_by_id = {}  # workpiece ID -> relative file path
+        self._objects_by_id = {}  # workpiece ID -> deserialized object
+
         self.data = self.loadData()
         self.visited_dirs = set()  # Track visited directories to avoid repetition
         if not os.path.exists(self.directory):
@@ -62,8 +75,10 @@ class GlueWorkpieceJsonRepository:
 
     def loadData(self):
         """
-        Recursively iterates over all directories inside the base directory, deserializes all JSON files,
-        and returns a list of objects of the provided class type (e.g., Workpiece).
+        Recursively iterates over all directories inside the base directory and returns a list of
+        objects of the provided class type (e.g., Workpiece) for all workpiece JSON files.
+
+        Files whose mtime and size match the index are taken from memory instead of being parsed again.
         """
         objects = []
 
@@ -71,35 +86,48 @@ class GlueWorkpieceJsonRepository:
         if not os.path.exists(self.directory):
             print(f"Directory {self.directory} does not exist.")
             return objects
-        else:
-            # print(f"Directory exists: {self.directory}")
-            pass
-        # print(f"Directory: {self.directory}")
-        # Walk through all subdirectories and files
-        for root, _, files in os.walk(self.directory):
-            # print(f"Root: {root}")
-            for file in files:
-                # print(f"File: {file}")
-                file_path = os.path.join(root, file)
-                # print(f"File Path: {file_path}")  # Debugging: check the full file path
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)  # Load JSON data
-                        print(f"Loaded Data: {data}")  # Debugging: Show the loaded data
-                        obj = self.dataClass.deserialize(data)  # Deserialize into the appropriate object
-                        # print(f"Deserialized Object: {obj}")  # Debugging: Show the deserialized object
-                        objects.append(obj)
-                except Exception as e:
-                    print(f"Error loading object from {file_path}: {e}")
-                    raise Exception(f"Error loading object: {e}")
 
+        file_index = {}
+        objects_by_path = {}
+        for rel_path in self._scan_workpiece_files():
+            file_path = os.path.join(self.directory, rel_path)
+            try:
+                stat = os.stat(file_path)
+                entry = self._file_index.get(rel_path)
+                cached = self._objects_by_path.get(rel_path)
+
+                if cached is not None and entry is not None \
+                        and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    file_index[rel_path] = entry
+                    objects_by_path[rel_path] = cached
+                    objects.append(cached)
+                    continue
+
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
+                obj = self.dataClass.deserialize(data)  # Deserialize into the appropriate object
+
+                file_index[rel_path] = self._make_index_entry(obj, stat)
+                objects_by_path[rel_path] = obj
+                objects.append(obj)
+            except Exception as e:
+                print(f"Error loading object from {file_path}: {e}")
+                raise Exception(f"Error loading object: {e}")
+
+        # Files removed from disk drop out of the index here
+        self._file_index = file_index
+        self._objects_by_path = objects_by_path
+        self._rebuild_id_maps()
+
+        print(f"Loaded {len(objects)} workpieces from {self.directory}")
+        MessageBroker().publish(WorkpieceTopics.WORKPIECES_LOADED, objects)
         return objects
 
     def save_workpiece(self, workpiece):
         """
         Saves a workpiece object as a JSON file. If a workpiece with the same ID exists,
         update it in-memory and overwrite the existing file on disk. Otherwise create
-        a new timestamped folder and file.
+        a new timestamped folder and file. Files are replaced atomically.
 
         Returns:
             tuple: (bool, str)
@@ -115,61 +143,48 @@ class GlueWorkpieceJsonRepository:
 
         workpiece_id = str(workpiece.workpieceId)
 
-        # Prepare serialized data
-        serialized_data = json.dumps(self.dataClass.serialize(copy.deepcopy(workpiece)), indent=4)
+        # Prepare serialized data. serialize() only reassigns attributes, so a shallow copy
+        # keeps the caller's object untouched without copying the contour arrays.
+        serialized_data = json.dumps(self.dataClass.serialize(copy.copy(workpiece)), indent=4)
 
-        # Try to find existing workpiece in memory and on disk
-        existing_index = None
-        for i, wp in enumerate(self.data):
-            if hasattr(wp, "workpieceId") and str(wp.workpieceId) == workpiece_id:
-                existing_index = i
-                break
-
-        # If exists on disk, find its file and overwrite
-        existing_file_path = None
-        if existing_index is not None:
-            for root, _, files in os.walk(self.directory):
-                for file in files:
-                    if file.endswith(self.WORKPIECE_FILE_SUFFIX):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, "r") as f:
-                                data = json.load(f)
-                            file_workpiece_id = data.get("workpieceId") or data.get("id")
-                            if str(file_workpiece_id) == workpiece_id:
-                                existing_file_path = file_path
-                                break
-                        except Exception:
-                            continue
-                if existing_file_path:
-                    break
+        existing = self._objects_by_id.get(workpiece_id)
+        existing_rel_path = self._path_by_id.get(workpiece_id)
+        if existing_rel_path is not None and not os.path.isfile(os.path.join(self.directory, existing_rel_path)):
+            existing_rel_path = None
 
         try:
-            if existing_file_path:
+            if existing_rel_path:
                 # Overwrite existing file
-                with open(existing_file_path, "w") as f:
-                    f.write(serialized_data)
-                # Update in-memory object
-                if existing_index is not None:
-                    self.data[existing_index] = workpiece
-                return True, "Workpiece updated successfully"
+                rel_path = existing_rel_path
+                message = "Workpiece updated successfully"
             else:
                 # Create new timestamped directory and save as new file
                 today_date = datetime.datetime.now().strftime(self.DATE_FORMAT)
                 timestamp = datetime.datetime.now().strftime(self.TIMESTAMP_FORMAT)
-                date_dir = os.path.join(self.directory, today_date)
-                timestamp_dir = os.path.join(date_dir, timestamp)
+                timestamp_dir = os.path.join(self.directory, today_date, timestamp)
                 os.makedirs(timestamp_dir, exist_ok=True)
-                file_path = os.path.join(timestamp_dir, f"{timestamp}{self.WORKPIECE_FILE_SUFFIX}")
-                with open(file_path, "w") as file:
-                    file.write(serialized_data)
-                # Append or replace in-memory list
+                rel_path = os.path.relpath(os.path.join(timestamp_dir, f"{timestamp}{self.WORKPIECE_FILE_SUFFIX}"),
+                                           self.directory)
+                message = "Workpiece saved successfully"
+
+            file_path = os.path.join(self.directory, rel_path)
+            raw = serialized_data.encode("utf-8")
+            self._write_atomic(file_path, raw)
+            if not existing_rel_path:
                 print(f"Workpiece saved to new file: {file_path}")
-                if existing_index is not None:
-                    self.data[existing_index] = workpiece
-                else:
-                    self.data.append(workpiece)
-                return True, "Workpiece saved successfully"
+
+            # Update index and in-memory data
+            if existing is not None and existing_rel_path is None:
+                # The old file is gone from disk - forget it before indexing the new one
+                self._forget_path(self._path_by_id.get(workpiece_id))
+            self._file_index[rel_path] = self._make_index_entry(workpiece, os.stat(file_path))
+            self._objects_by_path[rel_path] = workpiece
+            self._path_by_id[workpiece_id] = rel_path
+            self._objects_by_id[workpiece_id] = workpiece
+            self._replace_or_append(existing, workpiece)
+
+            MessageBroker().publish(WorkpieceTopics.WORKPIECE_SAVED, workpiece)
+            return True, message
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -191,62 +206,39 @@ class GlueWorkpieceJsonRepository:
         print(f"WorkpieceJsonRepository.deleteWorkpiece called with ID: {workpieceId}")
         print(f"Repository data length: {len(self.data) if self.data else 'None'}")
         try:
-            # Find the workpiece in the data list
-            workpiece_to_delete = None
-            workpiece_index = None
-
-            for i, workpiece in enumerate(self.data):
-                if hasattr(workpiece, 'workpieceId') and str(workpiece.workpieceId) == str(workpieceId):
-                    workpiece_to_delete = workpiece
-                    workpiece_index = i
-                    print(f"Workpiece found in memory: {workpiece}")
-                    break
-
+            workpiece_id = str(workpieceId)
+            workpiece_to_delete = self._objects_by_id.get(workpiece_id)
             if workpiece_to_delete is None:
                 return False, f"Workpiece with ID '{workpieceId}' not found."
 
-            # Find and delete the corresponding file/directory on filesystem
-            file_deleted = False
-            for root, dirs, files in os.walk(self.directory):
-                for file in files:
-                    if file.endswith(self.WORKPIECE_FILE_SUFFIX):
-                        file_path = os.path.join(root, file)
-                        try:
-                            # Load the file to check if it contains our workpiece
-                            with open(file_path, 'r') as f:
-                                data = json.load(f)
-                                # Check if this file contains the workpiece we want to delete
-                                file_workpiece_id = data.get('workpieceId') or data.get('id')
-                                if str(file_workpiece_id) == str(workpieceId):
-                                    # Delete the entire timestamp directory (contains the workpiece file)
-                                    parent_dir = os.path.dirname(file_path)
-                                    shutil.rmtree(parent_dir)
-                                    print(f"Deleted workpiece directory: {parent_dir}")
-
-                                    # Check if the date directory is also empty and delete it
-                                    try:
-                                        date_dir = os.path.dirname(parent_dir)
-                                        if not os.listdir(date_dir):
-                                            os.rmdir(date_dir)
-                                            print(f"Deleted empty date directory: {date_dir}")
-                                    except OSError:
-                                        # Directory not empty or other issues, that's fine
-                                        pass
-
-                                    file_deleted = True
-                                    break
-                        except Exception as e:
-                            print(f"Error checking file {file_path}: {e}")
-                            continue
-
-                if file_deleted:
-                    break
-
-            if not file_deleted:
+            rel_path = self._path_by_id.get(workpiece_id)
+            file_path = os.path.join(self.directory, rel_path) if rel_path else None
+            if file_path is None or not os.path.isfile(file_path):
                 return False, f"Workpiece file for ID '{workpieceId}' not found on filesystem."
 
-            # Remove from in-memory data
-            self.data.pop(workpiece_index)
+            # Delete the entire timestamp directory (contains the workpiece file)
+            parent_dir = os.path.dirname(file_path)
+            shutil.rmtree(parent_dir)
+            print(f"Deleted workpiece directory: {parent_dir}")
+
+            # Check if the date directory is also empty and delete it
+            try:
+                date_dir = os.path.dirname(parent_dir)
+                if not os.listdir(date_dir):
+                    os.rmdir(date_dir)
+                    print(f"Deleted empty date directory: {date_dir}")
+            except OSError:
+                # Directory not empty or other issues, that's fine
+                pass
+
+            # Remove from index and in-memory data
+            removed_dir = os.path.relpath(parent_dir, self.directory)
+            for indexed_path in list(self._file_index):
+                if os.path.dirname(indexed_path) == removed_dir:
+                    self._forget_path(indexed_path)
+            self.data = [wp for wp in self.data if wp is not workpiece_to_delete]
+            self._rebuild_id_maps()
+            MessageBroker().publish(WorkpieceTopics.WORKPIECE_DELETED, workpieceId)
 
             return True, f"Workpiece '{workpieceId}' deleted successfully."
 
@@ -264,7 +256,64 @@ class GlueWorkpieceJsonRepository:
         Returns:
             JsonSerializable: The workpiece object if found, else None.
         """
-        for workpiece in self.data:
-            if hasattr(workpiece, 'workpieceId') and str(workpiece.workpieceId) == str(workpieceId):
-                return workpiece
-        return None
+        return self._objects_by_id.get(str(workpieceId))
+
+    # -------------------------------------------------
+    # Index helpers
+    # -------------------------------------------------
+    def _scan_workpiece_files(self):
+        """Yield paths (relative to the storage directory) of all workpiece files, without reading them"""
+        for root, dirs, files in os.walk(self.directory):
+            dirs.sort()
+            for file in sorted(files):
+                if file.endswith(self.WORKPIECE_FILE_SUFFIX):
+                    yield os.path.relpath(os.path.join(root, file), self.directory)
+
+    @staticmethod
+    def _make_index_entry(obj, stat):
+        workpiece_id = getattr(obj, "workpieceId", None)
+        return {
+            "id": str(workpiece_id) if workpiece_id is not None else None,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+
+    def _rebuild_id_maps(self):
+        """Rebuild ID lookups from the loaded files; the first file with an ID wins, as in a linear search"""
+        self._path_by_id = {}
+        self._objects_by_id = {}
+        for rel_path, obj in self._objects_by_path.items():
+            entry = self._file_index.get(rel_path)
+            workpiece_id = entry["id"] if entry else None
+            if workpiece_id is not None and workpiece_id not in self._path_by_id:
+                self._path_by_id[workpiece_id] = rel_path
+                self._objects_by_id[workpiece_id] = obj
+
+    def _forget_path(self, rel_path):
+        if rel_path is None:
+            return
+        self._file_index.pop(rel_path, None)
+        self._objects_by_path.pop(rel_path, None)
+
+    def _replace_or_append(self, existing, workpiece):
+        for i, wp in enumerate(self.data):
+            if wp is existing:
+                self.data[i] = workpiece
+                return
+        self.data.append(workpiece)
+
+    @staticmethod
+    def _write_atomic(file_path, raw):
+        """Write bytes to a temporary file next to file_path and rename it over the target"""
+        directory = os.path.dirname(file_path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -5,6 +5,8 @@ from applications.glue_dispensing_application.services.glueSprayService.motorCon
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.health_check import HealthCheck
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.motor_state import MotorState, \
     AllMotorsState
+from applications.glue_dispensing_application.services.glueSprayService.motorControl.speed_write_coalescer import \
+    SpeedWriteCoalescer
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.utils import split_into_16bit
 from modules.modbusCommunication import ModbusController
 from modules.utils.custom_logging import LoggingLevel, log_if_enabled, setup_logger
@@ -21,9 +23,10 @@ MOTOR_ERROR_REGISTERS_START = 21
 DEFAULT_RAMP_STEPS = 1
 DEFAULT_HEALTH_CHECK_DELAY = 3  # seconds
 DEFAULT_RAMP_STEP_DELAY = 0.001  # seconds
+DEFAULT_SPEED_WRITE_DEADBAND = 50  # speed units; adjustMotorSpeed skips smaller changes
 
 class MotorControl(ModbusController):
-    def __init__(self,motorSlaveId=1):
+    def __init__(self,motorSlaveId=1, speed_write_deadband=DEFAULT_SPEED_WRITE_DEADBAND):
         super().__init__()
         self.motorsId = motorSlaveId
         self.healthCheck = HealthCheck(
@@ -37,11 +40,17 @@ class MotorControl(ModbusController):
         # Connection reuse for adjustMotorSpeed
         self._adjust_client = None
         self._adjust_client_connected = False
+        # Drops redundant adjustMotorSpeed writes so they don't hold the shared modbus lock
+        self._speed_writer = SpeedWriteCoalescer(deadband=speed_write_deadband)
 
     def adjustMotorSpeed(self, motorAddress, speed):
-        speed = int(speed)
-        # print(f"adjustMotorSpeed {speed}")
-        
+        return self._speed_writer.submit(motorAddress, int(speed), self._writeAdjustedSpeed)
+
+    def getSpeedWriteStats(self):
+        """Return how many adjustMotorSpeed writes were issued and how many were suppressed."""
+        return self._speed_writer.get_stats()
+
+    def _writeAdjustedSpeed(self, motorAddress, speed):
         # Check if we have a reusable connection
         if self._adjust_client is None or not self._adjust_client_connected:
             try:
@@ -138,6 +147,7 @@ class MotorControl(ModbusController):
                        broadcast_to_ui=False)
 
         result = False
+        self._speed_writer.invalidate(motorAddress)
         try:
             t = time.perf_counter()
             client = self.getModbusClient(self.motorsId)
@@ -217,6 +227,7 @@ class MotorControl(ModbusController):
                        broadcast_to_ui=False)
 
         result = False
+        self._speed_writer.invalidate(motorAddress)
         try:
             client = self.getModbusClient(self.motorsId)
 
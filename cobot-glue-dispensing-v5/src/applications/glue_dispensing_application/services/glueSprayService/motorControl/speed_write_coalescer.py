@@ -0,0 +1,102 @@
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+
+@dataclass
+class MotorWriteState:
+    """Last delivered and pending speed command of a single motor."""
+
+    last_sent: Optional[int] = None
+    pending: Optional[int] = None
+    writing: bool = False
+
+
+class SpeedWriteCoalescer:
+    """
+    Filters motor speed commands before they reach the Modbus bus.
+
+    - A command within `deadband` of the last speed successfully written to the
+      same motor is dropped (a change to 0 is always written).
+    - While a write to a motor is in flight, newer commands for that motor are
+      parked and only the newest one is written once the bus is free.
+
+    The caller that started the write also delivers the parked command, so no
+    extra thread is needed and the final command of a burst is never lost.
+    """
+
+    def __init__(self, deadband: int = 0):
+        if deadband < 0:
+            raise ValueError(f"Deadband must be >= 0, got {deadband}")
+        self.deadband = deadband
+        self._lock = threading.Lock()
+        self._motors: Dict[int, MotorWriteState] = {}
+
+        self.writes_issued = 0
+        self.suppressed_deadband = 0
+        self.suppressed_superseded = 0
+
+    def submit(self, motor_address: int, speed: int, write: Callable[[int, int], bool]) -> bool:
+        """
+        Deliver `speed` to `motor_address` through `write(motor_address, speed)` unless it is redundant.
+
+        Returns the result of the last write performed by this call, or True when the
+        command was suppressed or handed over to the write already in flight.
+        """
+        with self._lock:
+            state = self._motors.setdefault(motor_address, MotorWriteState())
+            if state.writing:
+                if state.pending is not None:
+                    self.suppressed_superseded += 1
+                state.pending = speed
+                return True
+            if self._within_deadband(state.last_sent, speed):
+                self.suppressed_deadband += 1
+                return True
+            state.writing = True
+
+        try:
+            while True:
+                result = write(motor_address, speed)
+                with self._lock:
+                    self.writes_issued += 1
+                    if result:
+                        state.last_sent = speed
+                    next_speed, state.pending = state.pending, None
+                    if next_speed is not None and self._within_deadband(state.last_sent, next_speed):
+                        self.suppressed_deadband += 1
+                        next_speed = None
+                    if next_speed is None:
+                        # Release the motor while holding the lock so no command gets parked unseen
+                        state.writing = False
+                        return result
+                speed = next_speed
+        except Exception:
+            with self._lock:
+                state.writing = False
+                state.pending = None
+            raise
+
+    def invalidate(self, motor_address: int) -> None:
+        """Forget the last speed of a motor, e.g. after it was written outside the coalescer."""
+        with self._lock:
+            state = self._motors.get(motor_address)
+            if state is not None:
+                state.last_sent = None
+
+    def get_stats(self) -> dict:
+        """Return counts of issued and suppressed writes."""
+        with self._lock:
+            return {
+                "writes_issued": self.writes_issued,
+                "suppressed_deadband": self.suppressed_deadband,
+                "suppressed_superseded": self.suppressed_superseded,
+                "suppressed_total": self.suppressed_deadband + self.suppressed_superseded,
+            }
+
+    def _within_deadband(self, last_sent: Optional[int], speed: int) -> bool:
+        if last_sent is None:
+            return False
+        if speed == 0:
+            return last_sent == 0
+        return abs(speed - last_sent) <= self.deadband
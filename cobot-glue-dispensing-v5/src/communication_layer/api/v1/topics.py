@@ -69,6 +69,7 @@ class VisionTopics(TopicCategory):
     SERVICE_STATE = "vision-service/state"
     LATEST_IMAGE = "vision-system/latest-image"
     FPS = "vision-system/fps"
+    PIPELINE_METRICS = "vision-system/pipeline-metrics"  # per-stage p50/p95/p99 timings and achieved FPS
     CALIBRATION_IMAGE_CAPTURED = "vision-system/calibration-image-captured"
     # Camera and image processing
     BRIGHTNESS_REGION = "vision-system/brightness-region"
@@ -177,6 +178,14 @@ class GlueSprayServiceTopics(TopicCategory):
     FAN_STATE = "glue/spray/fan/state"
 
 
+class WorkpieceTopics(TopicCategory):
+    """Workpiece repository change notifications"""
+
+    WORKPIECES_LOADED = "workpieces/loaded"  # message -> list of all loaded workpieces
+    WORKPIECE_SAVED = "workpieces/saved"  # message -> the saved workpiece
+    WORKPIECE_DELETED = "workpieces/deleted"  # message -> id of the deleted workpiece
+
+
 class UITopics(TopicCategory):
     """User interface specific topics"""
     # Language and localization
@@ -198,6 +207,7 @@ class TopicRegistry:
         'glue_monitor': GlueMonitorServiceTopics,
         'glue_process': GlueProcessTopics,
         'glue_spray': GlueSprayServiceTopics,
+        'workpiece': WorkpieceTopics,
         'ui': UITopics
     }
 
@@ -45,6 +45,44 @@ class IRobot(ABC):
                   list: Result from robot linear move command.
               """
 
+    def start_spline(self, average_time=2000):
+        """
+              Starts a spline motion that passes through the points added with add_spline_point.
+              Points are buffered by the controller and executed as one continuous motion
+              once end_spline is called.
+
+              Args:
+                  average_time (int): Global average connection time in milliseconds.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+
+    def add_spline_point(self, position, tool=0, user=0, last=False, ovl=100, blendR=0, joint_pos=None):
+        """
+              Adds a waypoint to the spline started with start_spline.
+
+              Args:
+                  position (list): Target TCP pose [X, Y, Z, A, B, C].
+                  tool (int): Tool number to use.
+                  user (int): User frame number to use.
+                  last (bool): True for the last point of the spline.
+                  ovl (float): Speed scaling percentage (0-100).
+                  blendR (float): Blending radius for smooth transitions.
+                  joint_pos (list): Joint positions [J1..J6] of the point, if already known.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+
+    def end_spline(self):
+        """
+              Closes the spline started with start_spline and executes it.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+
     def get_current_position(self):
         """
               Retrieves the current TCP (tool center point) position.
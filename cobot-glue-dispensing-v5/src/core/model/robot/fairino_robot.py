@@ -45,6 +45,18 @@ class TestRobotWrapper(IRobot):
         print(f"[MOCK] MoveL -> pos={position}, tool={tool}, user={user}, vel={vel}, acc={acc}, blendR={blendR}")
         return 0
 
+    def start_spline(self, average_time=2000):
+        print(f"[MOCK] NewSplineStart -> averageTime={average_time}")
+        return 0
+
+    def add_spline_point(self, position, tool=0, user=0, last=False, ovl=100, blendR=0, joint_pos=None):
+        print(f"[MOCK] NewSplinePoint -> pos={position}, tool={tool}, user={user}, last={last}, ovl={ovl}, blendR={blendR}")
+        return 0
+
+    def end_spline(self):
+        print("[MOCK] NewSplineEnd called")
+        return 0
+
     def start_jog(self, axis: RobotAxis, direction: Direction, step, vel, acc):
         print(f"[MOCK] StartJOG -> axis={axis}, direction={direction}, step={step}, vel={vel}, acc={acc}")
         return 0
@@ -149,6 +161,57 @@ class FairinoRobot(IRobot):
                           f"MoveL to {position} with tool {tool}, user {user}, vel {vel}, acc {acc}, blendR {blendR} -> result: {result}")
         return result
 
+    def start_spline(self, average_time=2000):
+        """
+              Starts a new spline motion through the given waypoints (NewSplineStart type 1).
+
+              Args:
+                  average_time (int): Global average connection time in milliseconds.
+
+              Returns:
+                  int: Result of NewSplineStart command.
+              """
+        result = self.robot.NewSplineStart(1, average_time)
+        log_debug_message(self.logger_context, f"NewSplineStart averageTime {average_time} -> result: {result}")
+        return result
+
+    def add_spline_point(self, position, tool=0, user=0, last=False, ovl=100, blendR=0, joint_pos=None):
+        """
+              Adds a waypoint to the current spline motion.
+
+              NewSplinePoint's vel/acc arguments are not supported by the controller (always 0),
+              so the speed is given as the ovl override percentage. Without joint_pos the SDK
+              solves the joint positions with an extra GetInverseKin RPC for every point.
+
+              Args:
+                  position (list): Target position.
+                  tool (int): Tool frame ID.
+                  user (int): User frame ID.
+                  last (bool): True for the last point of the spline.
+                  ovl (float): Speed scaling percentage (0-100).
+                  blendR (float): Blend radius.
+                  joint_pos (list): Joint positions of the point, if already known.
+
+              Returns:
+                  int: Result of NewSplinePoint command.
+              """
+        kwargs = {"joint_pos": joint_pos} if joint_pos is not None else {}
+        result = self.robot.NewSplinePoint(position, tool, user, 1 if last else 0, ovl=ovl, blendR=blendR, **kwargs)
+        log_debug_message(self.logger_context,
+                          f"NewSplinePoint to {position} with tool {tool}, user {user}, last {last}, ovl {ovl}, blendR {blendR} -> result: {result}")
+        return result
+
+    def end_spline(self):
+        """
+              Ends the current spline motion.
+
+              Returns:
+                  int: Result of NewSplineEnd command.
+              """
+        result = self.robot.NewSplineEnd()
+        log_debug_message(self.logger_context, f"NewSplineEnd -> result: {result}")
+        return result
+
     def get_current_position(self):
         """
               Retrieves the current TCP (tool center point) position.
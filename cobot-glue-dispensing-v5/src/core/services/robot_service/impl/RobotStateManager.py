@@ -1,8 +1,19 @@
-from modules.shared.MessageBroker import MessageBroker
+import threading
+
+from modules.shared.MessageBroker import MessageBroker, OverflowPolicy
+from core.services.robot_service.impl.position_monitor import PositionMonitor
+from core.services.robot_service.impl.telemetry_ring import TelemetryRing
 from core.services.robot_service.impl.robot_monitor.base_robot_monitor import BaseRobotMonitor
 from core.services.robot_service.enums.RobotState import RobotState
 from communication_layer.api.v1.topics import RobotTopics
 
+# Number of robot state samples kept for telemetry consumers (~4 s of the 8 ms state stream)
+TELEMETRY_CAPACITY = 512
+# Trajectory points are published for the newest moving sample once per interval
+TRAJECTORY_PUBLISH_INTERVAL = 0.03
+# Camera image to dashboard preview scale
+TRAJECTORY_PREVIEW_SCALE = 0.625
+
 class RobotStateManager:
     """
     Manages the robot state and communication based on motion data
@@ -10,9 +21,16 @@ class RobotStateManager:
     """
     def __init__(self, robot_monitor:BaseRobotMonitor, velocity_threshold=1, acceleration_threshold=0.001):
         self.broker = MessageBroker()
+        # Deliver state/trajectory updates off the monitor thread so subscribers can't slow down polling
+        self.broker.configure_async_topic(RobotTopics.ROBOT_STATE, max_queue_size=1,
+                                          overflow_policy=OverflowPolicy.DROP_OLDEST)
+        self.broker.configure_async_topic(RobotTopics.TRAJECTORY_POINT, max_queue_size=256,
+                                          overflow_policy=OverflowPolicy.DROP_OLDEST)
         self.velocity_threshold = velocity_threshold
         self.acceleration_threshold = acceleration_threshold
-        self.trajectory_update = False
+        self._trajectory_update = False
+        self._trajectory_thread = None
+        self._trajectory_stop = threading.Event()
 
         # Motion variables
         self.position = None
@@ -20,6 +38,10 @@ class RobotStateManager:
         self.acceleration = 0.0
         self.robotState = RobotState.STATIONARY
         self.robotStateTopic = RobotTopics.ROBOT_STATE
+        # Wakes threads waiting for the robot to reach a pose as soon as a matching sample arrives
+        self.position_monitor = PositionMonitor()
+        # Timestamped pose/speed/acceleration history shared by all readers of the robot state
+        self.telemetry = TelemetryRing(TELEMETRY_CAPACITY)
         self.monitor = robot_monitor
         self.monitor.set_data_callback(self.on_motion_data)
 
@@ -37,12 +59,11 @@ class RobotStateManager:
         self.position = pos
         self.velocity = velocity
         self.acceleration = acceleration
+        self.telemetry.push(pos, velocity, acceleration, timestamp)
+        self.position_monitor.on_position(pos, timestamp)
         self.update_state()
         self.publish_state()
 
-        if self.robotState != RobotState.STATIONARY and self.trajectory_update:
-            self.send_trajectory_point(pos)
-
     def update_state(self):
         """Determine robot state based on velocity and acceleration."""
         if abs(self.velocity) < self.velocity_threshold:
@@ -61,14 +82,48 @@ class RobotStateManager:
             {"state": self.robotState,"position": self.position, "speed": self.velocity, "accel": self.acceleration}
         )
 
+    @property
+    def trajectory_update(self):
+        return self._trajectory_update
+
+    @trajectory_update.setter
+    def trajectory_update(self, enabled):
+        """Start or stop publishing camera-space trajectory points for the dashboard."""
+        self._trajectory_update = enabled
+        if enabled and self._trajectory_thread is None:
+            self._trajectory_stop.clear()
+            self._trajectory_thread = threading.Thread(target=self._publish_trajectory, daemon=True)
+            self._trajectory_thread.start()
+        elif not enabled and self._trajectory_thread is not None:
+            self._trajectory_stop.set()
+            self._trajectory_thread.join()
+            self._trajectory_thread = None
+
+    def _publish_trajectory(self):
+        """
+        Telemetry consumer that transforms moving samples to camera coordinates.
+
+        Runs on its own thread so the vision transform request never delays the monitor callback.
+        Only the newest sample of each interval is published, keeping the transform requests at
+        the interval rate whatever the state stream rate is.
+        """
+        last_seq = self.telemetry.latest_seq
+        while not self._trajectory_stop.wait(TRAJECTORY_PUBLISH_INTERVAL):
+            sample = self.telemetry.latest()
+            if sample is None or sample.seq == last_seq:
+                continue
+            last_seq = sample.seq
+            if abs(sample.velocity) >= self.velocity_threshold:
+                self.send_trajectory_point(sample.position)
+
     def send_trajectory_point(self, current_pos):
         x, y = current_pos[:2]
         transformed = self.broker.request("vision/transformToCamera", {"x": x, "y": y})
         t_x, t_y = transformed[0], transformed[1]
 
         self.broker.publish(RobotTopics.TRAJECTORY_POINT, {
-            "x": int(t_x * 0.625),
-            "y": int(t_y * 0.625)
+            "x": int(t_x * TRAJECTORY_PREVIEW_SCALE),
+            "y": int(t_y * TRAJECTORY_PREVIEW_SCALE)
         })
 
     # ----------------------------
@@ -79,6 +134,7 @@ class RobotStateManager:
         self.monitor.start(self.on_motion_data)
 
     def stop_monitoring(self):
+        self.trajectory_update = False
         self.monitor.stop()
 
     def get_current_state(self):
@@ -90,3 +146,7 @@ class RobotStateManager:
             "state": self.robotState
         }
 
+    def get_latest_telemetry(self):
+        """Newest telemetry sample (position, velocity and acceleration from one reading), or None."""
+        return self.telemetry.latest()
+
@@ -14,7 +14,6 @@ from core.system_state_management import ServiceState
 
 from core.model.robot.enums.axis import Direction, RobotAxis
 from modules.shared.MessageBroker import MessageBroker
-from modules.utils import robot_utils
 from modules.utils.custom_logging import LoggerContext, setup_logger, log_info_message, log_debug_message
 
 ENABLE_ROBOT_SERVICE_LOGGING = True
@@ -32,12 +31,36 @@ class CancellationToken:
         self._cancelled = threading.Event()
         self._reason = None
         self._timestamp = None
+        self._callbacks_lock = threading.Lock()
+        self._callbacks = []
 
     def cancel(self, reason: str = "cancelled"):
-        """Cancel the operation."""
-        self._cancelled.set()
-        self._reason = reason
-        self._timestamp = time.time()
+        """Cancel the operation and run the registered cancel callbacks."""
+        with self._callbacks_lock:
+            first_cancel = not self._cancelled.is_set()
+            self._reason = reason
+            self._timestamp = time.time()
+            self._cancelled.set()
+            callbacks = list(self._callbacks) if first_cancel else []
+        for callback in callbacks:
+            callback(reason)
+
+    def add_cancel_callback(self, callback):
+        """
+        Call ``callback(reason)`` once when the token is cancelled, right away if it already is.
+        Used to wake up blocking waits instead of polling is_cancelled().
+        """
+        with self._callbacks_lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return callback
+        callback(self._reason)
+        return callback
+
+    def remove_cancel_callback(self, callback):
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
 
     def is_cancelled(self) -> bool:
         """Check if the operation has been cancelled."""
@@ -315,39 +338,30 @@ class RobotService(IRobotService):
         return ret
 
     def _waitForRobotToReachPosition(self, endPoint, threshold, delay, timeout=1, cancellation_token=None):
-        """Wait for robot to reach target position with state awareness"""
-        start_time = time.time()
+        """
+        Wait for robot to reach target position with state awareness.
+
+        Blocks on the robot state manager's PositionMonitor, which wakes the wait as soon as a
+        state sample within ``threshold`` mm of ``endPoint`` arrives or ``cancellation_token``
+        is cancelled. ``delay`` is kept for backward compatibility and no longer used.
+        """
         log_info_message(self.logger_context,
                          message=f"_waitForRobotToReachPosition CALLED WITH  endPoint={endPoint},threshold={threshold},delay = {delay},timeout = {timeout}")
 
-        while True:
-            print(f"RobotService: Waiting for robot to reach position {endPoint} with threshold {threshold}mm")
-            # Check cancellation token (replaces state machine dependency)
-            if cancellation_token is not None and cancellation_token.is_cancelled():
-                log_debug_message(self.logger_context,
-                                  message=f"Operation cancelled via cancellation token: {cancellation_token.get_cancellation_reason()}")
-                return False
-
-            # Check timeout
-            if time.time() - start_time > timeout:
-                log_debug_message(self.logger_context,
-                                  message=f"Timeout reached while waiting for robot position {endPoint}")
-                return False
+        reached = self.robot_state_manager.position_monitor.wait_for_position(
+            endPoint, threshold, timeout, cancellation_token=cancellation_token
+        )
 
-            # Check position
-            current_position = self.get_current_position()
-            if current_position is None:
-                time.sleep(0.1)
-                continue
-
-            distance = robot_utils.calculate_distance_between_points(current_position, endPoint)
-
-            if distance < threshold:
-                log_debug_message(self.logger_context,
-                                  message=f"Robot reached target position {endPoint} within threshold {threshold}mm")
-                return True
-
-            time.sleep(0.01)
+        if reached:
+            log_debug_message(self.logger_context,
+                              message=f"Robot reached target position {endPoint} within threshold {threshold}mm")
+        elif cancellation_token is not None and cancellation_token.is_cancelled():
+            log_debug_message(self.logger_context,
+                              message=f"Operation cancelled via cancellation token: {cancellation_token.get_cancellation_reason()}")
+        else:
+            log_debug_message(self.logger_context,
+                              message=f"Timeout reached while waiting for robot position {endPoint}")
+        return reached
 
     def add_subscription_module(self, module: "ISubscriptionModule"):
         """
@@ -374,6 +388,10 @@ class RobotService(IRobotService):
         return self.robot_state_manager.position
         # return self.robot.getCurrentPosition()
 
+    def get_latest_telemetry(self):
+        """Get the newest robot state sample (TelemetrySample), None before the first one"""
+        return self.robot_state_manager.get_latest_telemetry()
+
     def enable_robot(self):
         """Enable robot motion"""
         self.robot.enable()
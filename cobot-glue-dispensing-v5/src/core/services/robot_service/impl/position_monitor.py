@@ -0,0 +1,106 @@
+import threading
+from typing import Optional
+
+from modules.utils import robot_utils
+
+
+class PositionWaiter:
+    """
+    A registered "notify me when within ``threshold`` mm of ``target``" request.
+
+    The PositionMonitor checks every new robot state sample against the waiter; the waiting
+    thread sleeps on a condition variable until the target is reached or the waiter is
+    cancelled, so no polling interval adds latency.
+    """
+
+    def __init__(self, target, threshold: float):
+        self.target = target
+        self.threshold = threshold
+        self.reached = False
+        self.cancelled = False
+        self.distance = None
+        self._condition = threading.Condition()
+
+    def check(self, position) -> bool:
+        """Compare a position sample against the target; True (and wake the waiter) if within threshold."""
+        distance = robot_utils.calculate_distance_between_points(position, self.target)
+        with self._condition:
+            self.distance = distance
+            if distance < self.threshold:
+                self.reached = True
+                self._condition.notify_all()
+        return self.reached
+
+    def cancel(self):
+        with self._condition:
+            self.cancelled = True
+            self._condition.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until reached, cancelled or timed out. Returns True only if the target was reached."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.reached or self.cancelled, timeout)
+            return self.reached
+
+
+class PositionMonitor:
+    """
+    Shared position-reached notification fed by the robot state stream.
+
+    RobotStateManager calls ``on_position`` for every state sample; callers block in
+    ``wait_for_position`` (or hold a waiter from ``register``) and are woken when a sample
+    within their threshold arrives or their cancellation token is cancelled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = set()
+        self.position = None
+        self.timestamp = None
+
+    def on_position(self, position, timestamp=None):
+        """Handle a new robot position sample, waking every waiter it satisfies."""
+        with self._lock:
+            self.position = position
+            self.timestamp = timestamp
+            waiters = list(self._waiters)
+        for waiter in waiters:
+            if waiter.check(position):
+                self.unregister(waiter)
+
+    def register(self, target, threshold: float) -> PositionWaiter:
+        """Register a waiter; it is checked against the latest sample right away."""
+        waiter = PositionWaiter(target, threshold)
+        with self._lock:
+            position = self.position
+            self._waiters.add(waiter)
+        if position is not None and waiter.check(position):
+            self.unregister(waiter)
+        return waiter
+
+    def unregister(self, waiter: PositionWaiter):
+        with self._lock:
+            self._waiters.discard(waiter)
+
+    def wait_for_position(self, target, threshold: float, timeout: Optional[float] = None,
+                          cancellation_token=None) -> bool:
+        """
+        Block until the robot is within ``threshold`` mm of ``target``.
+
+        Returns:
+            bool: True if reached, False on timeout or when ``cancellation_token`` is cancelled.
+        """
+        waiter = self.register(target, threshold)
+        callback = None
+        if cancellation_token is not None:
+            callback = cancellation_token.add_cancel_callback(lambda reason: waiter.cancel())
+        try:
+            return waiter.wait(timeout)
+        finally:
+            self.unregister(waiter)
+            if callback is not None:
+                cancellation_token.remove_cancel_callback(callback)
+
+    def get_pending_count(self) -> int:
+        with self._lock:
+            return len(self._waiters)
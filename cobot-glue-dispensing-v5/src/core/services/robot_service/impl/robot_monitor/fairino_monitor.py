@@ -1,23 +1,85 @@
+import time
+
 from modules.utils import robot_utils
-from core.model.robot import fairino_robot
 from core.services.robot_service.impl.robot_monitor.base_robot_monitor import BaseRobotMonitor
+from core.services.robot_service.impl.robot_monitor.fairino_state_stream import FairinoStateStream, \
+    FAIRINO_REALTIME_PORT
+
+# Read pose and speed from the controller's real-time push stream instead of polling
+# GetActualTCPPose over a second XML-RPC connection
+USE_REALTIME_STATE_STREAM = True
+# Wait before reconnecting after the state stream dropped
+STREAM_RECONNECT_DELAY = 0.5
 
 
 class FairinoRobotMonitor(BaseRobotMonitor):
     """
     Continuously fetches robot position, computes velocity and acceleration,
     and reports results via a callback to the manager.
+
+    With ``use_state_stream`` (default) every packet of the controller's port 20004 stream
+    is reported at the controller's rate, with the TCP speed measured by the controller;
+    ``cycle_time`` only applies to the RPC polling fallback.
     """
-    def __init__(self, robot_ip, cycle_time=0.03):
+    def __init__(self, robot_ip, cycle_time=0.03, use_state_stream=USE_REALTIME_STATE_STREAM,
+                 port=FAIRINO_REALTIME_PORT):
         super().__init__(cycle_time=cycle_time)
-        self.robot = fairino_robot.FairinoRobot(robot_ip)
+        self.use_state_stream = use_state_stream
+        self.latest_state = None
+        if use_state_stream:
+            self.robot = None
+            self.stream = FairinoStateStream(robot_ip, port)
+        else:
+            from core.model.robot import fairino_robot
+            self.robot = fairino_robot.FairinoRobot(robot_ip)
+            self.stream = None
+
+    def run(self):
+        if not self.use_state_stream:
+            return super().run()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    states = self.stream.read()
+                except OSError as e:
+                    print(f"ERROR: Robot state stream failed: {e}")
+                    self.stream.close()
+                    self.data_callback(None, None, None, time.time(), error=True)
+                    self._stop_event.wait(STREAM_RECONNECT_DELAY)
+                    continue
+                for state in states:
+                    self._on_state(state)
+        finally:
+            self.stream.close()
+
+    def _on_state(self, state):
+        self.latest_state = state
+        self.current_pos = state.tcp_pose
+        self.current_velocity = state.tcp_speed
+        if self.prev_time is not None:
+            self.dt = state.timestamp - self.prev_time
+            self.current_acceleration = self.get_current_acceleration()
+
+        self.data_callback(self.current_pos, self.current_velocity, self.current_acceleration, state.timestamp)
+
+        self.prev_pos = self.current_pos
+        self.prev_time = state.timestamp
+        self.prev_velocity = self.current_velocity
+
+    def get_latest_state(self):
+        """Last decoded stream packet (pose, joints, TCP speed, motion-done flag), None before the first one."""
+        return self.latest_state
 
     def get_current_position(self):
+        if self.use_state_stream:
+            return self.latest_state.tcp_pose if self.latest_state is not None else None
         return self.robot.get_current_position()
 
     def get_current_velocity(self):
+        if self.use_state_stream:
+            return self.latest_state.tcp_speed if self.latest_state is not None else 0.0
         return robot_utils.calculate_velocity(self.current_pos, self.prev_pos, self.dt)
 
     def get_current_acceleration(self):
-        return robot_utils.calculate_acceleration(self.current_velocity, self.prev_velocity, self.dt, use_dt=False)
-
+        # Change of speed since the previous sample, positive while speeding up
+        return robot_utils.calculate_acceleration(self.prev_velocity, self.current_velocity, self.dt, use_dt=False)
@@ -0,0 +1,164 @@
+"""
+Fairino real-time state stream
+
+The controller pushes a RobotStatePkg frame on TCP port 20004 every few milliseconds
+(8 ms by default). This module frames and decodes that stream so the robot monitor can
+read pose, joint positions, TCP speed and the motion-done flag without any XML-RPC calls.
+
+Frame layout: 0x5A 0x5A | frame_cnt (1 byte) | data_len (uint16 LE) | data | checksum (uint16 LE),
+where the checksum is the byte sum of everything before it.
+"""
+
+import ctypes
+import socket
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from libs.fairino.linux.fairino.Robot import RobotStatePkg
+
+FAIRINO_REALTIME_PORT = 20004
+FRAME_HEAD = b"\x5a\x5a"
+HEADER_SIZE = 5
+CHECKSUM_SIZE = 2
+# Upper bound for data_len; anything larger is treated as a corrupted header
+MAX_DATA_LEN = 8 * 1024
+RECV_SIZE = 8 * 1024
+
+
+@dataclass
+class FairinoState:
+    """Fields of one state packet used by the robot monitor."""
+    timestamp: float
+    frame_cnt: int
+    tcp_pose: List[float]
+    joint_positions: List[float]
+    tcp_speed: float
+    tcp_speed_vector: List[float]
+    motion_done: bool
+    robot_state: int
+    main_code: int
+    sub_code: int
+
+    @classmethod
+    def from_packet(cls, packet: RobotStatePkg, timestamp: float) -> "FairinoState":
+        return cls(
+            timestamp=timestamp,
+            frame_cnt=packet.frame_cnt & 0xFF,
+            tcp_pose=list(packet.tl_cur_pos),
+            joint_positions=list(packet.jt_cur_pos),
+            tcp_speed=float(packet.actual_TCP_CmpSpeed[0]),
+            tcp_speed_vector=list(packet.actual_TCP_Speed),
+            motion_done=bool(packet.motion_done),
+            robot_state=packet.robot_state,
+            main_code=packet.main_code,
+            sub_code=packet.sub_code,
+        )
+
+
+class StatePacketParser:
+    """
+    Incremental frame parser for the 20004 byte stream.
+
+    ``feed`` accepts arbitrary chunks (frames may be split or glued together by TCP) and
+    returns the decoded packets. Bytes before a frame head and frames with a wrong checksum
+    are skipped. Frames shorter than RobotStatePkg (older firmware) are zero-padded.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.frames = 0
+        self.checksum_errors = 0
+
+    def feed(self, data: bytes) -> List[RobotStatePkg]:
+        self._buffer += data
+        packets = []
+        while True:
+            start = self._buffer.find(FRAME_HEAD)
+            if start < 0:
+                # Keep a trailing 0x5A, it may be the first half of the next frame head
+                del self._buffer[:max(0, len(self._buffer) - 1)]
+                return packets
+            if start:
+                del self._buffer[:start]
+            if len(self._buffer) < HEADER_SIZE:
+                return packets
+
+            data_len = self._buffer[3] | (self._buffer[4] << 8)
+            if data_len > MAX_DATA_LEN:
+                del self._buffer[:1]
+                continue
+            frame_size = HEADER_SIZE + data_len + CHECKSUM_SIZE
+            if len(self._buffer) < frame_size:
+                return packets
+
+            frame = bytes(self._buffer[:frame_size])
+            checksum = frame[-2] | (frame[-1] << 8)
+            if sum(frame[:-CHECKSUM_SIZE]) & 0xFFFF != checksum:
+                self.checksum_errors += 1
+                del self._buffer[:1]
+                continue
+
+            del self._buffer[:frame_size]
+            self.frames += 1
+            packets.append(decode_packet(frame))
+
+
+def decode_packet(frame: bytes) -> RobotStatePkg:
+    size = ctypes.sizeof(RobotStatePkg)
+    return RobotStatePkg.from_buffer_copy(frame[:size].ljust(size, b"\x00"))
+
+
+def encode_packet(packet: RobotStatePkg) -> bytes:
+    """Serialize a packet with a valid head, length and checksum (used to replay recorded states)."""
+    packet.frame_head = 0x5A5A
+    packet.data_len = ctypes.sizeof(RobotStatePkg) - HEADER_SIZE - CHECKSUM_SIZE
+    raw = bytearray(bytes(packet))
+    checksum = sum(raw[:-CHECKSUM_SIZE]) & 0xFFFF
+    raw[-2] = checksum & 0xFF
+    raw[-1] = checksum >> 8
+    return bytes(raw)
+
+
+class FairinoStateStream:
+    """
+    Client for the controller's real-time state port.
+
+    ``read`` blocks until the next packets arrive (at most ``timeout`` seconds) and returns
+    them decoded; it connects lazily and returns an empty list on timeout. Connection
+    errors are raised as OSError so the caller decides how to reconnect.
+    """
+
+    def __init__(self, robot_ip: str, port: int = FAIRINO_REALTIME_PORT, timeout: float = 0.5):
+        self.robot_ip = robot_ip
+        self.port = port
+        self.timeout = timeout
+        self.parser = StatePacketParser()
+        self._sock: Optional[socket.socket] = None
+
+    def connect(self):
+        self.close()
+        self.parser = StatePacketParser()
+        self._sock = socket.create_connection((self.robot_ip, self.port), timeout=self.timeout)
+        self._sock.settimeout(self.timeout)
+
+    def read(self) -> List[FairinoState]:
+        if self._sock is None:
+            self.connect()
+        try:
+            data = self._sock.recv(RECV_SIZE)
+        except socket.timeout:
+            return []
+        if not data:
+            self.close()
+            raise ConnectionError(f"State stream {self.robot_ip}:{self.port} closed by the controller")
+        timestamp = time.time()
+        return [FairinoState.from_packet(packet, timestamp) for packet in self.parser.feed(data)]
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
@@ -75,6 +75,7 @@ class RobotMonitorFactory:
                 # For test robots, we can create a mock monitor or return a basic one
                 # For now, we'll use the Fairino monitor as a fallback
                 logger.warning(f"Using Fairino monitor for test robot type")
+                kwargs.setdefault("use_state_stream", False)
                 return FairinoRobotMonitor(robot_ip, cycle_time, **kwargs)
             
             else:
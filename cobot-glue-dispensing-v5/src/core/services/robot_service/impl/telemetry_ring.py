@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+POSE_SIZE = 6
+
+
+@dataclass(frozen=True)
+class TelemetrySample:
+    """One robot state sample: TCP pose, speed and acceleration at ``timestamp``."""
+    seq: int
+    timestamp: float
+    position: List[float]
+    velocity: float
+    acceleration: float
+
+
+class TelemetryRing:
+    """
+    Preallocated ring of timestamped robot state samples, written by the robot monitor thread
+    and read by any number of consumers (pump control loop, position waits, dashboard).
+
+    The ring has a single producer and never blocks it: readers take no lock. Each slot
+    carries the sequence number of the sample it holds; the producer invalidates the slot
+    before writing and publishes the new sequence number afterwards, and a reader only
+    returns a slot whose sequence number was the expected one both before and after it
+    copied the data (a seqlock). Samples overwritten while being read are skipped.
+    """
+
+    def __init__(self, capacity: int = 512):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self._seqs = np.zeros(capacity, dtype=np.int64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._poses = np.zeros((capacity, POSE_SIZE), dtype=np.float64)
+        self._motion = np.zeros((capacity, 2), dtype=np.float64)
+        self._latest_seq = 0
+
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the newest sample, 0 while the ring is empty."""
+        return self._latest_seq
+
+    def push(self, position, velocity, acceleration, timestamp) -> int:
+        """Store a sample; only the robot monitor thread may call this. Returns its sequence number."""
+        seq = self._latest_seq + 1
+        slot = seq % self.capacity
+        self._seqs[slot] = -1
+        pose = np.asarray(position, dtype=np.float64).ravel()[:POSE_SIZE]
+        self._poses[slot, :len(pose)] = pose
+        self._poses[slot, len(pose):] = 0.0
+        self._motion[slot, 0] = velocity or 0.0
+        self._motion[slot, 1] = acceleration or 0.0
+        self._timestamps[slot] = timestamp
+        self._seqs[slot] = seq
+        self._latest_seq = seq
+        return seq
+
+    def latest(self) -> Optional[TelemetrySample]:
+        """Newest sample, None while the ring is empty."""
+        for _ in range(3):
+            seq = self._latest_seq
+            if seq == 0:
+                return None
+            sample = self._read(seq)
+            if sample is not None:
+                return sample
+        return None
+
+    def after(self, seq: int, max_samples: Optional[int] = None) -> List[TelemetrySample]:
+        """Samples newer than sequence number ``seq``, oldest first; overwritten ones are missing."""
+        latest = self._latest_seq
+        first = max(seq + 1, latest - self.capacity + 2)
+        if max_samples is not None:
+            first = max(first, latest - max_samples + 1)
+        samples = (self._read(s) for s in range(first, latest + 1))
+        return [sample for sample in samples if sample is not None]
+
+    def since(self, timestamp: float, max_samples: Optional[int] = None) -> List[TelemetrySample]:
+        """Samples taken after ``timestamp``, oldest first."""
+        samples = [sample for sample in self.after(0) if sample.timestamp > timestamp]
+        if max_samples is not None:
+            samples = samples[-max_samples:]
+        return samples
+
+    def interpolate(self, timestamp: float) -> Optional[TelemetrySample]:
+        """
+        State at ``timestamp``, linearly interpolated between the two samples around it.
+
+        Times after the newest sample return the newest sample (no extrapolation); times
+        before the oldest stored sample return None. The interpolated sample keeps the
+        sequence number of the later sample.
+        """
+        older, newer = self._bracket(timestamp)
+        if newer is None:
+            return older
+        if older is None:
+            return None
+        span = newer.timestamp - older.timestamp
+        weight = (timestamp - older.timestamp) / span if span > 0 else 1.0
+        position = [a + (b - a) * weight for a, b in zip(older.position, newer.position)]
+        return TelemetrySample(
+            seq=newer.seq,
+            timestamp=timestamp,
+            position=position,
+            velocity=older.velocity + (newer.velocity - older.velocity) * weight,
+            acceleration=older.acceleration + (newer.acceleration - older.acceleration) * weight,
+        )
+
+    def _bracket(self, timestamp: float) -> Tuple[Optional[TelemetrySample], Optional[TelemetrySample]]:
+        samples = self.after(0)
+        if not samples:
+            return None, None
+        if timestamp >= samples[-1].timestamp:
+            return samples[-1], None
+        older = None
+        for sample in samples:
+            if sample.timestamp >= timestamp:
+                if older is None and sample.timestamp > timestamp:
+                    return None, sample
+                return older or sample, sample
+            older = sample
+        return older, None
+
+    def _read(self, seq: int) -> Optional[TelemetrySample]:
+        slot = seq % self.capacity
+        if self._seqs[slot] != seq:
+            return None
+        timestamp = float(self._timestamps[slot])
+        position = self._poses[slot].tolist()
+        velocity, acceleration = self._motion[slot].tolist()
+        if self._seqs[slot] != seq:
+            return None
+        return TelemetrySample(seq=seq, timestamp=timestamp, position=position,
+                               velocity=velocity, acceleration=acceleration)
@@ -27,6 +27,9 @@ class IRobotService(ABC):
     @abstractmethod
     def get_current_acceleration(self) -> float: ...
 
+    @abstractmethod
+    def get_latest_telemetry(self): ...
+
     @abstractmethod
     def enable_robot(self) -> None: ...
 
@@ -1,4 +1,3 @@
-import queue
 import time
 
 import numpy as np
@@ -6,14 +5,16 @@ import numpy as np
 from modules import utils
 from communication_layer.api.v1.topics import VisionTopics
 from modules.VisionSystem.VisionSystem import VisionSystem
+from modules.VisionSystem.frame_ring_buffer import FrameRingBuffer
+from modules.VisionSystem.frame_metrics import STAGE_PUBLISH_FRAME
 import os
 import json
 import cv2
 import threading
 from pathlib import Path
-from modules.shared.MessageBroker import MessageBroker
-
+from modules.shared.MessageBroker import MessageBroker, OverflowPolicy
 
+PIPELINED_CAPTURE = True  # Capture frames on a separate thread while the previous frame is processed
 
 
 class _VisionService(VisionSystem):
@@ -24,8 +25,8 @@ class _VisionService(VisionSystem):
     filtering workpieces within a defined area, and interfacing with robot calibration and workpieces services.
 
     Attributes:
-        MAX_QUEUE_SIZE (int): Maximum number of frames to store in the queue.
-        frameQueue (queue.Queue): A queue to store the most recent frames for processing.
+        FRAME_BUFFER_CAPACITY (int): Number of recent frames kept in the frame buffer.
+        frame_buffer (FrameRingBuffer): Ring buffer holding the most recent frames with their IDs and timestamps.
         contours (list): Detected contours in the current frame.
         workAreaCorners (dict): Coordinates defining the workpieces pickup area.
         filteredContours (list): Contours that are filtered based on the work area.
@@ -38,7 +39,7 @@ class _VisionService(VisionSystem):
         """
             Initializes the VisionService with camera settings and prepares the frame queue and other attributes.
 
-            This constructor initializes the camera service, the frame queue to store the latest frames,
+            This constructor initializes the camera service, the frame buffer to store the latest frames,
             and loads the camera-to-robot matrix for transformation.
 
             Args:
@@ -75,12 +76,10 @@ class _VisionService(VisionSystem):
 
         super().__init__(configFilePath=config_file_path, storage_path=storage_path)
 
-        self.MAX_QUEUE_SIZE = 100  # Maximum number of frames to store in the queue
-        self.frameQueue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self.FRAME_BUFFER_CAPACITY = 8  # Number of recent frames kept in the ring buffer
+        self.frame_buffer = FrameRingBuffer(capacity=self.FRAME_BUFFER_CAPACITY)
         self.superRun = super().run
-        self.latest_frame = None
         self.frame_lock = threading.Lock()
-        self.frame_id = 0  # Track unique frame updates
         self.contours = None
         self.workAreaCorners = None
         self.filteredContours = None
@@ -88,6 +87,17 @@ class _VisionService(VisionSystem):
         broker = MessageBroker()
         broker.subscribe(VisionTopics.TRANSFORM_TO_CAMERA_POINT, self.transformRobotPointToCamera)
 
+    @property
+    def latest_frame(self):
+        """The most recent frame, or None if no frame was captured yet."""
+        packet = self.frame_buffer.get_latest()
+        return packet.frame if packet is not None else None
+
+    @property
+    def frame_id(self):
+        """ID of the most recent frame, increases by one with every new frame."""
+        return self.frame_buffer.latest_id
+
     @staticmethod
     def _get_default_camera_settings():
         """
@@ -183,6 +193,11 @@ class _VisionService(VisionSystem):
               """
         print("Starting VisionService run loop...")
         broker = MessageBroker()
+        # Slow image subscribers (UI repaint) must not hold up the capture loop - they only need the newest frame
+        broker.configure_async_topic(VisionTopics.LATEST_IMAGE, max_queue_size=1,
+                                     overflow_policy=OverflowPolicy.DROP_OLDEST)
+        if PIPELINED_CAPTURE:
+            self.start_pipelined_capture()
         prev_time = time.time()  # store time of previous frame
 
         while True:
@@ -196,27 +211,42 @@ class _VisionService(VisionSystem):
             fps = 1.0 / (current_time - prev_time)
             prev_time = current_time
             # print(f"[VisionService] FPS -> {fps:.2f}")
-            with self.frame_lock:
-                self.latest_frame = frame
+            self.frame_buffer.push(frame, timestamp=current_time)
+            with self.metrics.stage(STAGE_PUBLISH_FRAME):
                 broker.publish(VisionTopics.LATEST_IMAGE, frame)
                 broker.publish(VisionTopics.FPS, fps)
-                # print(f"[VisionService] Published latest frame and FPS: {fps:.2f}")
-                self.frame_id += 1  # Increment frame ID on new frame
+            # print(f"[VisionService] Published latest frame and FPS: {fps:.2f}")
 
     def getLatestFrame(self):
         """
-            Retrieves the latest frame from the queue.
+            Retrieves the latest frame from the frame buffer.
 
             Returns:
-                numpy.ndarray or None: The most recent frame, or None if the queue is empty.
+                numpy.ndarray or None: The most recent frame, or None if no frame was captured yet.
             """
-
-        with self.frame_lock:
-            if self.latest_frame is None:
-                return None
-        # convert to RGB before returning
         return self.latest_frame
-        # return cv2.cvtColor(self.latest_frame, cv2.COLOR_BGR2RGB)
+
+    def getLatestFramePacket(self):
+        """
+            Retrieves the latest frame together with its frame ID and capture timestamp.
+
+            Returns:
+                FramePacket or None: The most recent frame packet, or None if no frame was captured yet.
+            """
+        return self.frame_buffer.get_latest()
+
+    def wait_for_frame(self, after_id=0, timeout=None):
+        """
+            Blocks until a frame newer than ``after_id`` is available.
+
+            Args:
+                after_id (int): ID of the last frame the caller has already processed.
+                timeout (float): Maximum time to wait in seconds, None waits forever.
+
+            Returns:
+                FramePacket or None: The newest frame packet, or None on timeout.
+            """
+        return self.frame_buffer.wait_for_frame(after_id=after_id, timeout=timeout)
 
     def getContours(self):
         """
@@ -416,12 +446,10 @@ if __name__ == "__main__":
     last_image = None
     
     while True:
-        image = vision_service.getLatestFrame()
-        
-        # Check if we got a new frame by comparing frame IDs
-        with vision_service.frame_lock:
-            current_frame_id = vision_service.frame_id
-        
+        packet = vision_service.getLatestFramePacket()
+        image = packet.frame if packet is not None else None
+        current_frame_id = packet.frame_id if packet is not None else 0
+
         if image is not None:
             # Only update FPS if we have a new frame
             if current_frame_id > last_frame_id:
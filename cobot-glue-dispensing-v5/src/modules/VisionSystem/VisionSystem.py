@@ -1,7 +1,5 @@
 import os
 import threading
-import time
-import psutil
 
 import cv2
 import numpy as np
@@ -13,6 +11,10 @@ from core.system_state_management import ServiceState
 from modules.VisionSystem.brightness_manager import BrightnessManager
 from modules.VisionSystem.camera_initialization import CameraInitializer
 from modules.VisionSystem.data_loading import DataManager
+from modules.VisionSystem.frame_grabber import FrameGrabber
+from modules.VisionSystem.frame_metrics import (
+    FrameMetrics, STAGE_CAPTURE, STAGE_BRIGHTNESS, STAGE_CORRECTION
+)
 from modules.VisionSystem.message_publisher import MessagePublisher
 from modules.VisionSystem.settings_manager import SettingsManager
 from modules.VisionSystem.state_manager import StateManager
@@ -27,9 +29,6 @@ from modules.VisionSystem.handlers.camera_calibration_handler import (
 )
 from modules.VisionSystem.handlers.contour_detection_handler import handle_contour_detection
 
-# External or domain-specific image processing
-from libs.plvision.PLVision import ImageProcessing
-
 # Conditional logging import
 from modules.utils.custom_logging import (
     setup_logger, LoggerContext, log_debug_message, log_info_message
@@ -38,6 +37,11 @@ from modules.utils.custom_logging import (
 ENABLE_LOGGING = True  # Enable or disable logging
 vision_system_logger = setup_logger("VisionSystem") if ENABLE_LOGGING else None
 
+FRAME_WAIT_TIMEOUT = 1.0  # seconds run() waits for a frame from the capture thread
+METRICS_PUBLISH_INTERVAL = 2.0  # seconds between pipeline metrics messages
+CONTOUR_ROI_ENABLED = True  # detect contours only inside the spray area bounding rectangle
+CONTOUR_RETRIEVAL_EXTERNAL = False  # use RETR_EXTERNAL (outer contours only) instead of RETR_TREE
+
 # Base storage folder
 DEFAULT_STORAGE_PATH = os.path.join(
     os.path.dirname(__file__),
@@ -61,6 +65,8 @@ class VisionSystem:
         self.settings_manager = SettingsManager()
         self.service_id = "vision_system"
         self.message_publisher = MessagePublisher()
+        self.metrics = FrameMetrics(publish=self.message_publisher.publish_pipeline_metrics,
+                                    publish_interval=METRICS_PUBLISH_INTERVAL)
         self.state_manager = StateManager(initial_state=ServiceState.INITIALIZING,
                                           message_publisher=self.message_publisher,
                                           log_enabled=ENABLE_LOGGING,
@@ -70,6 +76,8 @@ class VisionSystem:
         self.state_manager.start_state_publisher_thread()
 
         self.threshold_by_area = "spray"
+        self.contour_roi_enabled = CONTOUR_ROI_ENABLED
+        self.contour_retrieval_external = CONTOUR_RETRIEVAL_EXTERNAL
         self.calibrationImages = []
 
         # Initialize camera settings
@@ -140,6 +148,10 @@ class VisionSystem:
         # Initialize skip frames counter
         self.current_skip_frames = 0
 
+        # Capture thread for pipelined mode, None while frames are captured inside run()
+        self.frame_grabber = None
+        self.last_frame_id = 0
+
     @property
     def camera_to_robot_matrix_path(self):
         return self.data_manager.camera_to_robot_matrix_path
@@ -188,13 +200,44 @@ class VisionSystem:
                                          log_enabled=ENABLE_LOGGING,
                                          logger=vision_system_logger)
 
-    def run(self):
-        start_time = time.time()
+    def start_pipelined_capture(self):
+        """
+        Capture frames on a dedicated thread so the camera keeps grabbing while run() processes.
+        run() then always works on the newest captured frame; older ones are dropped and counted.
+        """
+        if self.frame_grabber is None:
+            # Read self.camera on every capture so a reinitialised camera is picked up
+            self.frame_grabber = FrameGrabber(lambda: self.camera)
+        self.frame_grabber.start()
+        log_info_message(self.logger_context, message="Pipelined capture started")
+
+    def stop_pipelined_capture(self):
+        """Stop the capture thread; run() captures frames itself again."""
+        if self.frame_grabber is None:
+            return
+        self.frame_grabber.stop()
+        log_info_message(self.logger_context,
+                         message=f"Pipelined capture stopped: {self.frame_grabber.get_stats()}")
+        self.frame_grabber = None
+
+    def get_capture_stats(self):
+        """Captured/delivered/dropped frame counters of the capture thread, None if not pipelined."""
+        return self.frame_grabber.get_stats() if self.frame_grabber is not None else None
+
+    def _capture_frame(self):
+        # Local reference: stop_pipelined_capture() may clear the attribute concurrently
+        grabber = self.frame_grabber
+        if grabber is not None and grabber.is_running:
+            packet = grabber.get_frame(timeout=FRAME_WAIT_TIMEOUT)
+            if packet is None:
+                return None
+            self.last_frame_id = packet.frame_id
+            return packet.frame
+        return self.camera.capture()
 
-        # Timer 1: Camera capture
-        capture_start = time.time()
-        self.image = self.camera.capture()
-        capture_time = time.time() - capture_start
+    def run(self):
+        with self.metrics.stage(STAGE_CAPTURE):
+            self.image = self._capture_frame()
 
         # Handle frame skipping
         if self.current_skip_frames < self.camera_settings.get_skip_frames():
@@ -206,79 +249,47 @@ class VisionSystem:
 
         self.state_manager.update_state(ServiceState.IDLE)
 
-        # Timer 2: Image copy
-        copy_start = time.time()
         self.rawImage = self.image.copy()
-        copy_time = time.time() - copy_start
 
-        # Timer 3: Brightness adjustment
-        brightness_time = 0
         if self.camera_settings.get_brightness_auto():
-            brightness_start = time.time()
-            self.brightnessManager.adjust_brightness()
-            brightness_time = time.time() - brightness_start
+            with self.metrics.stage(STAGE_BRIGHTNESS):
+                self.brightnessManager.adjust_brightness()
 
         if self.rawMode:
-            total_time = time.time() - start_time
-            # print(
-            # f"[VisionSystem Timing] Total: {total_time * 1000:.2f}ms | Capture: {capture_time * 1000:.2f}ms | Copy: {copy_time * 1000:.2f}ms | Brightness: {brightness_time * 1000:.2f}ms")
+            self.metrics.frame_done()
             return None, self.rawImage, None
 
-        # Timer 4: Processing path
-        processing_start = time.time()
         if self.camera_settings.get_contour_detection():
             result = handle_contour_detection(self)
-            processing_time = time.time() - processing_start
-            total_time = time.time() - start_time
-
-            # Memory usage monitoring
-            process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            cpu_percent = process.cpu_percent()
-
-            # print(
-            #     f"[VisionSystem Timing] Total: {total_time * 1000:.2f}ms | Capture: {capture_time * 1000:.2f}ms | Copy: {copy_time * 1000:.2f}ms | Brightness: {brightness_time * 1000:.2f}ms | Contour Detection: {processing_time * 1000:.2f}ms | Memory: {memory_mb:.1f}MB | CPU: {cpu_percent:.1f}%")
+            self.metrics.frame_done()
             return result
 
-        self.correctedImage = self.correctImage(self.image)
-        processing_time = time.time() - processing_start
-        total_time = time.time() - start_time
-        # print(
-        #     f"[VisionSystem Timing] Total: {total_time * 1000:.2f}ms | Capture: {capture_time * 1000:.2f}ms | Copy: {copy_time * 1000:.2f}ms | Brightness: {brightness_time * 1000:.2f}ms | Correct Image: {processing_time * 1000:.2f}ms")
+        with self.metrics.stage(STAGE_CORRECTION):
+            self.correctedImage = self.correctImage(self.image)
+        self.metrics.frame_done()
         return None, self.correctedImage, None
 
+    def get_pipeline_metrics(self):
+        """Achieved FPS, p50/p95/p99 timings (ms) of each pipeline stage and brightness controller stats."""
+        snapshot = self.metrics.snapshot()
+        snapshot["brightness"] = self.brightnessManager.get_stats()
+        return snapshot
+
+    def dump_pipeline_metrics(self, file_path):
+        """Write the current pipeline metrics snapshot to a JSON file."""
+        return self.metrics.dump(file_path)
+
     def correctImage(self, imageParam):
         """
         Undistorts and applies perspective correction to the given image.
+        Both transformations are applied in a single cv2.remap using tables precomputed
+        by the DataManager from the current calibration data.
         """
-        # First, undistort the image using camera calibration parameters
-        if self.optimal_camera_matrix is None:
-            self.optimal_camera_matrix, self.roi = cv2.getOptimalNewCameraMatrix(self.cameraMatrix, self.cameraDist,
-                                                                                 (self.camera_settings.get_camera_width(),
-                                                                                  self.camera_settings.get_camera_height(),),
-                                                                                 0.5,
-                                                                                 (self.camera_settings.get_camera_width(),
-                                                                                  self.camera_settings.get_camera_height(),))
-        imageParam = ImageProcessing.undistortImage(
-            imageParam,
-            self.cameraMatrix,
-            self.cameraDist,
-            self.camera_settings.get_camera_width(),
-            self.camera_settings.get_camera_height(),
-            crop=False,
-            optimal_camera_matrix=self.optimal_camera_matrix,
-            roi=self.roi
-        )
-
-        # Apply perspective transformation if available (only for single-image calibrations with ArUco markers)
-        if self.perspectiveMatrix is not None:
-            imageParam = cv2.warpPerspective(
-                imageParam,
-                self.perspectiveMatrix,
-                (self.camera_settings.get_camera_width(), self.camera_settings.get_camera_height())
-            )
-
-        return imageParam
+        correction_maps = self.data_manager.getCorrectionMaps(self.camera_settings.get_camera_width(),
+                                                              self.camera_settings.get_camera_height())
+        self.optimal_camera_matrix = correction_maps.optimal_camera_matrix
+        self.roi = correction_maps.roi
+        return correction_maps.apply(imageParam)
 
     def on_threshold_update(self, message):
         # message format {"region": "pickup"})
@@ -1,10 +1,30 @@
+import time
+
+import cv2
 import numpy as np
 
 from libs.plvision.PLVision.PID.BrightnessController import BrightnessController
 
+BRIGHTNESS_CONTROL_RATE_HZ = 5.0  # maximum number of controller updates per second
+BRIGHTNESS_DRIFT_THRESHOLD = 2.0  # brightness change (0-255) that triggers a new update once converged
+BRIGHTNESS_SAMPLE_STEP = 4  # measure every n-th pixel in x and y inside the brightness area
+DEFAULT_BRIGHTNESS_AREA = ((940, 612), (1004, 614), (1004, 662), (940, 660))
+
 
 class BrightnessManager:
-    def __init__(self, vision_system):
+    """
+    Keeps the brightness of the brightness area close to the target brightness.
+
+    The cumulative adjustment is applied to every frame, but the controller itself only
+    runs at up to `control_rate_hz`, and once the area brightness has converged only when
+    the measured brightness of the raw frame drifts more than `drift_threshold` from the
+    value seen at the last update. Brightness is measured on a downsampled crop of the
+    brightness area.
+    """
+
+    def __init__(self, vision_system, control_rate_hz=BRIGHTNESS_CONTROL_RATE_HZ,
+                 drift_threshold=BRIGHTNESS_DRIFT_THRESHOLD, sample_step=BRIGHTNESS_SAMPLE_STEP,
+                 clock=time.perf_counter):
         self.brightnessAdjustment = 0
         self.adjustment = None
         self.vision_system = vision_system
@@ -15,6 +35,23 @@ class BrightnessManager:
             setPoint=self.vision_system.camera_settings.get_target_brightness()
         )
 
+        self.control_interval = 1.0 / control_rate_hz if control_rate_hz > 0 else 0.0
+        self.drift_threshold = drift_threshold
+        self.sample_step = max(int(sample_step), 1)
+        self._clock = clock
+
+        self._sample_area = None  # (key, (x, y, w, h), mask) for the current brightness area
+        self._last_update = None
+        self._reference_brightness = None  # raw frame brightness at the last update
+        self._reference_target = None
+        self._converged = False
+
+        self.frames = 0
+        self.updates = 0
+        self.total_update_time = 0.0
+        self.max_update_time = 0.0
+        self.last_brightness = None
+
     def auto_brightness_control_off(self):
         self.vision_system.camera_settings.set_brightness_auto(False)
 
@@ -42,31 +79,80 @@ class BrightnessManager:
             raise ValueError(
                 f"Invalid threshold_by_area: {self.vision_system.threshold_by_area} Valid options are 'pickup' or 'spray'.")
 
-    def adjust_brightness(self):
-        # Get area points from camera settings, with fallback to hardcoded values
+    def get_area_points(self):
+        """Brightness area corners from the camera settings, with fallback to hardcoded values"""
         try:
             area_points = self.vision_system.camera_settings.get_brightness_area_points()
             if area_points and len(area_points) == 4:
-                # Convert from [x, y] list format to tuple format
-                area_p1 = tuple(area_points[0])
-                area_p2 = tuple(area_points[1])
-                area_p3 = tuple(area_points[2])
-                area_p4 = tuple(area_points[3])
-            else:
-                # Fallback to hardcoded values if settings not available
-                area_p1, area_p2, area_p3, area_p4 = (940, 612), (1004, 614), (1004, 662), (940, 660)
+                return tuple(tuple(point) for point in area_points)
         except Exception as e:
-            # Fallback to hardcoded values on any error
-            area_p1, area_p2, area_p3, area_p4 = (940, 612), (1004, 614), (1004, 662), (940, 660)
             print(f"Error loading brightness area from settings, using fallback: {e}")
+        return DEFAULT_BRIGHTNESS_AREA
+
+    def measure_brightness(self, frame, adjustment=0):
+        """
+        Mean gray level inside the brightness area of `frame` after applying `adjustment`,
+        measured on every `sample_step`-th pixel.
+        """
+        (x, y, w, h), mask = self._get_sample_area(frame.shape)
+        sample = frame[y:y + h:self.sample_step, x:x + w:self.sample_step]
+        if adjustment != 0:
+            sample = self.brightnessController.adjustBrightness(sample, adjustment)
+        gray = cv2.cvtColor(sample, cv2.COLOR_BGR2GRAY)
+        return cv2.mean(gray, mask=mask)[0]
+
+    def _get_sample_area(self, frame_shape):
+        """Bounding rectangle of the brightness area and its polygon mask on the sampling grid"""
+        area_points = self.get_area_points()
+        key = (area_points, frame_shape[:2], self.sample_step)
+        if self._sample_area is not None and self._sample_area[0] == key:
+            return self._sample_area[1], self._sample_area[2]
+
+        height, width = frame_shape[:2]
+        area = np.array(area_points, dtype=np.float32)
+        x0 = min(max(int(np.floor(area[:, 0].min())), 0), width - 1)
+        y0 = min(max(int(np.floor(area[:, 1].min())), 0), height - 1)
+        x1 = max(min(int(np.ceil(area[:, 0].max())) + 1, width), x0 + 1)
+        y1 = max(min(int(np.ceil(area[:, 1].max())) + 1, height), y0 + 1)
+
+        step = self.sample_step
+        mask = np.zeros((-(-(y1 - y0) // step), -(-(x1 - x0) // step)), dtype=np.uint8)
+        local = np.round((area - (x0, y0)) / step * 16).astype(np.int32).reshape((-1, 1, 2))
+        cv2.fillPoly(mask, [local], 255, shift=4)
+        if not mask.any():
+            # Area is outside the frame or too thin to hit a sample, use the whole crop
+            mask[:] = 255
+
+        rect = (x0, y0, x1 - x0, y1 - y0)
+        self._sample_area = (key, rect, mask)
+        return rect, mask
 
-        area = np.array([area_p1, area_p2, area_p3, area_p4], dtype=np.float32)
+    def adjust_brightness(self):
+        frame = self.vision_system.image
+        self.frames += 1
 
-        # Apply current cumulative adjustment first
-        adjusted_frame = self.brightnessController.adjustBrightness(self.vision_system.image, self.brightnessAdjustment)
+        now = self._clock()
+        raw_brightness = self.measure_brightness(frame)
+        if self._should_update(raw_brightness, now):
+            self._update_adjustment(frame, raw_brightness, now)
 
-        # Measure brightness of the adjusted frame (feedback loop)
-        current_brightness = self.brightnessController.calculateBrightness(adjusted_frame, area)
+        if self.brightnessAdjustment != 0:
+            self.vision_system.image = self.brightnessController.adjustBrightness(frame, self.brightnessAdjustment)
+
+    def _should_update(self, raw_brightness, now):
+        if self._last_update is None or self._reference_target != self.brightnessController.target:
+            return True
+        if now - self._last_update < self.control_interval:
+            return False
+        if not self._converged:
+            return True
+        return abs(raw_brightness - self._reference_brightness) > self.drift_threshold
+
+    def _update_adjustment(self, frame, raw_brightness, now):
+        start = self._clock()
+
+        # Measure brightness with the current cumulative adjustment applied (feedback loop)
+        current_brightness = self.measure_brightness(frame, self.brightnessAdjustment)
 
         # Calculate the error based on what we actually achieved
         error = self.brightnessController.target - current_brightness
@@ -83,21 +169,35 @@ class BrightnessManager:
             # Small errors - use 100% to eliminate steady-state error
             correction = error
 
-        # Update cumulative adjustment
-        self.brightnessAdjustment += correction
-
-        # Clamp total adjustment to valid range
-        self.brightnessAdjustment = np.clip(self.brightnessAdjustment, -255, 255)
-
-        # Apply the updated cumulative adjustment
-        final_frame = self.brightnessController.adjustBrightness(self.vision_system.image, self.brightnessAdjustment)
-
-        # Measure final result for logging
-        final_brightness = self.brightnessController.calculateBrightness(final_frame, area)
+        # Update cumulative adjustment, clamped to valid range
+        self.brightnessAdjustment = float(np.clip(self.brightnessAdjustment + correction, -255, 255))
 
-        # Log when error is significant
+        # Measure the result to decide whether the area has converged
+        final_brightness = self.measure_brightness(frame, self.brightnessAdjustment)
         final_error = abs(self.brightnessController.target - final_brightness)
         # if final_error > 2:  # Lower threshold to see convergence
         #     print(f"[BrightnessManager] Current: {current_brightness:.1f}, Error: {error:.1f}, Correction: {correction:.2f}, Total Adj: {self.brightnessAdjustment:.1f}, Final: {final_brightness:.1f}")
 
-        self.vision_system.image = final_frame
+        self._converged = final_error <= self.drift_threshold
+        self._reference_brightness = raw_brightness
+        self._reference_target = self.brightnessController.target
+        self._last_update = now
+        self.last_brightness = final_brightness
+
+        elapsed = self._clock() - start
+        self.updates += 1
+        self.total_update_time += elapsed
+        self.max_update_time = max(self.max_update_time, elapsed)
+
+    def get_stats(self):
+        """How often the controller ran and how long its updates took"""
+        return {
+            "frames": self.frames,
+            "updates": self.updates,
+            "update_ratio": self.updates / self.frames if self.frames else 0.0,
+            "mean_update_ms": self.total_update_time / self.updates * 1000.0 if self.updates else 0.0,
+            "max_update_ms": self.max_update_time * 1000.0,
+            "brightness": self.last_brightness,
+            "adjustment": self.brightnessAdjustment,
+            "converged": self._converged,
+        }
@@ -0,0 +1,130 @@
+import math
+from typing import List, Sequence
+
+import numpy as np
+
+
+class _PointGrid:
+    """
+    Uniform grid over a fixed point set for repeated nearest-neighbour queries with removal.
+
+    Each query scans the cells ring by ring around the query point and stops as soon
+    as no unscanned cell can hold a closer point, so a query only looks at a few cells
+    instead of every remaining point.
+    """
+
+    def __init__(self, points: np.ndarray):
+        self.points = points
+        self.origin = points.min(axis=0)
+        extent = points.max(axis=0) - self.origin
+        # About one point per cell
+        self.cell_size = max(math.sqrt(max(extent[0], 1.0) * max(extent[1], 1.0) / len(points)), 1.0)
+        self.shape = (int(extent[0] // self.cell_size) + 1, int(extent[1] // self.cell_size) + 1)
+
+        self.cells = {}
+        for index, cell in enumerate(self._cell_of(points)):
+            self.cells.setdefault(tuple(cell), []).append(index)
+
+    def _cell_of(self, points):
+        return np.floor((np.asarray(points, dtype=np.float64) - self.origin) / self.cell_size).astype(np.int64)
+
+    def remove(self, index: int):
+        cell = tuple(self._cell_of(self.points[index:index + 1])[0])
+        self.cells[cell].remove(index)
+
+    def nearest(self, point) -> int:
+        """Index of the remaining point closest to `point`, lowest index on ties, -1 if none remain."""
+        qx, qy = self._cell_of(np.asarray(point, dtype=np.float64).reshape(1, 2))[0]
+        nx, ny = self.shape
+        max_ring = max(abs(qx), abs(qx - (nx - 1)), abs(qy), abs(qy - (ny - 1)))
+
+        best_index, best_dist = -1, math.inf
+        px, py = float(point[0]), float(point[1])
+        for ring in range(max_ring + 1):
+            for cell in self._ring_cells(qx, qy, ring):
+                for index in self.cells.get(cell, ()):
+                    dx = self.points[index, 0] - px
+                    dy = self.points[index, 1] - py
+                    dist = dx * dx + dy * dy
+                    if dist < best_dist or (dist == best_dist and index < best_index):
+                        best_index, best_dist = index, dist
+            # Cells in the next rings are at least `ring` cells away from the query
+            if best_index >= 0 and math.sqrt(best_dist) < ring * self.cell_size:
+                break
+        return best_index
+
+    def _ring_cells(self, qx, qy, ring):
+        nx, ny = self.shape
+        for x in range(max(qx - ring, 0), min(qx + ring, nx - 1) + 1):
+            if abs(x - qx) == ring:
+                for y in range(max(qy - ring, 0), min(qy + ring, ny - 1) + 1):
+                    yield x, y
+            else:
+                for y in (qy - ring, qy + ring):
+                    if 0 <= y < ny:
+                        yield x, y
+
+
+def order_by_proximity(points: Sequence, start_point) -> List[int]:
+    """
+    Greedy nearest-neighbour order of `points`, starting from `start_point`.
+    Returns the point indices in visiting order.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return []
+
+    grid = _PointGrid(points)
+    order = []
+    current = np.asarray(start_point, dtype=np.float64)
+    for _ in range(len(points)):
+        index = grid.nearest(current)
+        grid.remove(index)
+        order.append(index)
+        current = points[index]
+    return order
+
+
+def improve_order_two_opt(points: Sequence, order: Sequence[int], start_point, max_passes: int = 20) -> List[int]:
+    """
+    Shortens an open path that starts at `start_point` by reversing segments (2-opt)
+    until no reversal helps or `max_passes` passes were made.
+    """
+    order = list(order)
+    if len(order) < 3:
+        return order
+
+    path = np.vstack([np.asarray(start_point, dtype=np.float64).reshape(1, 2),
+                      np.asarray(points, dtype=np.float64).reshape(-1, 2)[order]])
+    n = len(path)
+
+    for _ in range(max_passes):
+        improved = False
+        for i in range(n - 2):
+            a, b = path[i], path[i + 1]
+            c = path[i + 2:]                       # candidate segment ends j = i+2 .. n-1
+            d = np.vstack([path[i + 3:], [np.nan, np.nan]])
+            ab = np.hypot(*(a - b))
+            ac = np.hypot(c[:, 0] - a[0], c[:, 1] - a[1])
+            bd = np.hypot(d[:, 0] - b[0], d[:, 1] - b[1])
+            cd = np.hypot(d[:, 0] - c[:, 0], d[:, 1] - c[:, 1])
+            # The last point has no successor, so reversing up to it only swaps one edge
+            delta = ac - ab + np.nan_to_num(bd - cd)
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-9:
+                j += i + 2
+                path[i + 1:j + 1] = path[i + 1:j + 1][::-1].copy()
+                order[i:j] = order[i:j][::-1]
+                improved = True
+        if not improved:
+            break
+    return order
+
+
+def path_length(points: Sequence, order: Sequence[int], start_point) -> float:
+    """Total distance travelled from `start_point` through `points` in `order`."""
+    if len(order) == 0:
+        return 0.0
+    path = np.vstack([np.asarray(start_point, dtype=np.float64).reshape(1, 2),
+                      np.asarray(points, dtype=np.float64).reshape(-1, 2)[list(order)]])
+    return float(np.hypot(*np.diff(path, axis=0).T).sum())
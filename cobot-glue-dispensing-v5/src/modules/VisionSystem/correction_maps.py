@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Free scaling parameter passed to cv2.getOptimalNewCameraMatrix, kept identical
+# to the value previously used by VisionSystem.correctImage
+OPTIMAL_CAMERA_MATRIX_ALPHA = 0.5
+
+
+@dataclass
+class CorrectionMaps:
+    """
+    Precomputed cv2.remap tables that undistort an image and apply the work-area
+    perspective transformation in a single pass.
+    """
+    map1: np.ndarray
+    map2: np.ndarray
+    size: Tuple[int, int]
+    optimal_camera_matrix: np.ndarray
+    roi: tuple
+
+    def apply(self, image):
+        """Undistort and perspective-correct ``image``, returns a new image."""
+        return cv2.remap(image, self.map1, self.map2,
+                         interpolation=cv2.INTER_LINEAR,
+                         borderMode=cv2.BORDER_CONSTANT)
+
+
+def build_correction_maps(camera_matrix, dist_coeffs, perspective_matrix: Optional[np.ndarray],
+                          width: int, height: int, fixed_point: bool = True) -> CorrectionMaps:
+    """
+    Build remap tables equivalent to ``cv2.undistort`` with the optimal new camera
+    matrix followed by ``cv2.warpPerspective`` with ``perspective_matrix``.
+
+    ``cv2.initUndistortRectifyMap`` maps every destination pixel p to the source
+    through ``(newCameraMatrix @ R)^-1 @ p`` before applying the lens model. Passing
+    ``perspective_matrix @ optimal_camera_matrix`` as the new camera matrix therefore
+    inverts the perspective warp and the undistortion in one lookup.
+
+    Args:
+        camera_matrix: Intrinsic camera matrix.
+        dist_coeffs: Distortion coefficients.
+        perspective_matrix: Work-area homography, or None if no perspective correction is used.
+        width: Image width in pixels.
+        height: Image height in pixels.
+        fixed_point: Build compact CV_16SC2 maps instead of CV_32FC1 maps.
+
+    Returns:
+        CorrectionMaps: The fused remap tables.
+    """
+    if camera_matrix is None:
+        raise ValueError("camera_matrix can not be None")
+    if dist_coeffs is None:
+        raise ValueError("dist_coeffs can not be None")
+
+    size = (int(width), int(height))
+    optimal_camera_matrix, roi = cv2.getOptimalNewCameraMatrix(camera_matrix, dist_coeffs, size,
+                                                               OPTIMAL_CAMERA_MATRIX_ALPHA, size)
+
+    new_camera_matrix = np.asarray(optimal_camera_matrix, dtype=np.float64)
+    if perspective_matrix is not None:
+        new_camera_matrix = np.asarray(perspective_matrix, dtype=np.float64) @ new_camera_matrix
+
+    map_type = cv2.CV_16SC2 if fixed_point else cv2.CV_32FC1
+    map1, map2 = cv2.initUndistortRectifyMap(camera_matrix, dist_coeffs, np.eye(3),
+                                             new_camera_matrix, size, map_type)
+
+    return CorrectionMaps(map1=map1, map2=map2, size=size,
+                          optimal_camera_matrix=optimal_camera_matrix, roi=roi)
@@ -3,6 +3,8 @@ import os
 import numpy as np
 
 from modules.utils.custom_logging import log_if_enabled, LoggingLevel
+from modules.VisionSystem.correction_maps import build_correction_maps
+from modules.utils.contours import PolygonMask
 
 
 import os
@@ -27,6 +29,9 @@ class DataManager:
         self.cameraToRobotMatrix = None
         self.cameraData = None
         self.perspectiveMatrix = None
+        self.correctionMaps = None
+        self.sprayAreaRoi = None
+        self.sprayAreaMask = None
         self.isSystemCalibrated = False
         self.build_storage_paths()
 
@@ -88,6 +93,8 @@ class DataManager:
                            message=f"Pickup area points file not found in {self.work_area_points_path}- will be created when first saved",
                            broadcast_to_ui=False)
         # Load spray area points
+        self.sprayAreaRoi = None
+        self.sprayAreaMask = None
         try:
             self.sprayAreaPoints = np.load(self.spray_area_points_path)
             log_if_enabled(enabled=self.ENABLE_LOGGING,
@@ -123,6 +130,7 @@ class DataManager:
 
 
     def loadCameraCalibrationData(self):
+        self.invalidateCorrectionMaps()
         try:
             self.cameraData = np.load(self.camera_data_path)
             self.isSystemCalibrated = True
@@ -137,6 +145,7 @@ class DataManager:
 
 
     def loadPerspectiveMatrix(self):
+        self.invalidateCorrectionMaps()
         try:
             self.perspectiveMatrix = np.load(self.perspective_matrix_path)
             print(f"✅ Perspective matrix loaded from: {self.perspective_matrix_path}")
@@ -194,6 +203,8 @@ class DataManager:
                                    message=f"Saved spray area points to {self.work_area_points_path}",
                                    broadcast_to_ui=False)
                     self.sprayAreaPoints = points_array
+                    self.sprayAreaRoi = None
+                    self.sprayAreaMask = None
                     message = f"Spray area points saved successfully"
 
                 # Also save to legacy path for backward compatibility if this is the first area saved
@@ -231,6 +242,71 @@ class DataManager:
                            broadcast_to_ui=False)
             return False, f"Error saving work area points: {str(e)}"
 
+    def invalidateCorrectionMaps(self):
+        """Drop the cached remap tables so they are rebuilt from the current calibration data."""
+        self.correctionMaps = None
+
+    def getCorrectionMaps(self, width, height):
+        """
+        Returns the fused undistort + perspective remap tables for the given image size.
+        The tables are built on first use after calibration data is loaded and reused until
+        the calibration data is reloaded or the image size changes.
+        """
+        # Read once: invalidateCorrectionMaps() may reset the attribute from another thread
+        maps = self.correctionMaps
+        if maps is not None and maps.size == (int(width), int(height)):
+            return maps
+
+        maps = build_correction_maps(self.get_camera_matrix(),
+                                     self.get_distortion_coefficients(),
+                                     self.perspectiveMatrix,
+                                     width,
+                                     height)
+        self.correctionMaps = maps
+        log_if_enabled(enabled=self.ENABLE_LOGGING,
+                       logger=self.logger,
+                       level=LoggingLevel.INFO,
+                       message=f"Correction maps built for {int(width)}x{int(height)} "
+                               f"(perspective correction: {self.perspectiveMatrix is not None})",
+                       broadcast_to_ui=False)
+        return maps
+
+    def getSprayAreaRoi(self, width, height, margin=0):
+        """
+        Returns the bounding rectangle (x, y, w, h) of the spray area polygon, grown by
+        `margin` pixels on every side and clipped to a width x height image.
+        Returns None when no spray area is defined or the rectangle lies outside the image.
+        The rectangle is cached until the spray area points are reloaded or saved.
+        """
+        if self.sprayAreaPoints is None or len(self.sprayAreaPoints) == 0:
+            return None
+
+        key = (int(width), int(height), int(margin))
+        if self.sprayAreaRoi is not None and self.sprayAreaRoi[0] == key:
+            return self.sprayAreaRoi[1]
+
+        points = np.asarray(self.sprayAreaPoints, dtype=np.float32).reshape(-1, 2)
+        x0 = max(int(np.floor(points[:, 0].min())) - key[2], 0)
+        y0 = max(int(np.floor(points[:, 1].min())) - key[2], 0)
+        x1 = min(int(np.ceil(points[:, 0].max())) + key[2] + 1, key[0])
+        y1 = min(int(np.ceil(points[:, 1].max())) + key[2] + 1, key[1])
+
+        roi = (x0, y0, x1 - x0, y1 - y0) if x1 > x0 and y1 > y0 else None
+        self.sprayAreaRoi = (key, roi)
+        return roi
+
+    def getSprayAreaMask(self):
+        """
+        Returns the rasterized spray area used for contour containment checks, or None
+        when no spray area is defined. Built once and reused until the spray area points
+        are reloaded or saved.
+        """
+        if self.sprayAreaPoints is None or len(self.sprayAreaPoints) < 3:
+            return None
+        if self.sprayAreaMask is None:
+            self.sprayAreaMask = PolygonMask(self.sprayAreaPoints)
+        return self.sprayAreaMask
+
     def get_camera_matrix(self):
         return self.cameraData['mtx'] if self.cameraData is not None else None
 
@@ -0,0 +1,118 @@
+import threading
+import time
+from typing import Optional
+
+from modules.VisionSystem.frame_ring_buffer import FramePacket
+
+
+class FrameGrabber:
+    """
+    Dedicated capture thread that keeps pulling frames from a camera.
+
+    Captured frames are handed over through a single slot that always holds the
+    newest frame. If the consumer has not taken the previous frame when a new one
+    arrives, the previous frame is dropped and counted as stale. Capture and
+    processing therefore overlap, and processing never works on an old frame.
+
+    Frame IDs increase monotonically from 1, so consumers can tell how many frames
+    were skipped between two packets.
+    """
+
+    def __init__(self, camera, retry_delay: float = 0.01):
+        """
+        Args:
+            camera: Object with a ``capture()`` method returning a frame or None, or a callable
+                returning the current such object. With a callable the capture thread follows
+                camera replacements (e.g. after a resolution change) without a restart.
+            retry_delay: Seconds to wait after a failed capture before retrying.
+        """
+        self._camera_source = camera if not hasattr(camera, "capture") else (lambda: camera)
+        self.retry_delay = retry_delay
+
+        self._condition = threading.Condition(threading.Lock())
+        self._pending: Optional[FramePacket] = None
+        self._last_id = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.capture_failures = 0
+
+    @property
+    def camera(self):
+        """The camera the next frame is captured from."""
+        return self._camera_source()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Start the capture thread. Does nothing if it is already running."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="FrameGrabber", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the capture thread and wake up a waiting consumer."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def get_frame(self, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        """
+        Take the newest frame that was not delivered yet.
+
+        Args:
+            timeout: Maximum time to wait in seconds, None waits forever.
+
+        Returns:
+            FramePacket or None: The newest frame, or None on timeout or after stop().
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._pending is not None or not self._running,
+                                            timeout=timeout):
+                return None
+            packet, self._pending = self._pending, None
+            if packet is not None:
+                self.frames_delivered += 1
+            return packet
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                "captured": self.frames_captured,
+                "delivered": self.frames_delivered,
+                "dropped": self.frames_dropped,
+                "capture_failures": self.capture_failures,
+            }
+
+    def _capture_loop(self):
+        while self._running:
+            try:
+                frame = self.camera.capture()
+            except Exception as e:
+                print(f"[FrameGrabber] Capture error: {e}")
+                frame = None
+
+            if frame is None:
+                with self._condition:
+                    self.capture_failures += 1
+                time.sleep(self.retry_delay)
+                continue
+
+            timestamp = time.time()
+            with self._condition:
+                self._last_id += 1
+                if self._pending is not None:
+                    self.frames_dropped += 1
+                self._pending = FramePacket(frame_id=self._last_id, timestamp=timestamp, frame=frame)
+                self.frames_captured += 1
+                self._condition.notify_all()
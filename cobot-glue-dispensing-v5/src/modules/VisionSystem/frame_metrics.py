@@ -0,0 +1,156 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+# Pipeline stages timed by the vision system
+STAGE_CAPTURE = "capture"
+STAGE_BRIGHTNESS = "brightness"
+STAGE_CORRECTION = "undistort_warp"
+STAGE_THRESHOLD = "threshold"
+STAGE_FIND_CONTOURS = "find_contours"
+STAGE_FILTER = "approx_filter"
+STAGE_PUBLISH_THRESH = "publish_thresh"  # threshold preview image
+STAGE_PUBLISH_CONTOURS = "publish_contours"  # corrected image with the detected contours
+STAGE_PUBLISH_FRAME = "publish_frame"  # latest frame and FPS from the vision service
+
+PIPELINE_STAGES = (
+    STAGE_CAPTURE,
+    STAGE_BRIGHTNESS,
+    STAGE_CORRECTION,
+    STAGE_THRESHOLD,
+    STAGE_FIND_CONTOURS,
+    STAGE_FILTER,
+    STAGE_PUBLISH_THRESH,
+    STAGE_PUBLISH_CONTOURS,
+    STAGE_PUBLISH_FRAME,
+)
+
+
+class RollingHistogram:
+    """
+    Keeps the last `window_size` samples and reports percentiles over them.
+
+    Recording is an append to a bounded deque; percentiles are only computed when
+    a summary is requested, so the per-frame cost stays constant.
+    """
+
+    def __init__(self, window_size: int = 300):
+        self._samples = deque(maxlen=window_size)
+        self.total_count = 0
+
+    def add(self, value: float):
+        self._samples.append(value)
+        self.total_count += 1
+
+    def summary(self) -> Dict[str, float]:
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "count": len(samples),
+            "mean": sum(samples) / len(samples),
+            "p50": self._percentile(samples, 50),
+            "p95": self._percentile(samples, 95),
+            "p99": self._percentile(samples, 99),
+            "max": samples[-1],
+        }
+
+    @staticmethod
+    def _percentile(sorted_samples, percent):
+        """Nearest-rank percentile of an already sorted list"""
+        rank = max(1, -(-len(sorted_samples) * percent // 100))  # ceil without float rounding issues
+        return sorted_samples[int(rank) - 1]
+
+
+class FrameMetrics:
+    """
+    Per-stage timing and achieved-FPS counter for the vision pipeline.
+
+    Stage durations are stored in milliseconds in one RollingHistogram per stage.
+    Every `publish_interval` seconds `frame_done()` passes a snapshot to the
+    `publish` callback. `dump(path)` writes the current snapshot as JSON.
+    """
+
+    def __init__(self, publish: Optional[Callable[[dict], None]] = None, publish_interval: float = 2.0,
+                 window_size: int = 300, clock: Callable[[], float] = time.perf_counter):
+        self.publish = publish
+        self.publish_interval = publish_interval
+        self.window_size = window_size
+        self.enabled = True
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stages: Dict[str, RollingHistogram] = {}
+
+        self.frames = 0
+        self._window_start = clock()
+        self._window_frames = 0
+        self.fps = 0.0
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one sample of stage `name`"""
+        if not self.enabled:
+            yield
+            return
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, self._clock() - start)
+
+    def record(self, name: str, seconds: float):
+        """Add one duration sample (in seconds) to a stage"""
+        with self._lock:
+            histogram = self._stages.get(name)
+            if histogram is None:
+                histogram = self._stages[name] = RollingHistogram(self.window_size)
+            histogram.add(seconds * 1000.0)
+
+    def frame_done(self):
+        """Count a processed frame; updates FPS and publishes a snapshot once per interval"""
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            self.frames += 1
+            self._window_frames += 1
+            elapsed = now - self._window_start
+            if elapsed < self.publish_interval:
+                return
+            self.fps = self._window_frames / elapsed if elapsed > 0 else 0.0
+            self._window_start = now
+            self._window_frames = 0
+        if self.publish is not None:
+            try:
+                self.publish(self.snapshot())
+            except Exception as e:
+                print(f"[FrameMetrics] Failed to publish metrics: {e}")
+
+    def snapshot(self) -> dict:
+        """FPS, frame count and p50/p95/p99 (ms) per stage"""
+        with self._lock:
+            stages = {name: histogram.summary() for name, histogram in self._stages.items()}
+            return {
+                "timestamp": time.time(),
+                "fps": self.fps,
+                "frames": self.frames,
+                "stages_ms": stages,
+            }
+
+    def dump(self, file_path: str) -> dict:
+        """Write the current snapshot to a JSON file and return it"""
+        snapshot = self.snapshot()
+        with open(file_path, "w") as f:
+            json.dump(snapshot, f, indent=4)
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self.frames = 0
+            self._window_start = self._clock()
+            self._window_frames = 0
+            self.fps = 0.0
@@ -0,0 +1,111 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FramePacket:
+    """A frame stored in the ring buffer together with its identity."""
+    frame_id: int
+    timestamp: float
+    frame: np.ndarray
+
+
+class FrameRingBuffer:
+    """
+    Fixed-capacity ring buffer of camera frames.
+
+    Every pushed frame is stamped with a monotonically increasing frame ID
+    (starting at 1) and a capture timestamp. The slots are allocated once and
+    frames are stored by reference, so pushing never copies pixel data. The
+    producer must therefore hand over ownership of the array it pushes and
+    not modify it afterwards.
+
+    Consumers remember the ID of the last frame they processed and ask for a
+    newer one via ``wait_for_frame(after_id)``, which guarantees that the same
+    frame is never delivered twice to the same consumer.
+    """
+
+    def __init__(self, capacity: int = 8):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._frames = [None] * capacity
+        self._frame_ids = np.zeros(capacity, dtype=np.int64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._latest_id = 0
+        self._condition = threading.Condition(threading.Lock())
+
+    @property
+    def latest_id(self) -> int:
+        """ID of the most recently pushed frame, 0 if nothing was pushed yet."""
+        return self._latest_id
+
+    def push(self, frame: np.ndarray, timestamp: Optional[float] = None) -> int:
+        """
+        Store a frame in the next slot and wake up all waiting consumers.
+
+        Args:
+            frame: Image to store. Ownership passes to the buffer.
+            timestamp: Capture time, defaults to ``time.time()``.
+
+        Returns:
+            int: The frame ID assigned to the frame.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        with self._condition:
+            frame_id = self._latest_id + 1
+            slot = frame_id % self.capacity
+            self._frames[slot] = frame
+            self._frame_ids[slot] = frame_id
+            self._timestamps[slot] = timestamp
+            self._latest_id = frame_id
+            self._condition.notify_all()
+        return frame_id
+
+    def get_latest(self) -> Optional[FramePacket]:
+        """Return the newest frame without blocking, or None if the buffer is empty."""
+        with self._condition:
+            return self._packet_at(self._latest_id)
+
+    def get(self, frame_id: int) -> Optional[FramePacket]:
+        """Return the frame with the given ID, or None if it was overwritten or not yet captured."""
+        with self._condition:
+            return self._packet_at(frame_id)
+
+    def wait_for_frame(self, after_id: int = 0, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        """
+        Block until a frame newer than ``after_id`` is available and return the newest one.
+
+        Args:
+            after_id: ID of the last frame the consumer has seen.
+            timeout: Maximum time to wait in seconds, None waits forever.
+
+        Returns:
+            FramePacket or None: The newest frame, or None on timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._latest_id > after_id, timeout=timeout):
+                return None
+            return self._packet_at(self._latest_id)
+
+    def clear(self):
+        """Drop all stored frames. Frame IDs keep increasing across clears."""
+        with self._condition:
+            self._frames = [None] * self.capacity
+            self._frame_ids[:] = 0
+            self._timestamps[:] = 0.0
+
+    def _packet_at(self, frame_id: int) -> Optional[FramePacket]:
+        if frame_id <= 0:
+            return None
+        slot = frame_id % self.capacity
+        if self._frame_ids[slot] != frame_id or self._frames[slot] is None:
+            return None
+        return FramePacket(frame_id=frame_id,
+                           timestamp=float(self._timestamps[slot]),
+                           frame=self._frames[slot])
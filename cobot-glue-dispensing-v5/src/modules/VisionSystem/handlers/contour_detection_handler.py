@@ -2,11 +2,83 @@ import cv2
 import numpy as np
 
 from libs.plvision.PLVision import Contouring
+from modules.VisionSystem.contour_ordering import order_by_proximity, improve_order_two_opt, path_length
+from modules.VisionSystem.frame_metrics import (
+    STAGE_CORRECTION, STAGE_THRESHOLD, STAGE_FIND_CONTOURS, STAGE_FILTER, STAGE_PUBLISH_THRESH,
+    STAGE_PUBLISH_CONTOURS
+)
+
+PROXIMITY_SORT_TWO_OPT = True  # shorten the proximity order with 2-opt when sorting contours
 
 
 def findContours(vision_system, imageParam):
     """
     Converts an image to grayscale, applies thresholding, performs dilation and erosion, and finds contours.
+
+    When `vision_system.contour_roi_enabled` is set and a spray area is defined, only the
+    bounding rectangle of the spray area (plus a margin covering blur and morphology) is
+    processed. Returned contours are always in full-frame coordinates.
+    """
+    metrics = vision_system.metrics
+    height, width = imageParam.shape[:2]
+    roi = get_detection_roi(vision_system, width, height)
+
+    with metrics.stage(STAGE_THRESHOLD):
+        if roi is None:
+            binary, thresh = threshold_image(vision_system, imageParam)
+            offset = (0, 0)
+        else:
+            x, y, w, h = roi
+            roi_binary, thresh = threshold_image(vision_system, imageParam[y:y + h, x:x + w])
+            # Keep the published threshold image at full-frame size
+            binary = np.zeros((height, width), dtype=roi_binary.dtype)
+            binary[y:y + h, x:x + w] = roi_binary
+            offset = (x, y)
+
+    with metrics.stage(STAGE_PUBLISH_THRESH):
+        vision_system.message_publisher.publish_thresh_image(binary)
+
+    # Find contours on the processed image
+    # cv2.imwrite("debug_thresh.png", thresh)
+
+    retrieval_mode = cv2.RETR_EXTERNAL if vision_system.contour_retrieval_external else cv2.RETR_TREE
+    with metrics.stage(STAGE_FIND_CONTOURS):
+        contours, hierarchy = cv2.findContours(thresh, retrieval_mode, cv2.CHAIN_APPROX_SIMPLE, offset=offset)
+    # print("Found contours:", len(contours))
+
+    return contours
+
+def get_detection_roi(vision_system, width, height):
+    """
+    Returns the (x, y, w, h) rectangle contour detection is restricted to, or None for the full frame.
+    """
+    if not vision_system.contour_roi_enabled:
+        return None
+    roi = vision_system.data_manager.getSprayAreaRoi(width, height, get_roi_margin(vision_system))
+    if roi is None or (roi[2] == width and roi[3] == height):
+        return None
+    return roi
+
+def get_roi_margin(vision_system):
+    """
+    Pixels to add around the spray area so that blur and morphology see the same
+    neighbourhood as on the full frame. A contour cut by the crop border then lies
+    outside the spray area and is rejected by the spray area check, as before.
+    """
+    settings = vision_system.camera_settings
+    margin = 2
+    if settings.get_gaussian_blur():
+        margin += settings.get_blur_kernel_size() // 2 + 1
+    if settings.get_dilate_enabled():
+        margin += (settings.get_dilate_kernel_size() // 2) * settings.get_dilate_iterations()
+    if settings.get_erode_enabled():
+        margin += (settings.get_erode_kernel_size() // 2) * settings.get_erode_iterations()
+    return margin
+
+def threshold_image(vision_system, imageParam):
+    """
+    Grayscale, optional blur, threshold, then optional dilation and erosion.
+    Returns (binary, processed): the plain threshold image and the image after morphology.
     """
     gray = cv2.cvtColor(imageParam, cv2.COLOR_BGR2GRAY)
     # print("applied gray")
@@ -37,11 +109,8 @@ def findContours(vision_system, imageParam):
 
     # print(f"Using threshold {thresh_type} for area {self.threshold_by_area}")
     # print(f"Threshold = {threshold}")
-    _, thresh = cv2.threshold(blur, threshold, 255, thresh_type)
-    unique_vals = np.unique(thresh)
-    # print("Unique pixel values in thresh:", unique_vals)
-
-    vision_system.message_publisher.publish_thresh_image(thresh)
+    _, binary = cv2.threshold(blur, threshold, 255, thresh_type)
+    thresh = binary
     # Apply dilation if enabled
     if vision_system.camera_settings.get_dilate_enabled():
         dilate_kernel_size = vision_system.camera_settings.get_dilate_kernel_size()
@@ -56,14 +125,7 @@ def findContours(vision_system, imageParam):
         kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (erode_kernel_size, erode_kernel_size))
         thresh = cv2.erode(thresh, kernel, iterations=erode_iterations)
 
-    # Find contours on the processed image
-    # cv2.imwrite("debug_thresh.png", thresh)
-
-    # contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    contours, hierarchy = cv2.findContours(thresh, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-    # print("Found contours:", len(contours))
-
-    return contours
+    return binary, thresh
 
 def approxContours(vision_system, contours):
     """
@@ -92,30 +154,25 @@ def sq_dist(p1, p2):
     return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2
 
 def all_inside_spray_area(vision_system, contour):
-    for pt in contour:
-        if cv2.pointPolygonTest(
-            vision_system.data_manager.sprayAreaPoints.astype(np.float32),
-            (float(pt[0][0]), float(pt[0][1])),
-            False
-        ) < 0:
-            return False
-    return True
-
-def sort_contours_by_proximity(contours, start_point):
-    sorted_contours = []
-    current_point = start_point
-    remaining_contours = contours.copy()
-
-    while remaining_contours:
-        # Find the contour with the closest centroid to the current point
-        next_contour = min(
-            remaining_contours,
-            key=lambda cnt: sq_dist(Contouring.calculateCentroid(cnt), current_point)
-        )
-        sorted_contours.append(next_contour)
-        current_point = Contouring.calculateCentroid(next_contour)
-        remaining_contours.remove(next_contour)
+    return vision_system.data_manager.getSprayAreaMask().contains_contour(contour)
 
+def sort_contours_by_proximity(contours, start_point, two_opt=False, return_distance=False):
+    """
+    Orders contours by a nearest-neighbour walk over their centroids, starting at start_point.
+    Centroids are computed once and the walk uses a grid index, so the cost grows roughly
+    linearly with the number of contours. With two_opt=True the order is then shortened
+    with 2-opt segment reversals.
+    Returns the sorted contours, or (sorted_contours, total_travel_distance) when
+    return_distance is True.
+    """
+    centroids = [Contouring.calculateCentroid(cnt) for cnt in contours]
+    order = order_by_proximity(centroids, start_point)
+    if two_opt:
+        order = improve_order_two_opt(centroids, order, start_point)
+
+    sorted_contours = [contours[i] for i in order]
+    if return_distance:
+        return sorted_contours, path_length(centroids, order, start_point)
     return sorted_contours
 
 def handle_contour_detection(vision_system,sort=False):
@@ -123,9 +180,12 @@ def handle_contour_detection(vision_system,sort=False):
     Detect, filter, and sort contours in the image.
     Returns (sorted_contours, corrected_image, None)
     """
+    metrics = vision_system.metrics
+
     # --- Step 1: Calibration handling ---
     if vision_system.isSystemCalibrated:
-        vision_system.correctedImage = vision_system.correctImage(vision_system.image.copy())
+        with metrics.stage(STAGE_CORRECTION):
+            vision_system.correctedImage = vision_system.correctImage(vision_system.image)
     else:
         cv2.putText(
             vision_system.image,
@@ -140,38 +200,36 @@ def handle_contour_detection(vision_system,sort=False):
 
     # --- Step 2: Find and filter contours ---
     contours = findContours(vision_system, vision_system.correctedImage)
-    approx_contours = approxContours(vision_system, contours)
-    filtered_contours = filter_contours_by_area(vision_system, approx_contours)
-
-    contours_inside_spray_area = []
-    for cnt in filtered_contours:
-
-        if vision_system.data_manager.sprayAreaPoints is None:
-            print(f"[WARNING] [handle_contour_detection] Spray area points not defined, skipping spray area check.")
-            contours_inside_spray_area.append(cnt)
-            continue
-
-        if all_inside_spray_area(vision_system, cnt) :
-            contours_inside_spray_area.append(cnt)
+    with metrics.stage(STAGE_FILTER):
+        approx_contours = approxContours(vision_system, contours)
+        filtered_contours = filter_contours_by_area(vision_system, approx_contours)
+
+        spray_area_mask = vision_system.data_manager.getSprayAreaMask()
+        if spray_area_mask is None:
+            if filtered_contours:
+                print(f"[WARNING] [handle_contour_detection] Spray area points not defined, skipping spray area check.")
+            contours_inside_spray_area = list(filtered_contours)
+        else:
+            contours_inside_spray_area = [cnt for cnt in filtered_contours if spray_area_mask.contains_contour(cnt)]
+
+        if contours_inside_spray_area and sort is True:
+            # --- Step 3: Sort contours by proximity (using helper) ---
+            top_left = (0, 0)
+            contours_inside_spray_area = sort_contours_by_proximity(
+                contours_inside_spray_area, start_point=top_left, two_opt=PROXIMITY_SORT_TWO_OPT)
 
     if not contours_inside_spray_area:
         return None, vision_system.correctedImage, None
 
-    final_contours = None
-    if sort is True:
-        # --- Step 3: Sort contours by proximity (using helper) ---
-        top_left = (0, 0)
-        contours_sorted = sort_contours_by_proximity(contours_inside_spray_area, start_point=top_left)
-        final_contours = contours_sorted
-    else:
-        final_contours = contours_inside_spray_area
+    final_contours = contours_inside_spray_area
 
     # --- Step 4: Optional visualization ---
     if vision_system.camera_settings.get_draw_contours():
         cv2.drawContours(vision_system.correctedImage, final_contours, -1, (0, 255, 0), 1)
 
     # --- Step 5: Publish latest image ---
-    vision_system.message_publisher.publish_latest_image(vision_system.correctedImage)
+    with metrics.stage(STAGE_PUBLISH_CONTOURS):
+        vision_system.message_publisher.publish_latest_image(vision_system.correctedImage)
 
     return final_contours, vision_system.correctedImage, None
 
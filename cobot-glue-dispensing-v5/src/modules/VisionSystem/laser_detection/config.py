@@ -26,6 +26,7 @@ class LaserDetectionConfig:
     image_capture_delay_ms: int = 10  # Delay between consecutive image captures (ms)
     detection_samples: int = 5  # Number of frames to median filter
     max_detection_retries: int = 5  # Maximum retry attempts for detection
+    frame_wait_timeout_ms: int = 1000  # Maximum time to wait for a new camera frame (ms)
 
     # Subpixel refinement
     use_subpixel_refinement: bool = True  # Enable subpixel peak refinement
@@ -40,6 +41,8 @@ class LaserDetectionConfig:
             raise ValueError("detection_samples must be at least 1")
         if self.max_detection_retries < 1:
             raise ValueError("max_detection_retries must be at least 1")
+        if self.frame_wait_timeout_ms <= 0:
+            raise ValueError("frame_wait_timeout_ms must be positive")
         if self.default_axis not in ('x', 'y'):
             raise ValueError("default_axis must be 'x' or 'y'")
 
@@ -49,6 +49,27 @@ class LaserDetectionService:
 
 
 
+    def _collect_frames(self, samples, image_capture_delay_ms):
+        """
+        Collect up to ``samples`` distinct frames from the vision service.
+
+        Frames are requested by frame ID, so the same frame is never sampled twice and no
+        frame captured before the call is used. Frames are not copied: np.stack in the
+        caller already produces an independent array.
+        """
+        frames = []
+        packet = self.vision_service.getLatestFramePacket()
+        last_id = packet.frame_id if packet is not None else 0
+        timeout = self.config.frame_wait_timeout_ms / 1000.0
+        for i in range(samples):
+            time.sleep(image_capture_delay_ms / 1000.0)
+            packet = self.vision_service.wait_for_frame(after_id=last_id, timeout=timeout)
+            if packet is None:
+                break
+            last_id = packet.frame_id
+            frames.append(packet.frame)
+        return frames
+
     def detect(self):
         """
         Detect laser line using median of multiple ON/OFF frames.
@@ -76,12 +97,7 @@ class LaserDetectionService:
             # ---------------------------
             self.laser.turnOff()
             time.sleep(delay_between_laser_toggle_and_capture/1000)
-            off_frames = []
-            for i in range(samples):
-                time.sleep(image_capture_delay_ms / 1000.0)
-                frame = self.vision_service.latest_frame
-                if frame is not None:
-                    off_frames.append(frame.copy())
+            off_frames = self._collect_frames(samples, image_capture_delay_ms)
 
             if len(off_frames) < samples:
                 continue
@@ -94,12 +110,7 @@ class LaserDetectionService:
             # ---------------------------
             self.laser.turnOn()
             time.sleep(delay_between_laser_toggle_and_capture / 1000)
-            on_frames = []
-            for i in range(samples):
-                time.sleep(image_capture_delay_ms / 1000.0)
-                frame = self.vision_service.latest_frame
-                if frame is not None:
-                    on_frames.append(frame.copy())
+            on_frames = self._collect_frames(samples, image_capture_delay_ms)
 
             if len(on_frames) < samples:
                 continue
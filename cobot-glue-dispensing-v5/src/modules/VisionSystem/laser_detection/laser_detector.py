@@ -32,6 +32,34 @@ class LaserDetector:
                return idx + offset
        return float(idx)
 
+    def subpixel_quadratic_peaks(self, profiles, min_intensity):
+        """
+        Vectorized subpixel_quadratic over every row of a 2D array.
+
+        Args:
+            profiles: 2D array, one intensity profile per row
+            min_intensity: Rows whose peak is not above this value are invalid
+
+        Returns:
+            np.ndarray: float32 subpixel peak position per row, NaN for invalid rows
+        """
+        rows = np.arange(profiles.shape[0])
+        n = profiles.shape[1]
+        idx = np.argmax(profiles, axis=1)
+
+        center = profiles[rows, idx].astype(np.float64)
+        left = profiles[rows, np.maximum(idx - 1, 0)].astype(np.float64)
+        right = profiles[rows, np.minimum(idx + 1, n - 1)].astype(np.float64)
+        denom = left - 2 * center + right
+
+        refine = (idx >= 1) & (idx < n - 1) & (denom != 0)
+        offset = np.zeros(len(rows), dtype=np.float64)
+        np.divide(0.5 * (left - right), denom, out=offset, where=refine)
+
+        peaks = (idx + offset).astype(np.float32)
+        peaks[~(center > min_intensity)] = np.nan
+        return peaks
+
     # -------------------------------------------------
     # Main detection
     # -------------------------------------------------
@@ -71,65 +99,36 @@ class LaserDetector:
         # Use config value for minimum intensity
         min_intensity = self.config.min_intensity
 
-        if axis == 'y':
-            mask_bool = diff > min_intensity
-            weights = diff * mask_bool
-            centroid_x = np.zeros(h, dtype=np.float32)
-
-            for i in range(h):
-                row = diff[i, :]
-                if np.max(row) > min_intensity:
-                    idx_max = np.argmax(row)
-                    # Subpixel refinement
-                    centroid_x[i] = self.subpixel_quadratic(idx_max, row)
-                else:
-                    centroid_x[i] = np.nan  # invalid row
-
-            y_coords = np.arange(h)
-            points = [(cx, float(y)) for cx, y in zip(centroid_x, y_coords) if not np.isnan(cx)]
-
+        # Each scan line is a row ('y') or a column ('x') of the difference image
+        profiles = diff if axis == 'y' else diff.T
+        peaks = self.subpixel_quadratic_peaks(profiles, min_intensity)
+        line_idx = np.flatnonzero(~np.isnan(peaks))
+        line_pos = line_idx.astype(np.float64)
+        peak_pos = peaks[line_idx]
 
+        if axis == 'y':
+            xs, ys = peak_pos, line_pos
         else:
-
-            mask_bool = diff > min_intensity
-
-            centroid_y = np.zeros(w, dtype=np.float32)
-
-            for j in range(w):
-
-                col = diff[:, j]
-
-                if np.max(col) > min_intensity:
-
-                    idx_max = np.argmax(col)
-
-                    centroid_y[j] = self.subpixel_quadratic(idx_max, col)
-
-                else:
-
-                    centroid_y[j] = np.nan
-
-            x_coords = np.arange(w)
-
-            points = [(float(x), cy) for x, cy in zip(x_coords, centroid_y) if not np.isnan(cy)]
+            xs, ys = line_pos, peak_pos
 
         # Closest point to image center
         closest_point = None
-        if points:
+        if line_idx.size:
             cx, cy = w / 2.0, h / 2.0
-            closest_point = min(points, key=lambda p: (p[0] - cx) ** 2 + (p[1] - cy) ** 2)
+            dist_sq = (xs.astype(np.float64) - cx) ** 2 + (ys.astype(np.float64) - cy) ** 2
+            nearest = int(np.argmin(dist_sq))
+            closest_point = (float(xs[nearest]), float(ys[nearest]))
 
         bright = cv2.minMaxLoc(diff)[3]
 
         # Mask for visualization
         mask = np.zeros((h, w), np.uint8)
-        for (x, y) in points:
-            mask[int(round(y)), int(round(x))] = 255
+        mask[np.rint(ys).astype(np.intp), np.rint(xs).astype(np.intp)] = 255
 
         self.lase_bright_point = bright
         self.last_closest_point = closest_point
         print(
-            f"[LaserDetector.detect_laser_line] Detected {len(points)} points, closest_point={closest_point}, bright={bright}")
+            f"[LaserDetector.detect_laser_line] Detected {line_idx.size} points, closest_point={closest_point}, bright={bright}")
         return mask, bright, closest_point
 
 
@@ -8,6 +8,7 @@ class MessagePublisher:
         self.thresh_image_topic = VisionTopics.THRESHOLD_IMAGE
         self.stateTopic = VisionTopics.SERVICE_STATE
         self.topic = VisionTopics.CALIBRATION_FEEDBACK
+        self.pipeline_metrics_topic = VisionTopics.PIPELINE_METRICS
 
     def publish_latest_image(self,image):
         self.broker.publish(self.latest_image_topic, {"image": image})
@@ -23,4 +24,7 @@ class MessagePublisher:
         self.broker.publish(self.stateTopic, state)
 
     def publish_calibration_feedback(self,feedback):
-        self.broker.publish(self.topic, feedback)
\ No newline at end of file
+        self.broker.publish(self.topic, feedback)
+
+    def publish_pipeline_metrics(self,metrics):
+        self.broker.publish(self.pipeline_metrics_topic, metrics)
\ No newline at end of file
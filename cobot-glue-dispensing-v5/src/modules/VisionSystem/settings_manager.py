@@ -49,12 +49,21 @@ class SettingsManager:
             if (CameraSettingKey.WIDTH.value in settings or
                     CameraSettingKey.HEIGHT.value in settings or
                     CameraSettingKey.INDEX.value in settings):
-                # Reinitialize camera with new settings
+                # Reinitialize camera with new settings. The capture thread is stopped and the
+                # old device released first, so the new Camera can open the same index.
+                pipelined = getattr(vision_system, "frame_grabber", None) is not None
+                if pipelined:
+                    vision_system.stop_pipelined_capture()
+                old_camera = vision_system.camera
+                if hasattr(old_camera, "close"):
+                    old_camera.close()
                 vision_system.camera = Camera(
                     vision_system.camera_settings.get_camera_index(),
                     vision_system.camera_settings.get_camera_width(),
                     vision_system.camera_settings.get_camera_height()
                 )
+                if pipelined:
+                    vision_system.start_pipelined_capture()
 
             log_if_enabled(enabled=logging_enabled,
                            logger=logger,
@@ -1,20 +1,27 @@
-import copy
+import os
 from pathlib import Path
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import numpy as np
 
+from modules.contour_matching.matching.comparison_model_cache import ComparisonModelCache
 from modules.contour_matching.matching.match_info import MatchInfo
 from modules.contour_matching.matching.strategies.geometric_matching_strategy import \
     GeometricMatchingStrategy
 from modules.contour_matching.matching.strategies.matching_strategy_interface import MatchingStrategy
 from modules.contour_matching.matching.strategies.ml_matching_strategy import MLMatchingStrategy
-from modules.contour_matching.matching_config import DEBUG_ALIGN_CONTOURS, USE_COMPARISON_MODEL
+from modules.contour_matching.matching_config import DEBUG_ALIGN_CONTOURS, DEBUG_SIMILARITY, USE_COMPARISON_MODEL
+from modules.contour_matching.parallel_executor import MatchingExecutor, EXECUTOR_THREAD
 from modules.shape_matching_training.utils.io_utils import load_latest_model
 
 from modules.shared.core.ContourStandartized import Contour
 from modules.contour_matching.alignment.contour_aligner import _alignContours
 
+# Worker pool used to match and align detected contours concurrently.
+# "thread" (default), "process" or "serial"
+MATCHING_EXECUTOR_KIND = EXECUTOR_THREAD
+MATCHING_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def get_contour_objects(entries):
     """Convert entry contour data to Contour objects."""
@@ -22,14 +29,12 @@ def get_contour_objects(entries):
     for entry in entries:
         contour_data = entry.get("contour")
         if contour_data is not None:
-            objects.append(Contour(contour_data))
+            objects.append(Contour(np.array(contour_data, dtype=np.float32)))
     return objects
 
 
-def load_model_with_fallback() -> Any:
-    """
-    Load the most recent trained ML model with a safe fallback mechanism.
-    """
+def _get_model_dir() -> Path:
+    """Resolve the directory holding the saved comparison models."""
     model_dir = (
         Path(__file__).resolve().parent.parent
         / "shape_matching_training"
@@ -40,7 +45,58 @@ def load_model_with_fallback() -> Any:
         print(f"⚠️ Model directory not found at {model_dir}. Trying fallback path.")
         model_dir = Path.cwd() / "src" / "modules" / "shape_matching_training" / "saved_models"
 
-    return load_latest_model(save_dir=str(model_dir))
+    return model_dir
+
+
+def load_model_with_fallback() -> Any:
+    """
+    Load the most recent trained ML model with a safe fallback mechanism.
+    """
+    return load_latest_model(save_dir=str(_get_model_dir()))
+
+
+_comparison_model_cache = None
+
+
+def get_comparison_model_cache() -> ComparisonModelCache:
+    """Get the process-wide cache holding the comparison model."""
+    global _comparison_model_cache
+    if _comparison_model_cache is None:
+        _comparison_model_cache = ComparisonModelCache(_get_model_dir())
+    return _comparison_model_cache
+
+
+def preload_comparison_model() -> bool:
+    """
+    Load the comparison model ahead of the first matching cycle when the model is enabled.
+
+    Returns:
+        bool: True if the model is loaded, False if it is disabled or could not be loaded.
+    """
+    if not USE_COMPARISON_MODEL:
+        return False
+    try:
+        get_comparison_model_cache().preload()
+        return True
+    except Exception as e:
+        print(f"⚠️ Could not preload comparison model: {e}")
+        return False
+
+
+def get_comparison_model_metrics() -> dict:
+    """Load time, version and reload count of the cached comparison model."""
+    return get_comparison_model_cache().get_metrics()
+
+_matching_executor = None
+
+
+def get_matching_executor() -> MatchingExecutor:
+    """Get the process-wide worker pool for matching and alignment, created on first use."""
+    global _matching_executor
+    if _matching_executor is None:
+        _matching_executor = MatchingExecutor(MATCHING_EXECUTOR_KIND, MATCHING_WORKERS)
+    return _matching_executor
+
 
 def prepare_data_for_alignment(matched: list[MatchInfo]):
     """
@@ -51,10 +107,12 @@ def prepare_data_for_alignment(matched: list[MatchInfo]):
 
     for match in matched:
         # ✅ Use dataclass attributes instead of dict keys
-        workpiece = copy.deepcopy(match.workpiece)
+        # The workpiece is only read here; alignment transforms the Contour objects in place,
+        # so they get their own copies of the points instead of copying the whole workpiece
+        workpiece = match.workpiece
         # Prepare main contour object
         main_contour = workpiece.get_main_contour()
-        contour_obj = Contour(main_contour)
+        contour_obj = Contour(np.array(main_contour, dtype=np.float32))
         # Retrieve spray pattern data
         spray_contour_entries = workpiece.get_spray_pattern_contours()
         spray_fill_entries = workpiece.get_spray_pattern_fills()
@@ -85,40 +143,56 @@ def findMatchingWorkpieces(workpieces, newContours):
 
     # --- FIND MATCHES ---
     if USE_COMPARISON_MODEL:
-        model = load_model_with_fallback()
+        model = get_comparison_model_cache().get_model()
         strategy = MLMatchingStrategy(model)
     else:
         # Geometric-based
-        strategy = GeometricMatchingStrategy(similarity_threshold=0.8)
+        strategy = GeometricMatchingStrategy(similarity_threshold=0.8, debug=DEBUG_SIMILARITY)
 
-    matched, noMatches, newContoursWithMatches = match_workpieces(workpieces, newContours, strategy)
+    executor = get_matching_executor()
+    matched, noMatches, newContoursWithMatches = match_workpieces(workpieces, newContours, strategy, executor)
 
     # --- PREPARE FOR ALIGNMENT ---
     new_matched = prepare_data_for_alignment(matched)
 
     # --- ALIGN ---
-    finalMatches = _alignContours(new_matched, debug=DEBUG_ALIGN_CONTOURS)
+    finalMatches = _alignContours(new_matched, debug=DEBUG_ALIGN_CONTOURS, executor=executor)
 
     return finalMatches, noMatches, newContoursWithMatches
 
 
 
+def _find_best_matches_task(task):
+    """Match one chunk of contours; module level so process pools can pickle it."""
+    strategy, workpieces, contours = task
+    return strategy.find_best_matches(workpieces, contours)
+
+
 def match_workpieces(
     workpieces: list[Any],
     newContours: list[np.ndarray],
     strategy: MatchingStrategy,
+    executor: Optional[MatchingExecutor] = None,
 ) -> Tuple[list[MatchInfo], list[Contour], list[Contour]]:
     """
     Generic matching loop that uses a provided strategy (ML or geometric).
+    With an executor the contours are split into one contiguous chunk per worker and the
+    chunks are matched concurrently; results keep the order of ``newContours``.
     """
     matched: list[MatchInfo] = []
     noMatches: list[Contour] = []
     matchedContours: list[Contour] = []
 
-    for contour_data in newContours.copy():
-        contour = Contour(contour_data)
-        best = strategy.find_best_match(workpieces, contour)
+    contours = [Contour(contour_data) for contour_data in newContours]
+    if executor is None:
+        best_matches = strategy.find_best_matches(workpieces, contours)
+    else:
+        chunks = executor.split(contours)
+        chunk_results = executor.map(_find_best_matches_task,
+                                     [(strategy, workpieces, chunk) for chunk in chunks])
+        best_matches = [best for results in chunk_results for best in results]
 
+    for contour, best in zip(contours, best_matches):
         if best.is_match:
             match_info = MatchInfo(
                 workpiece=best.workpiece,
@@ -0,0 +1,99 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Quantization of the contour signature. Two detections of the same part in the same
+# pose must fall into the same bins, different poses should not.
+CENTROID_BIN_PX = 5.0  # centroid position bin size in pixels
+AREA_BIN_RATIO = 1.02  # area bins grow geometrically by 2%
+HU_MOMENT_COUNT = 4  # lower-order Hu moments are stable enough to key on
+HU_BIN = 0.1  # bin size of the log-scaled Hu moments
+ORIENTATION_BIN_DEG = 5.0  # Hu moments are rotation invariant, so the principal axis angle is keyed too
+
+# A cached rotation is only trusted while it still reaches almost the overlap it had when stored
+MAX_OVERLAP_DROP = 0.03
+
+
+@dataclass
+class CachedAlignment:
+    rotation: float
+    overlap: float
+
+
+class AlignmentCache:
+    """
+    Remembers the mask refinement rotation of recently aligned contours.
+
+    Entries are keyed by a quantized signature of the detected contour (centroid, area,
+    Hu moments, principal axis angle) and the ID of the matched workpiece, so a part that comes back in the same
+    pose on a fixture maps to the same entry. Least recently used entries are evicted
+    once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, CachedAlignment]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signature(contour, workpiece_id: Any) -> Optional[Tuple]:
+        """Quantized (workpiece id, centroid, area, orientation, Hu moments) key of a contour, None if it has no area."""
+        points = np.asarray(contour, dtype=np.float32).reshape(-1, 1, 2)
+        moments = cv2.moments(points)
+        area = moments["m00"]
+        if area <= 0:
+            return None
+
+        cx = moments["m10"] / area
+        cy = moments["m01"] / area
+        orientation = np.degrees(0.5 * np.arctan2(2 * moments["mu11"], moments["mu20"] - moments["mu02"]))
+        hu = cv2.HuMoments(moments).flatten()[:HU_MOMENT_COUNT]
+        log_hu = -np.sign(hu) * np.log10(np.abs(hu) + 1e-30)
+
+        return (
+            str(workpiece_id),
+            int(round(cx / CENTROID_BIN_PX)),
+            int(round(cy / CENTROID_BIN_PX)),
+            int(round(np.log(area) / np.log(AREA_BIN_RATIO))),
+            int(round(orientation / ORIENTATION_BIN_DEG)) % int(round(180 / ORIENTATION_BIN_DEG)),
+            tuple(int(round(v / HU_BIN)) for v in log_hu),
+        )
+
+    def get(self, key: Optional[Tuple]) -> Optional[CachedAlignment]:
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Optional[Tuple], rotation: float, overlap: float):
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = CachedAlignment(rotation=float(rotation), overlap=float(overlap))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -21,7 +21,7 @@ def transform_pickup_point(workpiece, rotationDiff, centroidDiff, centroid):
                 pickup_contour_obj.translate(centroidDiff[0], centroidDiff[1])
 
                 # Get transformed coordinates
-                transformed_pickup = pickup_contour_obj.get()[0][0]  # Extract the point
+                transformed_pickup = pickup_contour_obj.get()[0]  # Extract the point
                 transformed_x, transformed_y = transformed_pickup[0], transformed_pickup[1]
                 return [transformed_x, transformed_y]
             except(ValueError, AttributeError) as e:
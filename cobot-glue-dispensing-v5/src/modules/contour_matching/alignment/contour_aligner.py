@@ -1,15 +1,26 @@
-import copy
 from typing import Any, Dict
 from typing import List, Optional, Tuple
 
 import numpy as np
 
-# from backend.system.contour_matching.debug.plot_generator import plot_contour_alignment
+from modules.contour_matching.debug.debug_plot_writer import get_debug_plot_writer
+from modules.contour_matching.debug.plot_generator import plot_contour_alignment
+from modules.contour_matching.alignment.alignment_cache import AlignmentCache, CachedAlignment, MAX_OVERLAP_DROP
 from modules.contour_matching.matching.match_info import MatchInfo
 from modules.shared.core.ContourStandartized import Contour
 from modules.contour_matching.alignment.mask_refinement import _refine_alignment_with_mask
-from modules.contour_matching.alignment.workpiece_update import update_workpiece_data
+from modules.contour_matching.alignment.workpiece_update import copy_workpiece_for_update, update_workpiece_data
 from modules.contour_matching.matching_config import REFINEMENT_THRESHOLD
+from modules.contour_matching.parallel_executor import MatchingExecutor
+
+USE_ALIGNMENT_CACHE = True  # start refinement from the cached rotation for repeated part poses
+
+_alignment_cache = AlignmentCache()
+
+
+def get_alignment_cache() -> AlignmentCache:
+    """Process-wide cache of refinement rotations used by _alignContours."""
+    return _alignment_cache
 
 
 def apply_rotation(contours, angle, pivot):
@@ -27,8 +38,11 @@ def align_single_contour(
     spray_fills: Optional[List[Contour]] = None,
     rotation_diff: float = 0.0,
     translation_diff: Tuple[float, float] = (0.0, 0.0),
-    refine: bool = True
-) -> None:
+    refine: bool = True,
+    alignment_cache: Optional[AlignmentCache] = None,
+    cache_key: Optional[tuple] = None,
+    cached_alignment: Optional[CachedAlignment] = None
+) -> Optional[Tuple[float, float]]:
     """
     Align a single target contour to a reference contour, optionally applying the same
     transformation to associated spray contours/fills and performing mask-based refinement.
@@ -42,6 +56,15 @@ def align_single_contour(
         rotation_diff (float): Initial rotation difference in degrees.
         translation_diff (Tuple[float, float]): Initial translation difference (dx, dy).
         refine (bool): Whether to perform mask-based refinement.
+        alignment_cache (Optional[AlignmentCache]): Cache of refinement rotations. On a hit for
+            cache_key the refinement starts from the cached rotation and only falls back to the
+            full search when the overlap drops more than MAX_OVERLAP_DROP below the cached one.
+        cache_key (Optional[tuple]): Signature of the reference contour, see AlignmentCache.signature.
+        cached_alignment (Optional[CachedAlignment]): Cache entry looked up by the caller, used
+            instead of querying alignment_cache.
+
+    Returns:
+        Optional[Tuple[float, float]]: (refinement rotation, overlap) when refine is True, else None.
     """
     spray_contours = spray_contours or []
     spray_fills = spray_fills or []
@@ -61,15 +84,55 @@ def align_single_contour(
 
     # --- Mask-based refinement ---
     if refine:
-        best_rotation, _ = _refine_alignment_with_mask(
-            target.get(),
-            reference
-        )
+        cached = cached_alignment
+        if cached is None and alignment_cache is not None:
+            cached = alignment_cache.get(cache_key)
+        if cached is not None:
+            best_rotation, best_overlap = _refine_alignment_with_mask(
+                target.get(),
+                reference,
+                initial_rotation=cached.rotation,
+                min_overlap=cached.overlap - MAX_OVERLAP_DROP
+            )
+        else:
+            best_rotation, best_overlap = _refine_alignment_with_mask(
+                target.get(),
+                reference
+            )
+        if alignment_cache is not None:
+            # The stored overlap stays the one of the last full search, otherwise every hit
+            # would lower the bar the next hint has to clear
+            reference_overlap = best_overlap if cached is None else max(cached.overlap, best_overlap)
+            alignment_cache.put(cache_key, best_rotation, reference_overlap)
         if abs(best_rotation) > REFINEMENT_THRESHOLD:
             centroid_after = target.getCentroid()
             target.rotate(best_rotation, centroid_after)
             apply_rotation(spray_contours, best_rotation, centroid_after)
             apply_rotation(spray_fills, best_rotation, centroid_after)
+        return best_rotation, best_overlap
+    return None
+
+
+def _align_task(task):
+    """
+    Align one match given as plain point arrays, so it can run in a worker thread or process.
+    Returns the aligned target, spray contour and spray fill points and the refinement result.
+    """
+    target_points, reference, spray_points, fill_points, rotation_diff, translation_diff, refine, cached = task
+    target = Contour(target_points)
+    spray_contours = [Contour(points) for points in spray_points]
+    spray_fills = [Contour(points) for points in fill_points]
+    refinement = align_single_contour(
+        target=target,
+        reference=reference,
+        spray_contours=spray_contours,
+        spray_fills=spray_fills,
+        rotation_diff=rotation_diff,
+        translation_diff=translation_diff,
+        refine=refine,
+        cached_alignment=cached
+    )
+    return target.get(), [c.get() for c in spray_contours], [c.get() for c in spray_fills], refinement
 
 
 def align_contours_generic(
@@ -79,36 +142,77 @@ def align_contours_generic(
     spray_fills_list: Optional[List[List[Contour]]] = None,
     rotation_diffs: Optional[List[float]] = None,
     translation_diffs: Optional[List[Tuple[float, float]]] = None,
-    refine: bool = True
+    refine: bool = True,
+    alignment_cache: Optional[AlignmentCache] = None,
+    cache_keys: Optional[List[Optional[tuple]]] = None,
+    executor: Optional[MatchingExecutor] = None
 ) -> None:
     """
     Align multiple target contours to corresponding reference contours using `align_single_contour`.
+    With a parallel executor the contours are aligned concurrently; results are written back
+    to the given Contour objects in input order, so the outcome matches the serial path.
     """
     spray_contours_list = spray_contours_list or [[] for _ in target_contours]
     spray_fills_list = spray_fills_list or [[] for _ in target_contours]
     rotation_diffs = rotation_diffs or [0.0] * len(target_contours)
     translation_diffs = translation_diffs or [(0.0, 0.0)] * len(target_contours)
+    cache_keys = cache_keys or [None] * len(target_contours)
 
+    if executor is None or not executor.parallel or len(target_contours) <= 1:
+        for i, (target, reference) in enumerate(zip(target_contours, reference_contours)):
+            align_single_contour(
+                target=target,
+                reference=reference,
+                spray_contours=spray_contours_list[i],
+                spray_fills=spray_fills_list[i],
+                rotation_diff=rotation_diffs[i],
+                translation_diff=translation_diffs[i],
+                refine=refine,
+                alignment_cache=alignment_cache,
+                cache_key=cache_keys[i]
+            )
+        return
+
+    # Cache lookups and updates stay in this thread so they also work with process pools
+    tasks = []
+    cached_entries = []
     for i, (target, reference) in enumerate(zip(target_contours, reference_contours)):
-        align_single_contour(
-            target=target,
-            reference=reference,
-            spray_contours=spray_contours_list[i],
-            spray_fills=spray_fills_list[i],
-            rotation_diff=rotation_diffs[i],
-            translation_diff=translation_diffs[i],
-            refine=refine
-        )
+        cached = alignment_cache.get(cache_keys[i]) if alignment_cache is not None and refine else None
+        cached_entries.append(cached)
+        tasks.append((
+            target.get().copy(),
+            reference,
+            [c.get().copy() for c in spray_contours_list[i]],
+            [c.get().copy() for c in spray_fills_list[i]],
+            rotation_diffs[i],
+            translation_diffs[i],
+            refine,
+            cached,
+        ))
 
+    for i, (target_points, spray_points, fill_points, refinement) in enumerate(executor.map(_align_task, tasks)):
+        target_contours[i].contour_points = target_points
+        for contour, points in zip(spray_contours_list[i], spray_points):
+            contour.contour_points = points
+        for contour, points in zip(spray_fills_list[i], fill_points):
+            contour.contour_points = points
+        if alignment_cache is not None and refinement is not None:
+            rotation, overlap = refinement
+            if cached_entries[i] is not None:
+                overlap = max(cached_entries[i].overlap, overlap)
+            alignment_cache.put(cache_keys[i], rotation, overlap)
 
 
-def _alignContours(matched: List[MatchInfo], debug: bool = False) -> Dict[str, List[Any]]:
+
+def _alignContours(matched: List[MatchInfo], debug: bool = False,
+                   executor: Optional[MatchingExecutor] = None) -> Dict[str, List[Any]]:
     """
     Align matched contours to the workpieces using the workpiece-agnostic batch function.
 
     Args:
         matched (List[MatchInfo]): List of matched workpieces with contour info.
-        debug (bool): Whether to generate debug plots.
+        debug (bool): Whether to queue debug plots on the shared DebugPlotWriter.
+        executor (Optional[MatchingExecutor]): Worker pool to align the matches concurrently.
 
     Returns:
         Dict[str, List[Any]]: Aligned workpieces, orientations, ML confidences, ML results.
@@ -128,6 +232,12 @@ def _alignContours(matched: List[MatchInfo], debug: bool = False) -> Dict[str, L
     rotation_diffs = [match.rotation_diff for match in matched]
     translation_diffs = [match.centroid_diff for match in matched]
 
+    alignment_cache = _alignment_cache if USE_ALIGNMENT_CACHE else None
+    cache_keys = None
+    if alignment_cache is not None:
+        cache_keys = [AlignmentCache.signature(match.new_contour, getattr(match.workpiece, "workpieceId", None))
+                      for match in matched]
+
     # --- Store debug originals if needed ---
     if debug:
         original_data = []
@@ -146,12 +256,15 @@ def _alignContours(matched: List[MatchInfo], debug: bool = False) -> Dict[str, L
         spray_fills_list=spray_fills_list,
         rotation_diffs=rotation_diffs,
         translation_diffs=translation_diffs,
-        refine=True
+        refine=True,
+        alignment_cache=alignment_cache,
+        cache_keys=cache_keys,
+        executor=executor
     )
 
     # --- Update workpieces and optionally generate debug plots ---
     for i, match in enumerate(matched):
-        workpiece = copy.deepcopy(match.workpiece)
+        workpiece = copy_workpiece_for_update(match.workpiece)
         contourObj = target_contours[i]
         sprayContourObjs = spray_contours_list[i]
         sprayFillObjs = spray_fills_list[i]
@@ -167,7 +280,9 @@ def _alignContours(matched: List[MatchInfo], debug: bool = False) -> Dict[str, L
 
         if debug:
             data = original_data[i]
-            plot_contour_alignment(
+            # Rendered on the debug writer thread so alignment does not wait for matplotlib
+            get_debug_plot_writer().submit(
+                plot_contour_alignment,
                 data["target"],
                 data["reference"],
                 contourObj.getCentroid(),
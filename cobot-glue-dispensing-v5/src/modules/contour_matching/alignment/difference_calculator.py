@@ -43,7 +43,7 @@ def _ensure_closed(contour: Contour) -> Contour:
     """
     points = contour.get()
     if not np.array_equal(points[0], points[-1]):
-        closed_points = np.vstack([points, points[0].reshape(1, 1, 2)])
+        closed_points = np.vstack([points, points[0].reshape(1, 2)])
         return Contour(closed_points)
     return contour
 
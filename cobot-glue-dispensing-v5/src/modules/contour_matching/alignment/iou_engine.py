@@ -0,0 +1,104 @@
+import cv2
+import numpy as np
+
+
+class _RasterizedReference:
+    """Filled mask of the reference contour cropped to its bounding box, at one scale."""
+
+    def __init__(self, points: np.ndarray, scale: float):
+        self.scale = scale
+        contour = _to_raster_points(points, scale)
+        self.x0, self.y0 = contour.min(axis=0)
+        x1, y1 = contour.max(axis=0)
+        self.mask = np.zeros((y1 - self.y0 + 1, x1 - self.x0 + 1), dtype=np.uint8)
+        cv2.drawContours(self.mask, [contour.reshape(-1, 1, 2)], -1, 255, -1,
+                         offset=(-int(self.x0), -int(self.y0)))
+        self.area = cv2.countNonZero(self.mask)
+
+
+class ContourIoUEngine:
+    """
+    Reusable Intersection-over-Union evaluator against a fixed reference contour.
+
+    Replaces repeated calls to ``modules.utils.contours.calculate_mask_overlap`` during
+    alignment. The reference mask is rasterized once per scale and cached. Each candidate
+    is drawn into a preallocated scratch buffer cropped to its own bounding box, and only
+    the overlap of the two boxes is compared, so the cost depends on the part size
+    instead of a full canvas. Contours are rasterized with the same truncation to
+    integer pixels and the same filled ``cv2.drawContours`` call as
+    ``calculate_mask_overlap``.
+
+    ``coarse_scale`` (0 < scale <= 1) selects a downsampled raster for cheap early
+    estimates through ``iou(contour, coarse=True)``. Full resolution is always used
+    when ``coarse`` is False.
+    """
+
+    def __init__(self, reference_contour, coarse_scale: float = 1.0):
+        if not 0 < coarse_scale <= 1:
+            raise ValueError("coarse_scale must be in (0, 1]")
+        self.reference_points = np.asarray(reference_contour, dtype=np.float64).reshape(-1, 2)
+        self.coarse_scale = coarse_scale
+        self._references = {}
+        self._scratch = np.zeros((0, 0), dtype=np.uint8)
+        self.evaluations = 0
+
+    def iou(self, contour, coarse: bool = False) -> float:
+        """
+        IoU between ``contour`` and the reference contour.
+
+        Args:
+            contour: Candidate contour in any OpenCV-compatible point layout.
+            coarse: Use the coarse raster instead of full resolution.
+
+        Returns:
+            float: Intersection over Union in [0, 1].
+        """
+        self.evaluations += 1
+        reference = self._reference(self.coarse_scale if coarse else 1.0)
+        points = _to_raster_points(np.asarray(contour, dtype=np.float64).reshape(-1, 2), reference.scale)
+        if len(points) == 0:
+            return 0.0
+
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0)
+        height, width = y1 - y0 + 1, x1 - x0 + 1
+        mask = self._scratch_mask(height, width)
+        cv2.drawContours(mask, [points.reshape(-1, 1, 2)], -1, 255, -1, offset=(-int(x0), -int(y0)))
+        area = cv2.countNonZero(mask)
+
+        intersection = 0
+        ref_h, ref_w = reference.mask.shape
+        ix0, iy0 = max(x0, reference.x0), max(y0, reference.y0)
+        ix1, iy1 = min(x1 + 1, reference.x0 + ref_w), min(y1 + 1, reference.y0 + ref_h)
+        if ix0 < ix1 and iy0 < iy1:
+            candidate_overlap = mask[iy0 - y0:iy1 - y0, ix0 - x0:ix1 - x0]
+            reference_overlap = reference.mask[iy0 - reference.y0:iy1 - reference.y0,
+                                               ix0 - reference.x0:ix1 - reference.x0]
+            intersection = cv2.countNonZero(cv2.bitwise_and(candidate_overlap, reference_overlap))
+
+        union = area + reference.area - intersection
+        if union == 0:
+            return 0.0
+        return intersection / union
+
+    def _reference(self, scale: float) -> _RasterizedReference:
+        reference = self._references.get(scale)
+        if reference is None:
+            reference = _RasterizedReference(self.reference_points, scale)
+            self._references[scale] = reference
+        return reference
+
+    def _scratch_mask(self, height: int, width: int) -> np.ndarray:
+        if self._scratch.shape[0] < height or self._scratch.shape[1] < width:
+            self._scratch = np.zeros((max(height, self._scratch.shape[0]),
+                                      max(width, self._scratch.shape[1])), dtype=np.uint8)
+        mask = self._scratch[:height, :width]
+        mask.fill(0)
+        return mask
+
+
+def _to_raster_points(points: np.ndarray, scale: float) -> np.ndarray:
+    if scale != 1.0:
+        points = points * scale
+    # Same truncation as np.array(contour, dtype=np.int32) in calculate_mask_overlap
+    return points.astype(np.int32)
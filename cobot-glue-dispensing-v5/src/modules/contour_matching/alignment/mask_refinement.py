@@ -1,15 +1,36 @@
+from modules.contour_matching.alignment.iou_engine import ContourIoUEngine
+from modules.contour_matching.alignment.rotation_estimator import estimate_rotation_candidates
 from modules.shared.core.ContourStandartized import Contour
-from modules.utils.contours import calculate_mask_overlap
 
+# Raster scale used for the IoU evaluations of the coarse 0–360° sweep.
+# Local refinement and fine-tuning always run at full resolution.
+COARSE_IOU_SCALE = 0.5
 
-def _refine_alignment_with_mask(workpiece_contour, target_contour):
+# Estimate the coarse rotation by correlating centroid-distance profiles instead of the
+# stepped 0–360° sweep. Only the best few correlation peaks are scored with IoU.
+USE_PROFILE_COARSE_SEARCH = True
+COARSE_CANDIDATES = 4
+
+
+def _refine_alignment_with_mask(workpiece_contour, target_contour, initial_rotation=None, min_overlap=0.0):
     """
     Refine the alignment of a contour by rotating it to maximize mask overlap with a target contour.
     Performs three stages: coarse search, adaptive local refinement, and fine-tuning.
+    All overlaps are computed by a single ContourIoUEngine that caches the target mask.
+    The coarse search scores the few rotations suggested by correlating the centroid-distance
+    profiles of both contours; if that is disabled (USE_PROFILE_COARSE_SEARCH) or yields no
+    candidates, it sweeps 0–360° on a downsampled raster (COARSE_IOU_SCALE).
+
+    When ``initial_rotation`` is given (e.g. a cached result for the same part in the same pose),
+    the coarse 0–360° search is skipped and only local refinement and fine-tuning run, starting
+    from that rotation. If the overlap reached that way is below ``min_overlap``, the full
+    search runs as usual.
 
     Args:
         workpiece_contour (np.ndarray or Contour): The contour to rotate and align.
         target_contour (np.ndarray or Contour): The reference contour to align to.
+        initial_rotation (float, optional): Rotation in degrees to start a local search from.
+        min_overlap (float): Overlap the local search must reach to skip the full search.
 
 
     Returns:
@@ -20,44 +41,109 @@ def _refine_alignment_with_mask(workpiece_contour, target_contour):
     contour_obj = Contour(workpiece_contour)
     centroid = contour_obj.getCentroid()
 
+    iou_engine = ContourIoUEngine(target_contour, coarse_scale=COARSE_IOU_SCALE)
+
     best_rotation = 0
-    best_overlap = calculate_mask_overlap(workpiece_contour, target_contour)
+    best_overlap = iou_engine.iou(workpiece_contour)
     print(f"      Initial overlap (0°): {best_overlap:.4f}")
 
+    if initial_rotation is not None:
+        hint_overlap = iou_engine.iou(_rotate_contour(workpiece_contour, initial_rotation, centroid))
+        print(f"      Starting from cached rotation {initial_rotation:.2f}°: overlap = {hint_overlap:.4f}")
+        hint_rotation = initial_rotation
+        if best_overlap > hint_overlap:
+            hint_rotation, hint_overlap = best_rotation, best_overlap
+
+        hint_rotation, hint_overlap = _local_refinement(
+            workpiece_contour, iou_engine, centroid, hint_rotation, hint_overlap
+        )
+        hint_rotation, hint_overlap = _fine_tune(
+            workpiece_contour, iou_engine, centroid, hint_rotation, hint_overlap
+        )
+        if hint_overlap >= min_overlap:
+            hint_rotation = (hint_rotation + 180) % 360 - 180
+            print(f"      Final best rotation: {hint_rotation:.2f}° with overlap: {hint_overlap:.4f} "
+                  f"({iou_engine.evaluations} IoU evaluations, started from cached rotation)")
+            return hint_rotation, hint_overlap
+        print(f"      Overlap {hint_overlap:.4f} below {min_overlap:.4f}, falling back to full search")
+
     # Stage 1: Coarse search
-    best_rotation, best_overlap = _coarse_search(
-        workpiece_contour, target_contour, centroid, best_rotation, best_overlap
-    )
+    candidates = []
+    if USE_PROFILE_COARSE_SEARCH:
+        candidates = estimate_rotation_candidates(
+            workpiece_contour, target_contour, centroid, Contour(target_contour).getCentroid(),
+            max_candidates=COARSE_CANDIDATES
+        )
+    if candidates:
+        best_rotation, best_overlap = _score_candidates(
+            workpiece_contour, iou_engine, centroid, candidates, best_rotation, best_overlap
+        )
+    else:
+        # Scores of the stepped sweep are in coarse raster units
+        coarse_rotation, _ = _coarse_search(
+            workpiece_contour, iou_engine, centroid, best_rotation, iou_engine.iou(workpiece_contour, coarse=True)
+        )
+        if coarse_rotation != best_rotation:
+            coarse_overlap = iou_engine.iou(_rotate_contour(workpiece_contour, coarse_rotation, centroid))
+            if coarse_overlap > best_overlap:
+                best_rotation, best_overlap = coarse_rotation, coarse_overlap
 
     # Stage 2: Adaptive local refinement
     best_rotation, best_overlap = _local_refinement(
-        workpiece_contour, target_contour, centroid, best_rotation, best_overlap
+        workpiece_contour, iou_engine, centroid, best_rotation, best_overlap
     )
 
     # Stage 3: Fine-tuning
     best_rotation, best_overlap = _fine_tune(
-        workpiece_contour, target_contour, centroid, best_rotation, best_overlap
+        workpiece_contour, iou_engine, centroid, best_rotation, best_overlap
     )
 
     # Normalize rotation to [-180, 180]
     best_rotation = (best_rotation + 180) % 360 - 180
-    print(f"      Final best rotation: {best_rotation:.2f}° with overlap: {best_overlap:.4f}")
+    print(f"      Final best rotation: {best_rotation:.2f}° with overlap: {best_overlap:.4f} "
+          f"({iou_engine.evaluations} IoU evaluations)")
     return best_rotation, best_overlap
 
 
-def _coarse_search(workpiece_contour, target_contour, centroid, best_rotation, best_overlap):
+def _score_candidates(workpiece_contour, iou_engine, centroid, candidates, best_rotation, best_overlap):
     """
-    Perform a coarse rotational search over 0–360° to find a rough alignment that increases overlap.
+    Score rotation candidates from the profile correlation with full-resolution IoU and keep the best.
 
     Args:
         workpiece_contour (np.ndarray or Contour): Contour to rotate.
-        target_contour (np.ndarray or Contour): Reference contour for overlap calculation.
+        iou_engine (ContourIoUEngine): Overlap evaluator holding the reference contour.
         centroid (tuple): Pivot point for rotation.
+        candidates (list): (rotation, correlation) pairs from estimate_rotation_candidates.
         best_rotation (float): Current best rotation angle.
         best_overlap (float): Current best overlap score.
 
     Returns:
-        tuple: Updated (best_rotation, best_overlap) after coarse search.
+        tuple: Updated (best_rotation, best_overlap).
+    """
+    print(f"      Stage 1: Profile correlation, {len(candidates)} candidates...")
+    for rotation, correlation in candidates:
+        overlap = iou_engine.iou(_rotate_contour(workpiece_contour, rotation, centroid))
+        print(f"      Candidate {rotation:.1f}° (correlation {correlation:.3f}): overlap = {overlap:.4f}")
+        if overlap > best_overlap:
+            best_rotation, best_overlap = rotation, overlap
+
+    print(f"      Stage 1 complete: best at {best_rotation}° with overlap {best_overlap:.4f}")
+    return best_rotation, best_overlap
+
+
+def _coarse_search(workpiece_contour, iou_engine, centroid, best_rotation, best_overlap):
+    """
+    Perform a coarse rotational search over 0–360° to find a rough alignment that increases overlap.
+
+    Args:
+        workpiece_contour (np.ndarray or Contour): Contour to rotate.
+        iou_engine (ContourIoUEngine): Overlap evaluator holding the reference contour.
+        centroid (tuple): Pivot point for rotation.
+        best_rotation (float): Current best rotation angle.
+        best_overlap (float): Current best overlap score on the coarse raster.
+
+    Returns:
+        tuple: Updated (best_rotation, best_overlap) after coarse search, overlap on the coarse raster.
     """
     print(f"      Stage 1: Coarse search...")
     current_step = 10  # The initial step size in degrees for rotating the contour.
@@ -71,7 +157,7 @@ def _coarse_search(workpiece_contour, target_contour, centroid, best_rotation, b
     while angle < 360 and iteration < max_iterations:
         signed_angle = angle if angle <= 180 else angle - 360
         rotated_points = _rotate_contour(workpiece_contour, signed_angle, centroid)
-        overlap = calculate_mask_overlap(rotated_points, target_contour)
+        overlap = iou_engine.iou(rotated_points, coarse=True)
 
         if overlap > best_overlap:
             improvement = overlap - best_overlap
@@ -89,14 +175,14 @@ def _coarse_search(workpiece_contour, target_contour, centroid, best_rotation, b
     return best_rotation, best_overlap
 
 
-def _local_refinement(workpiece_contour, target_contour, centroid, best_rotation, best_overlap):
+def _local_refinement(workpiece_contour, iou_engine, centroid, best_rotation, best_overlap):
     """
     Refine rotation in a local neighborhood around the coarse alignment to improve mask overlap.
     Uses adaptive step size and stops when no improvement is seen after several iterations.
 
     Args:
         workpiece_contour (np.ndarray or Contour): Contour to rotate.
-        target_contour (np.ndarray or Contour): Reference contour.
+        iou_engine (ContourIoUEngine): Overlap evaluator holding the reference contour.
         centroid (tuple): Pivot for rotation.
         best_rotation (float): Starting rotation angle.
         best_overlap (float): Starting overlap score.
@@ -134,7 +220,7 @@ def _local_refinement(workpiece_contour, target_contour, centroid, best_rotation
 
             angle = (angle + 180) % 360 - 180
             rotated_points = _rotate_contour(workpiece_contour, angle, centroid)
-            overlap = calculate_mask_overlap(rotated_points, target_contour)
+            overlap = iou_engine.iou(rotated_points)
 
             if overlap > best_overlap:
                 improvement = overlap - best_overlap
@@ -157,14 +243,14 @@ def _local_refinement(workpiece_contour, target_contour, centroid, best_rotation
     return best_rotation, best_overlap
 
 
-def _fine_tune(workpiece_contour, target_contour, centroid, best_rotation, best_overlap):
+def _fine_tune(workpiece_contour, iou_engine, centroid, best_rotation, best_overlap):
     """
     Perform very fine rotational adjustments (±2° in 0.5° steps) around the current best rotation
     to maximize mask overlap.
 
     Args:
         workpiece_contour (np.ndarray or Contour): Contour to rotate.
-        target_contour (np.ndarray or Contour): Reference contour.
+        iou_engine (ContourIoUEngine): Overlap evaluator holding the reference contour.
         centroid (tuple): Pivot point for rotation.
         best_rotation (float): Starting rotation angle.
         best_overlap (float): Starting overlap score.
@@ -182,7 +268,7 @@ def _fine_tune(workpiece_contour, target_contour, centroid, best_rotation, best_
             angle = best_rotation + offset_sign * offset
             angle = (angle + 180) % 360 - 180
             rotated_points = _rotate_contour(workpiece_contour, angle, centroid)
-            overlap = calculate_mask_overlap(rotated_points, target_contour)
+            overlap = iou_engine.iou(rotated_points)
 
             if overlap > best_overlap:
                 improvement = overlap - best_overlap
@@ -0,0 +1,100 @@
+import numpy as np
+
+# Angular resolution of the centroid-distance profiles (bins over 360°)
+PROFILE_BINS = 360
+# Number of points the contour outline is resampled to before building a profile
+OUTLINE_SAMPLES = 1440
+
+
+def centroid_distance_profile(contour, centroid, bins=PROFILE_BINS, samples=OUTLINE_SAMPLES):
+    """
+    Largest distance from ``centroid`` to the contour outline for each of ``bins`` equal
+    angular sectors. Rotating the contour by α degrees around the centroid shifts the
+    profile by α degrees, which makes it usable for estimating rotations by correlation.
+
+    Args:
+        contour (np.ndarray): Contour points in any OpenCV-compatible layout.
+        centroid (tuple): Point the distances are measured from.
+        bins (int): Number of angular sectors.
+        samples (int): Number of points the outline is resampled to.
+
+    Returns:
+        np.ndarray or None: Profile of length ``bins``, None for degenerate contours.
+    """
+    points = np.asarray(contour, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 3:
+        return None
+
+    # Resample the closed outline uniformly by arc length so long edges are not underrepresented
+    closed = np.vstack([points, points[:1]])
+    lengths = np.hypot(*np.diff(closed, axis=0).T)
+    perimeter = lengths.sum()
+    if perimeter <= 0:
+        return None
+    positions = np.concatenate([[0.0], np.cumsum(lengths)])
+    arc = np.linspace(0.0, perimeter, samples, endpoint=False)
+    outline = np.column_stack([np.interp(arc, positions, closed[:, 0]),
+                               np.interp(arc, positions, closed[:, 1])])
+
+    offsets = outline - np.asarray(centroid, dtype=np.float64)
+    radius = np.hypot(offsets[:, 0], offsets[:, 1])
+    angle = np.degrees(np.arctan2(offsets[:, 1], offsets[:, 0])) % 360.0
+    sector = np.minimum((angle * bins / 360.0).astype(np.int64), bins - 1)
+
+    profile = np.zeros(bins)
+    np.maximum.at(profile, sector, radius)
+
+    # Sectors the outline never crossed get interpolated circularly from their neighbours
+    filled = np.flatnonzero(profile > 0)
+    if len(filled) == 0:
+        return None
+    if len(filled) < bins:
+        empty = np.flatnonzero(profile == 0)
+        profile[empty] = np.interp(empty, filled, profile[filled], period=bins)
+    return profile
+
+
+def estimate_rotation_candidates(workpiece_contour, target_contour, workpiece_centroid, target_centroid,
+                                 max_candidates=4, min_separation=10.0, bins=PROFILE_BINS):
+    """
+    Candidate rotations (degrees, [-180, 180)) that turn ``workpiece_contour`` onto
+    ``target_contour``, best first.
+
+    Both centroid-distance profiles are circularly cross-correlated with one FFT; every
+    peak of the correlation is a rotation candidate. Candidates closer than
+    ``min_separation`` degrees to a better one are dropped.
+
+    Returns:
+        list[tuple[float, float]]: (rotation, normalized correlation) pairs, empty for
+        degenerate contours.
+    """
+    workpiece_profile = centroid_distance_profile(workpiece_contour, workpiece_centroid, bins)
+    target_profile = centroid_distance_profile(target_contour, target_centroid, bins)
+    if workpiece_profile is None or target_profile is None:
+        return []
+
+    workpiece_profile = workpiece_profile - workpiece_profile.mean()
+    target_profile = target_profile - target_profile.mean()
+    norm = np.linalg.norm(workpiece_profile) * np.linalg.norm(target_profile)
+    if norm == 0:
+        # Circle-like shapes: the profile carries no orientation, any rotation fits
+        return [(0.0, 1.0)]
+
+    # correlation[k] = sum_t target[t] * workpiece[t - k]: rotating the workpiece by k bins
+    correlation = np.fft.irfft(np.fft.rfft(target_profile) * np.conj(np.fft.rfft(workpiece_profile)), n=bins)
+    correlation /= norm
+
+    is_peak = (correlation >= np.roll(correlation, 1)) & (correlation >= np.roll(correlation, -1))
+    peaks = np.flatnonzero(is_peak)
+    peaks = peaks[np.argsort(-correlation[peaks], kind="stable")]
+
+    bin_size = 360.0 / bins
+    candidates = []
+    for peak in peaks:
+        rotation = (peak * bin_size + 180.0) % 360.0 - 180.0
+        if any(abs((rotation - other + 180.0) % 360.0 - 180.0) < min_separation for other, _ in candidates):
+            continue
+        candidates.append((float(rotation), float(correlation[peak])))
+        if len(candidates) == max_candidates:
+            break
+    return candidates
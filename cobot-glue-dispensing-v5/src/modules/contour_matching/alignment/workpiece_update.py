@@ -1,3 +1,33 @@
+import copy
+
+
+def copy_workpiece_for_update(workpiece):
+    """
+    Copy of ``workpiece`` that update_workpiece_data can modify without touching the original.
+
+    Only what update_workpiece_data replaces is copied: the workpiece object itself and the
+    spray pattern containers and entries (with their settings). Point arrays and all other
+    attributes are shared, which avoids a deepcopy of every contour per match.
+    """
+    workpiece_copy = copy.copy(workpiece)
+    spray_pattern = getattr(workpiece, "sprayPattern", None)
+    if isinstance(spray_pattern, dict):
+        workpiece_copy.sprayPattern = {
+            key: [_copy_entry(entry) for entry in entries] if isinstance(entries, list) else entries
+            for key, entries in spray_pattern.items()
+        }
+    return workpiece_copy
+
+
+def _copy_entry(entry):
+    if not isinstance(entry, dict):
+        return entry
+    entry_copy = dict(entry)
+    if isinstance(entry_copy.get("settings"), dict):
+        entry_copy["settings"] = dict(entry_copy["settings"])
+    return entry_copy
+
+
 def update_workpiece_data(workpiece,contourObj,sprayContourObjs,sprayFillObjs,pickup_point):
     # ✅ Update the workpiece with transformed contours
     workpiece.contour = {"contour": contourObj.get(), "settings": {}}
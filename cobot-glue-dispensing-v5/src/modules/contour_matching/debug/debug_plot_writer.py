@@ -0,0 +1,97 @@
+import queue
+import threading
+from typing import Callable
+
+# Directory debug plots are written to; None keeps the default ``debug/debug`` folder
+DEBUG_CAPTURE_DIR = None
+# Only every n-th submitted plot is rendered
+DEBUG_PLOT_SAMPLE_EVERY = 10
+# Plots waiting for the writer thread; further submissions are dropped while it is full
+DEBUG_PLOT_MAX_PENDING = 16
+
+
+class DebugPlotWriter:
+    """
+    Renders debug plots on a single background thread so matching never waits for matplotlib
+    or the disk.
+
+    ``submit`` only enqueues the plot function and its arguments: every ``sample_every``-th
+    submission is kept, and submissions are dropped while ``max_pending`` plots are still
+    waiting. Plot functions are called with ``output_dir`` as keyword argument. Callers must
+    not modify the submitted arguments afterwards, pass copies of arrays that are reused.
+    """
+
+    def __init__(self, output_dir=DEBUG_CAPTURE_DIR, sample_every: int = DEBUG_PLOT_SAMPLE_EVERY,
+                 max_pending: int = DEBUG_PLOT_MAX_PENDING):
+        self.output_dir = output_dir
+        self.sample_every = max(1, int(sample_every))
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._submitted = 0
+        self._written = 0
+        self._skipped = 0
+        self._dropped = 0
+        self._failed = 0
+
+    def submit(self, plot_fn: Callable, *args, **kwargs) -> bool:
+        """
+        Queue ``plot_fn(*args, output_dir=..., **kwargs)`` for the writer thread.
+
+        Returns:
+            bool: True if the plot was queued, False if it was skipped by sampling or dropped.
+        """
+        with self._lock:
+            self._submitted += 1
+            if (self._submitted - 1) % self.sample_every:
+                self._skipped += 1
+                return False
+            try:
+                self._queue.put_nowait((plot_fn, args, kwargs))
+            except queue.Full:
+                self._dropped += 1
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="DebugPlotWriter", daemon=True)
+                self._thread.start()
+        return True
+
+    def flush(self):
+        """Block until every queued plot has been written."""
+        self._queue.join()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "submitted": self._submitted,
+                "written": self._written,
+                "skipped": self._skipped,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "pending": self._queue.qsize(),
+            }
+
+    def _run(self):
+        while True:
+            plot_fn, args, kwargs = self._queue.get()
+            try:
+                plot_fn(*args, output_dir=self.output_dir, **kwargs)
+                with self._lock:
+                    self._written += 1
+            except Exception as e:
+                with self._lock:
+                    self._failed += 1
+                print(f"⚠️ Debug plot failed: {e}")
+            finally:
+                self._queue.task_done()
+
+
+_debug_plot_writer = None
+
+
+def get_debug_plot_writer() -> DebugPlotWriter:
+    """Get the process-wide debug plot writer, created on first use."""
+    global _debug_plot_writer
+    if _debug_plot_writer is None:
+        _debug_plot_writer = DebugPlotWriter()
+    return _debug_plot_writer
@@ -1,14 +1,24 @@
 import numpy as np
 import cv2
 
-def _create_debug_plot(contour1, contour2, metrics):
-    """Helper function to create debug plots for similarity analysis with all metrics."""
-    import matplotlib.pyplot as plt
+def _get_debug_dir(output_dir=None):
+    """Directory debug captures are written to, ``debug/debug`` next to this module by default."""
     from pathlib import Path
-    import datetime
 
-    debug_dir = Path(__file__).resolve().parent / "debug"
+    debug_dir = Path(output_dir) if output_dir is not None else Path(__file__).resolve().parent / "debug"
     debug_dir.mkdir(parents=True, exist_ok=True)
+    return debug_dir
+
+
+def _create_debug_plot(contour1, contour2, metrics, output_dir=None):
+    """
+    Helper function to create debug plots for similarity analysis with all metrics.
+    Uses the matplotlib object API instead of pyplot so it can run on a background thread.
+    """
+    from matplotlib.figure import Figure
+    import datetime
+
+    debug_dir = _get_debug_dir(output_dir)
 
 
     print("Creating similarity debug plot...")
@@ -38,8 +48,6 @@ def _create_debug_plot(contour1, contour2, metrics):
     print(f"Contour 1 size: width={w1:.2f}, height={h1:.2f} | Contour 2 size: width={w2:.2f}, height={h2:.2f}")
 
     # Save both corners to the `debug` folder (numpy and readable text)
-    debug_dir = Path(__file__).resolve().parent / "debug"
-    debug_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     np.save(debug_dir / f"corner1_{timestamp}.npy", points1)
     np.save(debug_dir / f"corner2_{timestamp}.npy", points2)
@@ -47,7 +55,8 @@ def _create_debug_plot(contour1, contour2, metrics):
     np.savetxt(debug_dir / f"corner2_{timestamp}.txt", points2, fmt="%f")
 
     # Create figure
-    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
+    fig = Figure(figsize=(15, 5))
+    ax1, ax2, ax3 = fig.subplots(1, 3)
 
     # Contour 1
     ax1.plot(points1[:, 0], points1[:, 1], 'b-', linewidth=2, marker='o', markersize=3)
@@ -99,29 +108,23 @@ def _create_debug_plot(contour1, contour2, metrics):
         bbox=dict(boxstyle="round,pad=0.4", facecolor=color, alpha=0.7, edgecolor='black')
     )
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # ============================
     # Save debug image
     # ============================
-    debug_dir = Path(__file__).resolve().parent / "debug"
-    debug_dir.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-
     filename = f"similarity_debug_{timestamp}_{similarity_percent:.1f}pct.png"
     filepath = debug_dir / filename
 
-    plt.savefig(filepath, dpi=150, bbox_inches='tight')
+    fig.savefig(filepath, dpi=150, bbox_inches='tight')
     print(f"🔍 Similarity debug plot saved: {filepath}")
-    plt.close()
 
-def plot_contour_alignment(original_contour, original_new_contour,centroid,original_spray_contours,workpiece,rotated_contour,final_contour,rotationDiff,centroidDiff,contourOrientation,sprayContourObjs,sprayFillObjs,i):
-    import matplotlib.pyplot as plt
-    from pathlib import Path
+def plot_contour_alignment(original_contour, original_new_contour,centroid,original_spray_contours,workpiece,rotated_contour,final_contour,rotationDiff,centroidDiff,contourOrientation,sprayContourObjs,sprayFillObjs,i,output_dir=None):
+    from matplotlib.figure import Figure
     import datetime
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    fig = Figure(figsize=(15, 12))
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
 
     # Plot 1: Original positions
     orig_points = original_contour.reshape(-1, 2) if len(original_contour.shape) == 3 else original_contour
@@ -210,20 +213,16 @@ def plot_contour_alignment(original_contour, original_new_contour,centroid,origi
     ax4.axis('off')
     ax4.set_title(f'Alignment Summary\nMatch #{i + 1}')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save debug image to `debug` folder
-    debug_dir = Path(__file__).resolve().parent / "debug"
-    debug_dir.mkdir(parents=True, exist_ok=True)
+    debug_dir = _get_debug_dir(output_dir)
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     filename = f"align_debug_wp{workpiece.workpieceId}_match{i + 1}_{timestamp}.png"
     filepath = debug_dir / filename
-    plt.savefig(filepath, dpi=150, bbox_inches='tight')
+    fig.savefig(filepath, dpi=150, bbox_inches='tight')
     print(f"🔍 Alignment debug plot saved: {filepath}")
 
-    # plt.show(block=True)
-    plt.close(fig)
-
 def get_similarity_debug_plot(workpieceContour, contour, workpieceCentroid, contourCentroid, wpAngle, contourAngle, centroidDiff, rotationDiff):
     import matplotlib.pyplot as plt
 
@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from modules.shape_matching_training.utils.io_utils import get_latest_model, get_model_metadata, load_model
+
+
+class ComparisonModelCache:
+    """
+    Keeps the comparison model loaded for the lifetime of the process.
+
+    ``get_model()`` returns the cached model and only touches the disk with two
+    ``os.stat`` calls: one on the models directory, whose mtime changes when
+    ``save_model`` creates a new model folder, and one on the loaded model file,
+    whose mtime changes when it is overwritten in place. When either changed the
+    latest model is resolved again and reloaded if it differs from the cached one.
+
+    ``save_model`` creates the model folder before writing the model into it, and
+    the write does not touch the models directory. Folders created after the last
+    load that do not hold a model yet are therefore watched as well until one of
+    them resolves. A reload that fails (e.g. a model file still being written)
+    keeps the current model and is retried on the next call.
+    """
+
+    def __init__(self, model_dir: Union[str, Path],
+                 loader: Callable[[Path], Any] = load_model,
+                 resolver: Callable[[Path], Path] = get_latest_model):
+        self.model_dir = Path(model_dir)
+        self._loader = loader
+        self._resolver = resolver
+        self._lock = threading.Lock()
+
+        self._model = None
+        self._model_path: Optional[Path] = None
+        self._model_mtime: Optional[float] = None
+        self._dir_mtime: Optional[float] = None
+        self._known_folders: set = set()
+        self._pending_folders: dict = {}  # folder created after the last load -> its mtime
+
+        self.model_version: Optional[str] = None
+        self.last_load_time_s: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.load_count = 0
+
+    def get_model(self) -> Any:
+        """Return the cached model, loading or hot-reloading it when needed."""
+        with self._lock:
+            if self._model is None:
+                self._load()
+            elif self._is_stale():
+                try:
+                    self._load()
+                except Exception as e:
+                    print(f"[ComparisonModelCache] Reload failed, keeping model {self.model_version}: {e}")
+            return self._model
+
+    def preload(self) -> Any:
+        """Load the model ahead of the first matching cycle."""
+        return self.get_model()
+
+    def invalidate(self):
+        """Force a reload on the next ``get_model()`` call."""
+        with self._lock:
+            self._model = None
+
+    def get_metrics(self) -> dict:
+        """Load statistics of the cached model."""
+        return {
+            "model_path": str(self._model_path) if self._model_path is not None else None,
+            "model_version": self.model_version,
+            "last_load_time_s": self.last_load_time_s,
+            "loaded_at": self.loaded_at,
+            "load_count": self.load_count,
+        }
+
+    def _is_stale(self) -> bool:
+        dir_mtime = _mtime(self.model_dir)
+        pending_changed = any(_mtime(folder) != mtime for folder, mtime in self._pending_folders.items())
+        if dir_mtime != self._dir_mtime or pending_changed:
+            # Snapshot the folders before resolving so a model written meanwhile is still noticed
+            folders = self._scan_folders()
+            if Path(self._resolver(self.model_dir)) != self._model_path:
+                return True
+            # No new model yet: stop resolving on every call, but watch the new folders
+            self._dir_mtime = dir_mtime
+            self._pending_folders = {folder: mtime for folder, mtime in folders.items()
+                                     if folder not in self._known_folders}
+        return _mtime(self._model_path) != self._model_mtime
+
+    def _scan_folders(self) -> dict:
+        try:
+            return {Path(entry.path): entry.stat().st_mtime for entry in os.scandir(self.model_dir) if entry.is_dir()}
+        except OSError:
+            return {}
+
+    def _load(self):
+        dir_mtime = _mtime(self.model_dir)
+        folders = self._scan_folders()
+        model_path = Path(self._resolver(self.model_dir))
+        model_mtime = _mtime(model_path)
+
+        start = time.perf_counter()
+        model = self._loader(model_path)
+        self.last_load_time_s = time.perf_counter() - start
+
+        self._model = model
+        self._model_path = model_path
+        self._model_mtime = model_mtime
+        self._dir_mtime = dir_mtime
+        self._known_folders = set(folders)
+        self._pending_folders = {}
+        self.model_version = _model_version(model_path)
+        self.loaded_at = time.time()
+        self.load_count += 1
+        print(f"[ComparisonModelCache] Loaded model {self.model_version} in {self.last_load_time_s * 1000:.1f} ms")
+
+
+def _mtime(path: Optional[Path]) -> Optional[float]:
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _model_version(model_path: Path) -> str:
+    metadata = get_model_metadata(model_path)
+    model_id = metadata.get("model_info", {}).get("model_id")
+    if model_id:
+        return model_id
+    if model_path.parent.name.startswith("model_"):
+        return model_path.parent.name
+    return model_path.stem
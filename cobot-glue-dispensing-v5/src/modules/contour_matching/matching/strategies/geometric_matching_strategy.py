@@ -1,16 +1,27 @@
-from typing import Any
+from typing import Any, Optional
 
 import cv2
 import numpy as np
 
+from modules.contour_matching.debug.debug_plot_writer import DebugPlotWriter, get_debug_plot_writer
 from modules.contour_matching.debug.plot_generator import _create_debug_plot
 from modules.contour_matching.matching.best_match_result import BestMatchResult
 from modules.shared.core.ContourStandartized import Contour
 
 
 class GeometricMatchingStrategy:
-    def __init__(self, similarity_threshold: float = 0.8):
+    """
+    Area-ratio matching. With ``debug`` False (production) a comparison neither prints nor
+    plots; with ``debug`` True each comparison is logged and its plot is handed to
+    ``debug_writer`` (the shared DebugPlotWriter by default), which renders a sample of
+    them on its own thread.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.8, debug: bool = False,
+                 debug_writer: Optional[DebugPlotWriter] = None):
         self.similarity_threshold = similarity_threshold
+        self.debug = debug
+        self.debug_writer = debug_writer
 
     def find_best_match(
         self, workpieces: list[Any], contour: Contour
@@ -37,15 +48,24 @@ class GeometricMatchingStrategy:
 
         return best
 
-    def _getSimilarity(self,contour1, contour2, debug=True):
+    def find_best_matches(
+        self, workpieces: list[Any], contours: list[Contour]
+    ) -> list[BestMatchResult]:
+        return [self.find_best_match(workpieces, contour) for contour in contours]
+
+    def _getSimilarity(self,contour1, contour2, debug=None):
         """
         Simplified contour similarity test using only area difference.
         Returns a percentage similarity score based on area ratio.
+        ``debug`` overrides the strategy's debug flag for this comparison.
         """
-        contour1 = np.array(contour1, dtype=np.float32)
-        contour2 = np.array(contour2, dtype=np.float32)
+        if debug is None:
+            debug = self.debug
+        contour1 = np.asarray(contour1, dtype=np.float32)
+        contour2 = np.asarray(contour2, dtype=np.float32)
 
-        print(f"Calculating similarity between contours of lengths {len(contour1)} and {len(contour2)}")
+        if debug:
+            print(f"Calculating similarity between contours of lengths {len(contour1)} and {len(contour2)}")
 
         # Compute areas
         area1 = cv2.contourArea(contour1)
@@ -63,20 +83,20 @@ class GeometricMatchingStrategy:
         # Clip to [0, 100]
         similarity_percent = float(np.clip(similarity_percent, 0, 100))
 
-        # Store metrics for debugging
-        metrics = {
-            "area1": area1,
-            "area2": area2,
-            "area_diff": area_diff,
-            "area_ratio": area_ratio,
-            "similarity_percent": similarity_percent,
-            "moment_diff": 0
-        }
-
         if debug:
-            _create_debug_plot(contour1, contour2, metrics)
+            # Store metrics for debugging
+            metrics = {
+                "area1": area1,
+                "area2": area2,
+                "area_diff": area_diff,
+                "area_ratio": area_ratio,
+                "similarity_percent": similarity_percent,
+                "moment_diff": 0
+            }
+            writer = self.debug_writer or get_debug_plot_writer()
+            writer.submit(_create_debug_plot, contour1.copy(), contour2.copy(), metrics)
+            print(f"Similarity Score: {similarity_percent:.2f}% (Area Diff: {area_diff:.2f})")
 
-        print(f"Similarity Score: {similarity_percent:.2f}% (Area Diff: {area_diff:.2f})")
         return similarity_percent
 
     def debug_draw(self,best_match, contour, best_similarity, count):
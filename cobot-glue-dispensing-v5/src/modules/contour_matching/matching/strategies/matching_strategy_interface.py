@@ -10,3 +10,9 @@ class MatchingStrategy(Protocol):
         self, workpieces: list[Any], contour: Contour
     ) -> "BestMatchResult":
         ...
+
+    def find_best_matches(
+        self, workpieces: list[Any], contours: list[Contour]
+    ) -> list["BestMatchResult"]:
+        """Best match for each contour, in the same order as ``contours``."""
+        ...
@@ -1,32 +1,73 @@
 from typing import Any
 
+import numpy as np
+
 from modules.contour_matching.alignment.difference_calculator import _calculateDifferences
 from modules.contour_matching.matching.best_match_result import BestMatchResult
+from modules.contour_matching.matching.workpiece_feature_index import (
+    WorkpieceFeatureIndex,
+    get_workpiece_feature_index,
+)
 from modules.contour_matching.matching_config import DEBUG_CALCULATE_DIFFERENCES
-from modules.shape_matching_training.utils.io_utils import predict_similarity
+from modules.shape_matching_training.utils.io_utils import (
+    extract_similarity_features,
+    predict_similarity_batch,
+)
 from modules.shared.core.ContourStandartized import Contour
 
 
 class MLMatchingStrategy:
-    def __init__(self, model: Any):
+    def __init__(self, model: Any, feature_index: WorkpieceFeatureIndex = None):
         self.model = model
+        self.feature_index = feature_index if feature_index is not None else get_workpiece_feature_index()
 
     def find_best_match(
         self, workpieces: list[Any], contour: Contour
     ) -> BestMatchResult:
+        return self.find_best_matches(workpieces, [contour])[0]
+
+    def find_best_matches(
+        self, workpieces: list[Any], contours: list[Contour]
+    ) -> list[BestMatchResult]:
+        """
+        Score every contour against every workpiece with a single batched model call.
+        Workpiece features come from the feature index, contour features are extracted once.
+        """
+        if not workpieces or not contours:
+            return [BestMatchResult(workpiece=None, confidence=0.0, result="DIFFERENT") for _ in contours]
+
+        entries = self.feature_index.get_entries(workpieces)
+        workpiece_features = np.vstack([entry.features for entry in entries])
+        contour_features = np.vstack([extract_similarity_features(contour.get()) for contour in contours])
 
+        # Row i * len(workpieces) + j holds the pair (workpiece j, contour i)
+        n_workpieces = len(workpieces)
+        results, confidences = predict_similarity_batch(
+            self.model,
+            np.tile(workpiece_features, (len(contours), 1)),
+            np.repeat(contour_features, n_workpieces, axis=0),
+        )
 
+        best_matches = []
+        for i, contour in enumerate(contours):
+            pair_results = results[i * n_workpieces:(i + 1) * n_workpieces]
+            pair_confidences = confidences[i * n_workpieces:(i + 1) * n_workpieces]
+            best_matches.append(
+                self._select_best(workpieces, entries, contour, pair_results, pair_confidences)
+            )
+        return best_matches
+
+    def _select_best(self, workpieces, entries, contour, results, confidences) -> BestMatchResult:
         best = BestMatchResult(workpiece=None, confidence=0.0, result="DIFFERENT")
 
-        for wp in workpieces:
-            wp_contour = Contour(wp.get_main_contour())
-            result, confidence, _ = predict_similarity(self.model, wp_contour.get(), contour.get())
+        for wp, entry, result, confidence in zip(workpieces, entries, results, confidences):
+            confidence = float(confidence)
             wp_id = getattr(wp, "workpieceId", None)
 
             if result == "SAME":
                 if best.workpiece is None or confidence > best.confidence:
                     centroid_diff, rotation_diff, contour_angle = _calculateDifferences(
-                        wp_contour, contour, DEBUG_CALCULATE_DIFFERENCES
+                        Contour(entry.contour), contour, DEBUG_CALCULATE_DIFFERENCES
                     )
                     best = BestMatchResult(
                         workpiece=wp,
@@ -46,4 +87,3 @@ class MLMatchingStrategy:
                 )
 
         return best
-
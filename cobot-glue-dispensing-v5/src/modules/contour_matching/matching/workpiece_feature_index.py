@@ -0,0 +1,154 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from communication_layer.api.v1.topics import WorkpieceTopics
+from modules.shape_matching_training.utils.io_utils import extract_similarity_features
+from modules.shared.MessageBroker import MessageBroker
+from modules.shared.core.ContourStandartized import Contour
+
+
+def contour_signature(contour) -> str:
+    """Content hash of a contour, used to detect when stored features are stale."""
+    points = np.ascontiguousarray(contour, dtype=np.float32)
+    return hashlib.blake2b(points.tobytes(), digest_size=16).hexdigest()
+
+
+@dataclass
+class IndexedWorkpiece:
+    """Cached similarity features of a single workpiece main contour."""
+    signature: str
+    contour: np.ndarray
+    features: np.ndarray
+
+
+class WorkpieceFeatureIndex:
+    """
+    In-memory index of similarity features for stored workpieces.
+
+    Features of each workpiece main contour are extracted once and reused across
+    matching cycles. The index follows the workpiece repository through the
+    WorkpieceTopics broker topics: it is rebuilt when the repository loads its data
+    and updated incrementally when a single workpiece is saved or deleted.
+    Workpieces that reach the index without a repository event (or whose contour
+    changed since indexing) are re-extracted lazily on lookup.
+    """
+
+    def __init__(self, feature_extractor: Callable[[np.ndarray], list] = extract_similarity_features,
+                 subscribe: bool = True):
+        self._extract = feature_extractor
+        self._entries: dict[str, IndexedWorkpiece] = {}
+        self._lock = threading.Lock()
+        self.extractions = 0
+
+        if subscribe:
+            broker = MessageBroker()
+            broker.subscribe(WorkpieceTopics.WORKPIECES_LOADED, self.on_workpieces_loaded)
+            broker.subscribe(WorkpieceTopics.WORKPIECE_SAVED, self.on_workpiece_saved)
+            broker.subscribe(WorkpieceTopics.WORKPIECE_DELETED, self.on_workpiece_deleted)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, workpiece_id):
+        return str(workpiece_id) in self._entries
+
+    def __getstate__(self):
+        # Copies sent to matching worker processes carry the entries but not the lock
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def build(self, workpieces: list[Any]):
+        """Replace the index content with the features of ``workpieces``."""
+        entries = {}
+        for wp in workpieces:
+            workpiece_id = getattr(wp, "workpieceId", None)
+            if workpiece_id is None:
+                continue
+            entries[str(workpiece_id)] = self._index_entry(wp)
+        with self._lock:
+            self._entries = entries
+
+    def update(self, workpiece: Any):
+        """Add or refresh a single workpiece."""
+        workpiece_id = getattr(workpiece, "workpieceId", None)
+        if workpiece_id is None:
+            return
+        entry = self._index_entry(workpiece)
+        with self._lock:
+            self._entries[str(workpiece_id)] = entry
+
+    def remove(self, workpiece_id):
+        """Drop a workpiece from the index."""
+        with self._lock:
+            self._entries.pop(str(workpiece_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+    def get_entries(self, workpieces: list[Any]) -> list[IndexedWorkpiece]:
+        """
+        Return the indexed entries for ``workpieces`` in the same order.
+        Missing or stale entries are extracted and stored on the fly.
+        """
+        result = []
+        for wp in workpieces:
+            workpiece_id = getattr(wp, "workpieceId", None)
+            contour = Contour(wp.get_main_contour()).get()
+            key = str(workpiece_id) if workpiece_id is not None else None
+
+            with self._lock:
+                entry = self._entries.get(key) if key is not None else None
+            if entry is None or entry.signature != contour_signature(contour):
+                entry = self._index_entry(wp, contour)
+                if key is not None:
+                    with self._lock:
+                        self._entries[key] = entry
+            result.append(entry)
+        return result
+
+    def get_feature_matrix(self, workpieces: list[Any]) -> np.ndarray:
+        """Return a (len(workpieces), n_features) matrix of workpiece features."""
+        entries = self.get_entries(workpieces)
+        if not entries:
+            return np.empty((0, 0))
+        return np.vstack([entry.features for entry in entries])
+
+    # Broker callbacks
+
+    def on_workpieces_loaded(self, workpieces):
+        self.build(workpieces or [])
+
+    def on_workpiece_saved(self, workpiece):
+        self.update(workpiece)
+
+    def on_workpiece_deleted(self, workpiece_id):
+        self.remove(workpiece_id)
+
+    def _index_entry(self, workpiece: Any, contour: Optional[np.ndarray] = None) -> IndexedWorkpiece:
+        if contour is None:
+            contour = Contour(workpiece.get_main_contour()).get()
+        self.extractions += 1
+        return IndexedWorkpiece(signature=contour_signature(contour),
+                                contour=contour,
+                                features=np.asarray(self._extract(contour), dtype=np.float64))
+
+
+_workpiece_feature_index: Optional[WorkpieceFeatureIndex] = None
+
+
+def get_workpiece_feature_index() -> WorkpieceFeatureIndex:
+    """Get the process-wide workpiece feature index."""
+    global _workpiece_feature_index
+    if _workpiece_feature_index is None:
+        _workpiece_feature_index = WorkpieceFeatureIndex()
+    return _workpiece_feature_index
@@ -0,0 +1,69 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+EXECUTOR_SERIAL = "serial"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+class MatchingExecutor:
+    """
+    Worker pool for matching and aligning detected contours, kept alive across cycles.
+
+    ``kind`` selects a thread pool (default; cv2, NumPy and sklearn release the GIL in
+    their heavy calls), a process pool (functions and arguments must be picklable) or
+    serial execution. ``map`` always returns results in input order, so the output of a
+    cycle does not depend on which worker finished first. Work with a single item runs
+    in the calling thread.
+    """
+
+    def __init__(self, kind: str = EXECUTOR_THREAD, max_workers: Optional[int] = None):
+        if kind not in (EXECUTOR_SERIAL, EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(f"Invalid executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def parallel(self) -> bool:
+        return self.kind != EXECUTOR_SERIAL and self.max_workers > 1
+
+    def map(self, fn: Callable, items: Iterable) -> List:
+        """Apply ``fn`` to every item, in parallel when possible, and return the results in order."""
+        items = list(items)
+        if len(items) <= 1 or not self.parallel:
+            return [fn(item) for item in items]
+        pool = self._get_pool()
+        return list(pool.map(fn, items))
+
+    def split(self, items: list) -> List[list]:
+        """Split ``items`` into at most ``max_workers`` contiguous, order-preserving chunks."""
+        n_chunks = min(len(items), self.max_workers if self.parallel else 1)
+        if n_chunks <= 1:
+            return [items] if items else []
+        size, extra = divmod(len(items), n_chunks)
+        chunks, start = [], 0
+        for i in range(n_chunks):
+            end = start + size + (1 if i < extra else 0)
+            chunks.append(items[start:end])
+            start = end
+        return chunks
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                if self.kind == EXECUTOR_PROCESS:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="ContourMatching")
+            return self._pool
@@ -476,6 +476,92 @@ def load_dataset(filepath: Union[str, Path]) -> Tuple[List, List]:
     return data['pairs'], data['labels']
 
 
+# Feature extractors used by the matching models (same features as original system)
+SIMILARITY_EXTRACTOR_CONFIGS = [
+    {'name': 'geometric'},
+    {'name': 'hu', 'config': {'use_log_transform': True}}
+]
+
+# Confidence band in which a prediction is reported as UNCERTAIN
+SIMILARITY_CONF_LOW = 0.8
+SIMILARITY_CONF_HIGH = 0.95
+
+_similarity_extractor = None
+
+
+def get_similarity_feature_extractor():
+    """
+    Get the composite geometric + Hu feature extractor used for similarity prediction.
+
+    The extractor is created once and reused, since the extractors hold no per-contour state.
+    """
+    global _similarity_extractor
+    if _similarity_extractor is None:
+        from ..core.features.base_extractor import FeatureExtractorFactory
+        _similarity_extractor = FeatureExtractorFactory.create_composite_extractor(SIMILARITY_EXTRACTOR_CONFIGS)
+    return _similarity_extractor
+
+
+def extract_similarity_features(contour) -> List[float]:
+    """
+    Extract the per-contour half of the similarity feature vector.
+
+    Args:
+        contour: Contour (numpy array)
+
+    Returns:
+        List of features for the contour
+    """
+    return get_similarity_feature_extractor().extract_features(contour)
+
+
+def classify_similarity(prediction, confidence) -> str:
+    """
+    Map a model prediction and its confidence to "SAME", "DIFFERENT" or "UNCERTAIN".
+
+    Args:
+        prediction: Predicted class (1 = SAME, otherwise DIFFERENT)
+        confidence: Probability of the predicted class
+
+    Returns:
+        Similarity result string
+    """
+    if SIMILARITY_CONF_LOW < confidence < SIMILARITY_CONF_HIGH:
+        return "UNCERTAIN"
+    if prediction == 1:  # SAME
+        return "DIFFERENT" if confidence < SIMILARITY_CONF_LOW else "SAME"
+    # DIFFERENT
+    return "SAME" if confidence < SIMILARITY_CONF_LOW else "DIFFERENT"
+
+
+def predict_similarity_batch(model, features1, features2):
+    """
+    Predict similarity for many contour pairs with a single model call per method.
+
+    Args:
+        model: Trained model (should have predict and predict_proba methods)
+        features1: Array-like of shape (n_pairs, n_features) with features of the first contours
+        features2: Array-like of shape (n_pairs, n_features) with features of the second contours
+
+    Returns:
+        Tuple of (results, confidences) where:
+        - results: List of "SAME", "DIFFERENT" or "UNCERTAIN", one per pair
+        - confidences: numpy array of confidence scores (0-1), one per pair
+    """
+    import numpy as np
+
+    features = np.hstack([np.asarray(features1, dtype=np.float64),
+                          np.asarray(features2, dtype=np.float64)])
+    if len(features) == 0:
+        return [], np.empty(0)
+
+    predictions = model.predict(features)
+    confidences = model.predict_proba(features).max(axis=1)
+    results = [classify_similarity(prediction, confidence)
+               for prediction, confidence in zip(predictions, confidences)]
+    return results, confidences
+
+
 def predict_similarity(model, contour1, contour2):
     """
     Compatibility function for the old predict_similarity interface.
@@ -493,18 +579,9 @@ def predict_similarity(model, contour1, contour2):
         - confidence: Confidence score (0-1)
         - features: Extracted features used for prediction
     """
-    from ..core.features.base_extractor import FeatureExtractorFactory
-    
-    # Create feature extractor (using same features as original system)
-    extractor_configs = [
-        {'name': 'geometric'},
-        {'name': 'hu', 'config': {'use_log_transform': True}}
-    ]
-    extractor = FeatureExtractorFactory.create_composite_extractor(extractor_configs)
-    
     # Extract features from both contours
-    features1 = extractor.extract_features(contour1)
-    features2 = extractor.extract_features(contour2)
+    features1 = extract_similarity_features(contour1)
+    features2 = extract_similarity_features(contour2)
     
     # Combine features (same as old compute_enhanced_features)
     features = features1 + features2
@@ -514,24 +591,4 @@ def predict_similarity(model, contour1, contour2):
     probability = model.predict_proba([features])[0]
     confidence = max(probability)
     
-    # Apply confidence thresholds (same logic as old system)
-    if prediction == 1:  # SAME
-        conf_low = 0.8
-        conf_high = 0.95
-        
-        if conf_low < confidence < conf_high:
-            return "UNCERTAIN", confidence, features
-        elif confidence < conf_low:
-            return "DIFFERENT", confidence, features
-        else:
-            return "SAME", confidence, features
-    else:  # DIFFERENT
-        conf_low = 0.8
-        conf_high = 0.95
-        
-        if conf_low < confidence < conf_high:
-            return "UNCERTAIN", confidence, features
-        elif confidence < conf_low:
-            return "SAME", confidence, features
-        else:
-            return "DIFFERENT", confidence, features
\ No newline at end of file
+    return classify_similarity(prediction, confidence), confidence, features
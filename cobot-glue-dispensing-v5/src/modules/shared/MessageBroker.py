@@ -1,6 +1,90 @@
 import logging
+import threading
 import weakref
-from typing import Dict, List, Any, Callable
+from collections import deque
+from enum import Enum
+from typing import Dict, List, Any, Callable, Optional
+
+
+class OverflowPolicy(Enum):
+    """What an async topic does when its queue is full"""
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued message, keep the new one
+    DROP_NEWEST = "drop_newest"  # discard the message being published
+    BLOCK = "block"              # wait until the worker frees a slot
+
+
+class _TopicWorker:
+    """Bounded message queue with a daemon thread that delivers one topic's messages"""
+
+    def __init__(self, topic: str, deliver: Callable[[str, Any], None], max_queue_size: int,
+                 overflow_policy: OverflowPolicy, block_timeout: Optional[float]):
+        self.topic = topic
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.delivered = 0
+
+        self._deliver = deliver
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"MessageBroker[{topic}]", daemon=True)
+        self._thread.start()
+
+    def put(self, message: Any) -> bool:
+        """Queue a message; returns False if it was dropped"""
+        with self._condition:
+            if len(self._queue) >= self.max_queue_size:
+                if self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif not self._condition.wait_for(
+                        lambda: len(self._queue) < self.max_queue_size or not self._running,
+                        timeout=self.block_timeout):
+                    self.dropped += 1
+                    return False
+            if not self._running:
+                return False
+            self._queue.append(message)
+            self._condition.notify_all()
+            return True
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the worker; messages still queued are discarded"""
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._condition.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or not self._running)
+                if not self._running:
+                    return
+                message = self._queue.popleft()
+                self._condition.notify_all()
+            try:
+                self._deliver(self.topic, message)
+                self.delivered += 1
+            except Exception as e:
+                logging.getLogger("MessageBroker").error(f"Async delivery failed for topic '{self.topic}': {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "queued": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "overflow_policy": self.overflow_policy.value,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+            }
 
 
 class MessageBroker:
@@ -14,6 +98,8 @@ class MessageBroker:
 
     def _init(self):
         self.subscribers: Dict[str, List[weakref.ref]] = {}
+        self.async_workers: Dict[str, _TopicWorker] = {}
+        self._async_lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def subscribe(self, topic: str, callback: Callable):
@@ -71,10 +157,61 @@ class MessageBroker:
         if removed_count > 0:
             self.logger.debug(f"Unsubscribed {removed_count} callback(s) from topic '{topic}'")
 
+    def configure_async_topic(self, topic: str, max_queue_size: int = 1,
+                              overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                              block_timeout: Optional[float] = None):
+        """
+        Deliver messages of a topic on a dedicated worker thread instead of the publisher's thread.
+
+        publish() only queues the message; subscribers run on the worker in publish order.
+        request() on the topic stays synchronous. Calling it again replaces the current configuration.
+
+        Args:
+            topic: Topic name
+            max_queue_size: Maximum number of undelivered messages
+            overflow_policy: What publish() does when the queue is full
+            block_timeout: Max seconds publish() waits with OverflowPolicy.BLOCK (None = forever)
+        """
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be >= 1, got {max_queue_size}")
+        worker = _TopicWorker(topic, self._deliver, max_queue_size, overflow_policy, block_timeout)
+        with self._async_lock:
+            previous = self.async_workers.get(topic)
+            self.async_workers[topic] = worker
+        if previous is not None:
+            previous.stop()
+        self.logger.debug(f"Topic '{topic}' delivers asynchronously (queue={max_queue_size}, policy={overflow_policy.value})")
+
+    def configure_sync_topic(self, topic: str):
+        """Return a topic to synchronous delivery on the publisher's thread"""
+        with self._async_lock:
+            worker = self.async_workers.pop(topic, None)
+        if worker is not None:
+            worker.stop()
+            self.logger.debug(f"Topic '{topic}' delivers synchronously")
+
+    def is_async_topic(self, topic: str) -> bool:
+        return topic in self.async_workers
+
+    def get_async_topic_stats(self, topic: str) -> Optional[Dict[str, Any]]:
+        """Queue/delivery/drop counters of an async topic, None for synchronous topics"""
+        worker = self.async_workers.get(topic)
+        return worker.get_stats() if worker is not None else None
+
     def publish(self, topic: str, message: Any):
         """Publish message to all live subscribers"""
         # print(f"[MessageBroker] Publishing to topic '{topic}' message: {message}")
 
+        worker = self.async_workers.get(topic)
+        if worker is not None:
+            if topic in self.subscribers:
+                worker.put(message)
+            return
+
+        self._deliver(topic, message)
+
+    def _deliver(self, topic: str, message: Any):
+        """Call all live subscribers of a topic on the current thread"""
         if topic not in self.subscribers:
             # print(f"[MessageBroker] WARNING: No subscribers for topic '{topic}'")
             self.logger.debug(f"No subscribers for topic '{topic}'")
@@ -83,7 +220,8 @@ class MessageBroker:
         live_callbacks = []
         dead_refs = []
 
-        for weak_ref in self.subscribers[topic]:
+        # Async workers deliver concurrently with (un)subscribe calls, so never assume the topic still exists
+        for weak_ref in self.subscribers.get(topic, []):
             callback = weak_ref()
             if callback is not None:
                 live_callbacks.append(callback)
@@ -93,7 +231,7 @@ class MessageBroker:
         # Remove dead references
         if dead_refs:
             self.subscribers[topic] = [
-                ref for ref in self.subscribers[topic]
+                ref for ref in self.subscribers.get(topic, [])
                 if ref not in dead_refs
             ]
             self.logger.debug(f"Cleaned up {len(dead_refs)} dead references for topic '{topic}'")
@@ -122,8 +260,8 @@ class MessageBroker:
             self.logger.warning(f"Failed to publish to {failed_calls} subscribers for topic '{topic}'")
 
         # Clean up empty topic
-        if not self.subscribers[topic]:
-            del self.subscribers[topic]
+        if not self.subscribers.get(topic, True):
+            self.subscribers.pop(topic, None)
 
     def get_subscriber_count(self, topic: str) -> int:
         """Get the number of active subscribers for a topic"""
@@ -179,6 +317,14 @@ class MessageBroker:
         self.subscribers.clear()
         self.logger.debug(f"Cleared all {total_cleared} subscribers from all topics")
 
+    def stop_async_topics(self):
+        """Stop every async topic worker and return all topics to synchronous delivery"""
+        with self._async_lock:
+            workers = list(self.async_workers.values())
+            self.async_workers.clear()
+        for worker in workers:
+            worker.stop()
+
 
 # Example usage and testing:
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import cv2
 import numpy as np
 
@@ -39,37 +41,82 @@ def standardize_point(point, dtype=np.float32):
     return point.reshape(-1, 2)
 
 
-def is_contour_inside_polygon(contour, top_left, top_right, bottom_right, bottom_left):
+class PolygonMask:
     """
-    Fixed version using a different approach - checking if contour bounding rect is inside polygon
-    """
-    # Get the bounding rectangle of the contour
-    x, y, w, h = cv2.boundingRect(contour)
-
-    # Check if all 4 corners of the contour's bounding rect are inside the polygon
-    bbox_points = [top_left, top_right, bottom_right, bottom_left]
-    polygon = np.array(bbox_points, dtype=np.int32)
+    Rasterized polygon for fast containment tests of whole contours.
 
-    contour_corners = [
-        (x, y),  # top-left
-        (x + w, y),  # top-right
-        (x + w, y + h),  # bottom-right
-        (x, y + h)  # bottom-left
-    ]
+    The polygon is filled once into a mask covering its bounding rectangle. A contour
+    is inside when every one of its points falls on a set mask pixel, which is checked
+    with a single array lookup instead of one cv2.pointPolygonTest call per point.
+    Pixels on the polygon edge count as inside, like pointPolygonTest(...) >= 0.
 
-    # Check if all corners of contour bounding rect are inside the polygon
+    Contours whose bounding box leaves the polygon's bounding box are rejected without
+    touching the mask. For convex polygons a contour whose bounding box corners are all
+    inside is accepted without looking at its points.
+    """
 
-    for corner in contour_corners:
-        if cv2.pointPolygonTest(polygon, (float(corner[0]), float(corner[1])), False) < 0:
+    SUBPIXEL_SHIFT = 4  # fractional bits used when rasterizing float polygon corners
+
+    def __init__(self, polygon):
+        points = standardize_contour(polygon, dtype=np.float64)
+        if len(points) < 3:
+            raise ValueError("A polygon needs at least 3 points")
+
+        self.x0 = int(np.floor(points[:, 0].min()))
+        self.y0 = int(np.floor(points[:, 1].min()))
+        self.x1 = int(np.ceil(points[:, 0].max()))
+        self.y1 = int(np.ceil(points[:, 1].max()))
+
+        scale = 1 << self.SUBPIXEL_SHIFT
+        local = np.round((points - (self.x0, self.y0)) * scale).astype(np.int32).reshape(-1, 1, 2)
+        mask = np.zeros((self.y1 - self.y0 + 1, self.x1 - self.x0 + 1), dtype=np.uint8)
+        cv2.fillPoly(mask, [local], 1, lineType=cv2.LINE_8, shift=self.SUBPIXEL_SHIFT)
+        # fillPoly leaves out some pixels the edge passes through; draw the outline too
+        cv2.polylines(mask, [local], True, 1, lineType=cv2.LINE_8, shift=self.SUBPIXEL_SHIFT)
+        self.mask = mask.astype(bool)
+        self.is_convex = bool(cv2.isContourConvex(local))
+
+    def contains_points(self, points):
+        """Boolean array telling for each point whether it lies inside the polygon."""
+        points = np.rint(standardize_contour(points, dtype=np.float64)).astype(np.int64)
+        xs = points[:, 0] - self.x0
+        ys = points[:, 1] - self.y0
+        result = (xs >= 0) & (ys >= 0) & (xs < self.mask.shape[1]) & (ys < self.mask.shape[0])
+        result[result] = self.mask[ys[result], xs[result]]
+        return result
+
+    def contains_contour(self, contour):
+        """True if every point of the contour lies inside the polygon."""
+        points = standardize_contour(contour, dtype=np.float64)
+        if len(points) == 0:
             return False
 
-    # Additional check: verify all actual contour points are inside
-    for point in contour:
-        px, py = point[0]
-        if cv2.pointPolygonTest(polygon, (float(px), float(py)), False) < 0:
+        min_x, min_y = points.min(axis=0)
+        max_x, max_y = points.max(axis=0)
+        if min_x < self.x0 or min_y < self.y0 or max_x > self.x1 or max_y > self.y1:
             return False
 
-    return True
+        if self.is_convex:
+            corners = [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
+            if self.contains_points(corners).all():
+                return True
+
+        return bool(self.contains_points(points).all())
+
+
+@lru_cache(maxsize=8)
+def _cached_polygon_mask(corners):
+    return PolygonMask(np.array(corners, dtype=np.float64))
+
+
+def is_contour_inside_polygon(contour, top_left, top_right, bottom_right, bottom_left):
+    """
+    Checks that every point of the contour lies inside the quadrilateral given by its corners.
+    The rasterized polygon is cached, so repeated calls with the same corners only pay for the lookup.
+    """
+    corners = tuple(tuple(float(v) for v in np.asarray(corner).reshape(-1)[:2])
+                    for corner in (top_left, top_right, bottom_right, bottom_left))
+    return _cached_polygon_mask(corners).contains_contour(contour)
 
 def flatten_and_convert_to_list(contour_array):
     """Ensure contour array is Nx2 list of floats."""
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import cv2
 from matplotlib import pyplot as plt
 
@@ -237,103 +239,100 @@ def compute_tcp_dynamic_offset(base_x_offset, base_y_offset, current_x, current_
     return adjusted_x_offset, adjusted_y_offset
 
 
-def applyTransformation(cameraToRobotMatrix, contours, apply_transducer_offset=True, 
-                      x_offset=-2.528, y_offset=78.335,dynamic_offsets_config=None):
+# Default transducer geometry offset (mm) applied after the camera-to-robot homography at rz=0
+TRANSDUCER_X_OFFSET = -2.528
+TRANSDUCER_Y_OFFSET = 78.335
+# Number of distinct homographies kept by get_homography_transform
+HOMOGRAPHY_CACHE_SIZE = 4
+
+
+class HomographyTransform:
+    """
+    Camera-to-robot homography prepared for batched point transforms.
+
+    All points of all contours are projected in one NumPy pass and returned as float64 arrays
+    rounded to 6 decimals. Obtain instances through get_homography_transform so a calibration
+    matrix is only converted once.
+    """
+
+    def __init__(self, cameraToRobotMatrix):
+        self.matrix = np.asarray(cameraToRobotMatrix, dtype=np.float64).reshape(3, 3)
+
+    def transform_points(self, points, offset=None):
+        """
+        Transform an (N, 2) / (N, 1, 2) / list of (x, y) point set.
+
+        Args:
+            points: Points in camera coordinates.
+            offset: Optional (x, y) offset in mm added after the homography.
+
+        Returns:
+            np.ndarray: (N, 2) array of robot coordinates.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        projected = points @ self.matrix[:, :2].T + self.matrix[:, 2]
+        transformed = projected[:, :2] / projected[:, 2:3]
+        if offset is not None:
+            transformed += np.asarray(offset, dtype=np.float64)
+        return np.round(transformed, decimals=6)
+
+    def transform_contours(self, contours, offset=None):
+        """Transform a list of contours together; returns one (N_i, 2) array per contour."""
+        arrays = [np.asarray(contour, dtype=np.float64).reshape(-1, 2) for contour in contours]
+        if not arrays:
+            return []
+        transformed = self.transform_points(np.concatenate(arrays), offset)
+        split_at = np.cumsum([len(array) for array in arrays])[:-1]
+        return np.split(transformed, split_at)
+
+
+@lru_cache(maxsize=HOMOGRAPHY_CACHE_SIZE)
+def _cached_homography_transform(matrix_bytes):
+    return HomographyTransform(np.frombuffer(matrix_bytes, dtype=np.float64))
+
+
+def get_homography_transform(cameraToRobotMatrix):
+    """Return the HomographyTransform for this matrix, reusing it while the calibration is unchanged."""
+    matrix = np.ascontiguousarray(cameraToRobotMatrix, dtype=np.float64)
+    return _cached_homography_transform(matrix.tobytes())
+
+
+def applyTransformation(cameraToRobotMatrix, contours, apply_transducer_offset=True,
+                      x_offset=TRANSDUCER_X_OFFSET, y_offset=TRANSDUCER_Y_OFFSET, dynamic_offsets_config=None):
 
     """
     Applies a perspective transformation to a list of contours using a provided camera-to-robot transformation matrix,
     with optional transducer geometry offset correction applied after the homography transformation.
 
-    This function takes in a camera-to-robot transformation matrix and a list of contours (each contour being a list of points),
-    applies the transformation matrix to each contour, and optionally applies transducer geometry offsets at rz=0 
-    (no rotation), assuming the rotation will be handled later in the robot path generation.
+    All contours are transformed in one batched pass (see HomographyTransform); use
+    get_homography_transform directly to get NumPy arrays instead of nested lists.
 
     Args:
         cameraToRobotMatrix (numpy.ndarray): A 3x3 matrix representing the transformation from the camera's coordinate system
-                                              to the robot's coordinate system. This matrix should be of type `float32`.
+                                              to the robot's coordinate system.
         contours (list): A list of contours, where each contour is a list of points (2D coordinates) in the form of tuples or lists.
                          The points within each contour should be in the form (x, y).
         apply_transducer_offset (bool): Whether to apply transducer geometry offset correction. Default is True.
-        x_offset (float): The X offset in millimeters for transducer geometry correction. Default is 15.0.
-        y_offset (float): The Y offset in millimeters for transducer geometry correction. Default is 5.0.
+        x_offset (float): The X offset in millimeters for transducer geometry correction.
+        y_offset (float): The Y offset in millimeters for transducer geometry correction.
+        dynamic_offsets_config: Unused, kept for callers of the dynamic offset experiment.
 
     Returns:
-        list: A list of transformed contours, where each contour is a list of transformed points. Each transformed point is
-              represented as a tuple (x, y) with 6 decimal places precision, with optional offset correction applied.
+        list: A list of transformed contours, each in OpenCV layout [[[x, y]], [[x, y]], ...] with points rounded
+              to 6 decimal places, with optional offset correction applied.
 
     Example:
         cameraToRobotMatrix = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]], dtype=np.float32)
         contours = [[(0, 0), (1, 0), (1, 1), (0, 1)], [(2, 2), (3, 2), (3, 3), (2, 3)]]
         transformed_contours = applyTransformation(cameraToRobotMatrix, contours)
-        print(transformed_contours)
 
     Notes:
-        - The input `contours` should be a list where each contour is a list of points in the format [(x1, y1), (x2, y2), ...].
-        - The transformation matrix `cameraToRobotMatrix` is assumed to be a valid 3x3 matrix for perspective transformation.
-        - The function rounds the output points to 6 decimal places for precision control.
         - Transducer offsets are applied AFTER the homography transformation at rz=0 (no rotation).
         - The actual rotation of the transducer will be handled later in the robot path generation phase.
-        :param dynamic_offsets_config:
-    """
-    transformedContours = []
-    print("Camera to Robot Matrix:\n", cameraToRobotMatrix)
-    print("Contours to be transformed:", contours)
-    print(f"Transducer offset settings: apply={apply_transducer_offset}, x_offset={x_offset}, y_offset={y_offset}")
-
-    for contour_idx, contour in enumerate(contours):
-        print(f"In loop contour {contour_idx}: {contour}")
-        # Convert contour to a numpy array and reshape it for perspective transformation
-        contour = np.array(contour, dtype=np.float32).reshape(-1, 1, 2)
-
-        # Apply perspective transformation using the camera-to-robot matrix
-        transformed_points = cv2.perspectiveTransform(contour, cameraToRobotMatrix)
-
-        # Apply transducer geometry offset correction AFTER homography transformation
-        # Offsets are applied at rz=0 (no rotation) since rotation will be handled in robot path generation
-        if apply_transducer_offset:
-            print(f"Applying transducer geometry offset to contour {contour_idx} (at rz=0)")
-            
-            print(f"   Applying offsets: ({x_offset:.2f}, {y_offset:.2f}) mm")
-            
-            # Apply the offsets directly to all points (no rotation since rz=0)
-            for point_idx in range(transformed_points.shape[0]):
-                original_x = transformed_points[point_idx, 0, 0]
-                original_y = transformed_points[point_idx, 0, 1]
-
-                # dynamic_offsets_config = None
-                # if dynamic_offsets_config is not None:
-                # x_distance, x_step_offset, y_distance, y_step_offset, direction_map = dynamic_offsets_config
-
-                # # Call the new function
-                # dynamic_x_offset, dynamic_y_offset = compute_dynamic_tcp_offset_new(
-                #     base=(x_offset, y_offset),
-                #     current=(original_x, original_y),
-                #     base_offset=(x_offset, y_offset),
-                #     offset_step=(x_step_offset, y_step_offset),
-                #     offset_direction_map=direction_map
-                # )
-                # print(f"Calculated dynamic offsets x->{dynamic_x_offset} y->{dynamic_y_offset}")
-                # else:
-                dynamic_x_offset = x_offset
-                dynamic_y_offset = y_offset
-
-                # Apply offset directly (no rotation)
-                print(f"Apply offsets {(dynamic_x_offset, dynamic_y_offset)} to point {point_idx}")
-                transformed_points[point_idx, 0, 0] = original_x + dynamic_x_offset
-                transformed_points[point_idx, 0, 1] = original_y + dynamic_y_offset
-                
-                if point_idx < 3:  # Debug first few points
-                    print(f"   Point {point_idx}: ({original_x:.2f}, {original_y:.2f}) -> "
-                          f"({transformed_points[point_idx, 0, 0]:.2f}, {transformed_points[point_idx, 0, 1]:.2f})")
-
-        # Round the transformed points to 6 decimal places
-        transformed_points = np.round(transformed_points, decimals=6)
-
-        # Append the transformed points as a list of tuples
-        transformedContours.append(transformed_points.tolist())
-        print(f"Transformed contour {contour_idx} added to transformedContours with {len(transformed_points)} points")
-        
-    return transformedContours
+    """
+    offset = (x_offset, y_offset) if apply_transducer_offset else None
+    transformed = get_homography_transform(cameraToRobotMatrix).transform_contours(contours, offset)
+    return [points.reshape(-1, 1, 2).tolist() for points in transformed]
 
 
 def shrinkContour(contourParam, offset_x, offset_y):
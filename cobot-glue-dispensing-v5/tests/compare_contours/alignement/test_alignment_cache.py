@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from modules.contour_matching.alignment import contour_aligner
+from modules.contour_matching.alignment.alignment_cache import AlignmentCache
+from modules.contour_matching.alignment.contour_aligner import align_single_contour
+from modules.contour_matching.alignment.mask_refinement import _refine_alignment_with_mask, _rotate_contour
+from modules.shared.core.ContourStandartized import Contour
+
+
+def make_l_shape(cx, cy):
+    pts = np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 160], [0, 160]], dtype=np.float32)
+    return (pts + [cx - 80, cy - 60]).reshape(-1, 1, 2)
+
+
+def test_signature_is_stable_for_the_same_pose():
+    contour = make_l_shape(400, 400)
+
+    assert AlignmentCache.signature(contour, 7) == AlignmentCache.signature(contour + 0.4, "7")
+
+
+def test_signature_changes_with_pose_and_workpiece():
+    contour = make_l_shape(400, 400)
+    centroid = Contour(contour).getCentroid()
+    key = AlignmentCache.signature(contour, 7)
+
+    assert AlignmentCache.signature(contour + 50, 7) != key
+    assert AlignmentCache.signature(contour, 8) != key
+    assert AlignmentCache.signature(_rotate_contour(contour, 30, centroid), 7) != key
+
+
+def test_degenerate_contour_has_no_signature():
+    line = np.array([[0, 0], [10, 0], [20, 0]], dtype=np.float32)
+
+    assert AlignmentCache.signature(line, 1) is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = AlignmentCache(max_entries=2)
+    cache.put(("a",), 1.0, 0.9)
+    cache.put(("b",), 2.0, 0.9)
+    cache.get(("a",))
+    cache.put(("c",), 3.0, 0.9)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)).rotation == 1.0
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_refinement_from_cached_rotation_skips_coarse_search():
+    target = make_l_shape(400, 400)
+    centroid = Contour(target).getCentroid()
+    workpiece = _rotate_contour(target, -37, centroid).astype(np.float32)
+
+    with patch("modules.contour_matching.alignment.mask_refinement._coarse_search") as coarse:
+        rotation, overlap = _refine_alignment_with_mask(workpiece, target, initial_rotation=36.0, min_overlap=0.9)
+
+    coarse.assert_not_called()
+    assert rotation == pytest.approx(37, abs=1.0)
+    assert overlap > 0.95
+
+
+def test_wrong_cached_rotation_falls_back_to_full_search():
+    target = make_l_shape(400, 400)
+    centroid = Contour(target).getCentroid()
+    workpiece = _rotate_contour(target, -37, centroid).astype(np.float32)
+
+    rotation, overlap = _refine_alignment_with_mask(workpiece, target, initial_rotation=-120.0, min_overlap=0.95)
+
+    assert rotation == pytest.approx(37, abs=1.0)
+    assert overlap > 0.95
+
+
+def test_align_single_contour_uses_and_fills_cache():
+    cache = AlignmentCache()
+    reference = make_l_shape(400, 400)
+    key = AlignmentCache.signature(reference, 1)
+
+    with patch.object(contour_aligner, "_refine_alignment_with_mask", return_value=(20.0, 0.97)) as refine:
+        align_single_contour(Contour(reference.copy()), reference, alignment_cache=cache, cache_key=key)
+        assert refine.call_args.kwargs == {}
+
+        align_single_contour(Contour(reference.copy()), reference, alignment_cache=cache, cache_key=key)
+        assert refine.call_args.kwargs["initial_rotation"] == 20.0
+        assert refine.call_args.kwargs["min_overlap"] == pytest.approx(0.97 - contour_aligner.MAX_OVERLAP_DROP)
+
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_cache_hits_do_not_lower_the_reference_overlap():
+    cache = AlignmentCache()
+    reference = make_l_shape(400, 400)
+    key = AlignmentCache.signature(reference, 1)
+    overlaps = iter([0.97, 0.95, 0.93, 0.91])
+
+    def refine(*args, **kwargs):
+        return 20.0, next(overlaps)
+
+    with patch.object(contour_aligner, "_refine_alignment_with_mask", side_effect=refine) as refine_mock:
+        for _ in range(4):
+            align_single_contour(Contour(reference.copy()), reference, alignment_cache=cache, cache_key=key)
+
+    assert refine_mock.call_args.kwargs["min_overlap"] == pytest.approx(0.97 - contour_aligner.MAX_OVERLAP_DROP)
+    assert cache.get(key).overlap == pytest.approx(0.97)
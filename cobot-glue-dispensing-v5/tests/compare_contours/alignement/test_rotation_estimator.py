@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from modules.contour_matching.alignment.mask_refinement import _refine_alignment_with_mask, _rotate_contour
+from modules.contour_matching.alignment.rotation_estimator import (
+    centroid_distance_profile, estimate_rotation_candidates
+)
+from modules.shared.core.ContourStandartized import Contour
+
+
+def make_l_shape(cx, cy):
+    pts = np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 160], [0, 160]], dtype=np.float32)
+    return (pts + [cx - 80, cy - 60]).reshape(-1, 1, 2)
+
+
+def make_circle(cx, cy, r, n=90):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.column_stack([cx + r * np.cos(t), cy + r * np.sin(t)]).astype(np.float32)
+
+
+def angle_error(a, b):
+    return abs((a - b + 180) % 360 - 180)
+
+
+def test_profile_shifts_with_rotation():
+    contour = make_l_shape(400, 400)
+    centroid = Contour(contour).getCentroid()
+    rotated = _rotate_contour(contour, 90, centroid)
+
+    profile = centroid_distance_profile(contour, centroid)
+    rotated_profile = centroid_distance_profile(rotated, centroid)
+
+    assert np.allclose(np.roll(profile, 90), rotated_profile, atol=2.0)
+
+
+@pytest.mark.parametrize("rotation", [-150, -37, 0, 12.5, 95, 179])
+def test_best_candidate_recovers_rotation(rotation):
+    target = make_l_shape(400, 400)
+    target_centroid = Contour(target).getCentroid()
+    workpiece = _rotate_contour(target, -rotation, target_centroid) + np.float32([30, -20])
+    workpiece_centroid = Contour(workpiece).getCentroid()
+
+    candidates = estimate_rotation_candidates(workpiece, target, workpiece_centroid, target_centroid)
+
+    assert angle_error(candidates[0][0], rotation) <= 2.0
+    assert len(candidates) <= 4
+
+
+def test_candidates_are_separated():
+    target = make_l_shape(400, 400)
+    centroid = Contour(target).getCentroid()
+
+    candidates = estimate_rotation_candidates(target, target, centroid, centroid, max_candidates=10)
+
+    angles = [angle for angle, _ in candidates]
+    assert all(angle_error(a, b) >= 10 for i, a in enumerate(angles) for b in angles[i + 1:])
+
+
+def test_circle_and_degenerate_contours():
+    circle = make_circle(100, 100, 50)
+    centroid = Contour(circle).getCentroid()
+
+    assert len(estimate_rotation_candidates(circle, circle, centroid, centroid)) >= 1
+    assert estimate_rotation_candidates(np.zeros((2, 2)), circle, (0, 0), centroid) == []
+
+
+@pytest.mark.parametrize("rotation", [-150, -37, 95, 137])
+def test_refinement_matches_the_sweep(rotation):
+    target = make_l_shape(400, 400)
+    centroid = Contour(target).getCentroid()
+    workpiece = _rotate_contour(target, -rotation, centroid).astype(np.float32)
+
+    with patch("modules.contour_matching.alignment.mask_refinement.USE_PROFILE_COARSE_SEARCH", False):
+        _, sweep_overlap = _refine_alignment_with_mask(workpiece, target)
+    with patch("modules.contour_matching.alignment.mask_refinement._coarse_search") as sweep:
+        found_rotation, overlap = _refine_alignment_with_mask(workpiece, target)
+
+    sweep.assert_not_called()
+    assert angle_error(found_rotation, rotation) <= 1.5
+    assert overlap >= sweep_overlap - 1e-9
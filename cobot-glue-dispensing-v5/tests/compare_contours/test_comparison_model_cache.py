@@ -0,0 +1,140 @@
+import os
+
+import joblib
+import pytest
+
+from modules.contour_matching.matching.comparison_model_cache import ComparisonModelCache
+from modules.shape_matching_training.utils.io_utils import get_latest_model, save_model, load_model
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return load_model(path)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    save_model({"name": "first"}, "TestModel", 0.9, save_dir=tmp_path)
+    return tmp_path
+
+
+def test_model_is_loaded_once(model_dir):
+    loader = CountingLoader()
+    cache = ComparisonModelCache(model_dir, loader=loader)
+
+    first = cache.get_model()
+    second = cache.get_model()
+
+    assert first == {"name": "first"}
+    assert second is first
+    assert loader.calls == 1
+    metrics = cache.get_metrics()
+    assert metrics["load_count"] == 1
+    assert metrics["last_load_time_s"] >= 0
+    assert metrics["model_version"].startswith("model_")
+
+
+def test_overwritten_model_file_is_reloaded(model_dir):
+    loader = CountingLoader()
+    cache = ComparisonModelCache(model_dir, loader=loader)
+    cache.get_model()
+
+    model_path = cache.get_metrics()["model_path"]
+    joblib.dump({"name": "updated"}, model_path)
+    stat = os.stat(model_path)
+    os.utime(model_path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert cache.get_model() == {"name": "updated"}
+    assert loader.calls == 2
+
+
+def test_newly_saved_model_is_picked_up(model_dir):
+    cache = ComparisonModelCache(model_dir)
+    cache.get_model()
+
+    newer_folder = model_dir / "model_99990101_000000"
+    newer_folder.mkdir()
+    joblib.dump({"name": "newer"}, newer_folder / "TestModel_acc0.950.pkl")
+    stat = os.stat(model_dir)
+    os.utime(model_dir, (stat.st_atime, stat.st_mtime + 10))
+
+    assert cache.get_model() == {"name": "newer"}
+    assert cache.get_metrics()["model_version"] == "model_99990101_000000"
+
+
+def test_unrelated_directory_change_resolves_only_once(model_dir):
+    resolver_calls = []
+
+    def resolver(path):
+        resolver_calls.append(path)
+        return get_latest_model(path)
+
+    cache = ComparisonModelCache(model_dir, resolver=resolver)
+    cache.get_model()
+
+    (model_dir / "notes.txt").write_text("not a model")
+    stat = os.stat(model_dir)
+    os.utime(model_dir, (stat.st_atime, stat.st_mtime + 10))
+    for _ in range(3):
+        cache.get_model()
+
+    assert len(resolver_calls) == 2
+    assert cache.get_metrics()["load_count"] == 1
+
+
+def test_invalidate_forces_reload(model_dir):
+    loader = CountingLoader()
+    cache = ComparisonModelCache(model_dir, loader=loader)
+    cache.preload()
+
+    cache.invalidate()
+    cache.get_model()
+
+    assert loader.calls == 2
+
+
+def test_missing_models_raise(tmp_path):
+    cache = ComparisonModelCache(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        cache.get_model()
+
+
+def test_model_written_after_its_folder_is_picked_up(model_dir):
+    cache = ComparisonModelCache(model_dir)
+    cache.get_model()
+
+    # save_model: mkdir first (bumps the models directory) ...
+    newer_folder = model_dir / "model_99990101_000000"
+    newer_folder.mkdir()
+    stat = os.stat(model_dir)
+    os.utime(model_dir, (stat.st_atime, stat.st_mtime + 10))
+    assert cache.get_model() == {"name": "first"}
+
+    # ... then dump the model inside the folder, which leaves the directory mtime alone
+    joblib.dump({"name": "newer"}, newer_folder / "TestModel_acc0.950.pkl")
+    stat = os.stat(newer_folder)
+    os.utime(newer_folder, (stat.st_atime, stat.st_mtime + 10))
+
+    assert cache.get_model() == {"name": "newer"}
+
+
+def test_partially_written_model_keeps_the_current_one(model_dir):
+    cache = ComparisonModelCache(model_dir)
+    cache.get_model()
+
+    newer_folder = model_dir / "model_99990101_000000"
+    newer_folder.mkdir()
+    model_file = newer_folder / "TestModel_acc0.950.pkl"
+    model_file.write_bytes(b"\x80\x04partial")
+    stat = os.stat(model_dir)
+    os.utime(model_dir, (stat.st_atime, stat.st_mtime + 10))
+
+    assert cache.get_model() == {"name": "first"}
+
+    joblib.dump({"name": "newer"}, model_file)
+    assert cache.get_model() == {"name": "newer"}
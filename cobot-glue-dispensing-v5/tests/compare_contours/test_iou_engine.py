@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from modules.contour_matching.alignment.iou_engine import ContourIoUEngine
+from modules.contour_matching.alignment.mask_refinement import _refine_alignment_with_mask, _rotate_contour
+from modules.shared.core.ContourStandartized import Contour
+from modules.utils.contours import calculate_mask_overlap
+
+
+def make_rectangle(cx, cy, w, h, angle_deg=0.0):
+    corners = np.array([[-w / 2, -h / 2], [w / 2, -h / 2], [w / 2, h / 2], [-w / 2, h / 2]])
+    a = np.deg2rad(angle_deg)
+    rot = np.array([[np.cos(a), -np.sin(a)], [np.sin(a), np.cos(a)]])
+    pts = corners @ rot.T + [cx, cy]
+    return pts.reshape(-1, 1, 2).astype(np.float32)
+
+
+def make_l_shape(cx, cy):
+    pts = np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 160], [0, 160]], dtype=np.float32)
+    return (pts + [cx - 80, cy - 60]).reshape(-1, 1, 2)
+
+
+@pytest.mark.parametrize("candidate", [
+    make_rectangle(400, 400, 200, 120),
+    make_rectangle(410, 395, 200, 120, 12.5),
+    make_rectangle(430, 420, 150, 90, 45),
+    make_l_shape(390, 410),
+    make_rectangle(100, 100, 60, 40),
+])
+def test_iou_matches_calculate_mask_overlap(candidate):
+    reference = make_rectangle(400, 400, 200, 120)
+    engine = ContourIoUEngine(reference)
+
+    assert engine.iou(candidate) == pytest.approx(calculate_mask_overlap(candidate, reference))
+
+
+def test_identical_and_disjoint_contours():
+    reference = make_l_shape(400, 400)
+    engine = ContourIoUEngine(reference)
+
+    assert engine.iou(reference) == pytest.approx(1.0)
+    assert engine.iou(reference + 500) == 0.0
+
+
+def test_reference_is_rasterized_once_per_scale():
+    engine = ContourIoUEngine(make_rectangle(400, 400, 200, 120), coarse_scale=0.5)
+
+    for angle in range(0, 90, 10):
+        engine.iou(make_rectangle(400, 400, 200, 120, angle))
+        engine.iou(make_rectangle(400, 400, 200, 120, angle), coarse=True)
+
+    assert set(engine._references) == {1.0, 0.5}
+    assert engine.evaluations == 18
+
+
+def test_coarse_iou_is_close_to_full_resolution():
+    reference = make_l_shape(400, 400)
+    candidate = make_l_shape(405, 398)
+    engine = ContourIoUEngine(reference, coarse_scale=0.5)
+
+    assert engine.iou(candidate, coarse=True) == pytest.approx(engine.iou(candidate), abs=0.03)
+
+
+def test_invalid_coarse_scale():
+    with pytest.raises(ValueError):
+        ContourIoUEngine(make_rectangle(400, 400, 200, 120), coarse_scale=0)
+
+
+def test_refinement_recovers_rotation():
+    target = make_l_shape(400, 400)
+    centroid = Contour(target).getCentroid()
+    workpiece = _rotate_contour(target, -37, centroid).astype(np.float32)
+
+    rotation, overlap = _refine_alignment_with_mask(workpiece, target)
+
+    assert rotation == pytest.approx(37, abs=1.0)
+    assert overlap > 0.95
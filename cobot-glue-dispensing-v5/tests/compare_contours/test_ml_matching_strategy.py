@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from modules.contour_matching.matching.strategies.ml_matching_strategy import MLMatchingStrategy
+from modules.contour_matching.matching.workpiece_feature_index import WorkpieceFeatureIndex
+from modules.shape_matching_training.utils.io_utils import (
+    extract_similarity_features,
+    predict_similarity,
+)
+from modules.shared.core.ContourStandartized import Contour
+
+
+class FakeWorkpiece:
+    def __init__(self, workpiece_id, contour):
+        self.workpieceId = workpiece_id
+        self.contour = contour
+
+    def get_main_contour(self):
+        return self.contour
+
+
+def closed(points):
+    points = np.asarray(points, dtype=np.float32)
+    return np.vstack([points, points[:1]]).reshape(-1, 1, 2)
+
+
+def rectangle(center, width, height):
+    x, y = center
+    return closed([[x - width / 2, y - height / 2],
+                   [x + width / 2, y - height / 2],
+                   [x + width / 2, y + height / 2],
+                   [x - width / 2, y + height / 2]])
+
+
+def circle(center, radius, n=64):
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return closed(np.stack([center[0] + radius * np.cos(angles), center[1] + radius * np.sin(angles)], axis=1))
+
+
+@pytest.fixture
+def shapes():
+    return [rectangle((200, 200), 200, 100), circle((400, 300), 80), rectangle((300, 300), 120, 120)]
+
+
+@pytest.fixture
+def model(shapes):
+    features = [np.asarray(extract_similarity_features(Contour(shape).get())) for shape in shapes]
+    X, y = [], []
+    for i, fi in enumerate(features):
+        for j, fj in enumerate(features):
+            X.append(np.concatenate([fi, fj]))
+            y.append(1 if i == j else 0)
+    return LogisticRegression(max_iter=2000).fit(np.array(X), np.array(y))
+
+
+@pytest.fixture
+def workpieces(shapes):
+    return [FakeWorkpiece(i, shape) for i, shape in enumerate(shapes)]
+
+
+def test_batch_matching_equals_pairwise_prediction(model, workpieces, shapes):
+    index = WorkpieceFeatureIndex(subscribe=False)
+    strategy = MLMatchingStrategy(model, feature_index=index)
+    contours = [Contour(shape + 15) for shape in shapes]
+
+    best_matches = strategy.find_best_matches(workpieces, contours)
+
+    assert len(best_matches) == len(contours)
+    for contour, best in zip(contours, best_matches):
+        expected = []
+        for wp in workpieces:
+            result, confidence, _ = predict_similarity(model, Contour(wp.get_main_contour()).get(), contour.get())
+            expected.append((result, confidence))
+        same = [(conf, wp) for (result, conf), wp in zip(expected, workpieces) if result == "SAME"]
+        if same:
+            expected_conf, expected_wp = max(same, key=lambda item: item[0])
+            assert best.workpiece is expected_wp
+            assert best.confidence == pytest.approx(expected_conf)
+        else:
+            assert best.workpiece is None
+
+
+def test_find_best_match_delegates_to_batch(model, workpieces, shapes):
+    strategy = MLMatchingStrategy(model, feature_index=WorkpieceFeatureIndex(subscribe=False))
+
+    single = strategy.find_best_match(workpieces, Contour(shapes[1]))
+    batch = strategy.find_best_matches(workpieces, [Contour(shapes[1])])[0]
+
+    assert single.workpiece is batch.workpiece
+    assert single.confidence == pytest.approx(batch.confidence)
+
+
+def test_index_extracts_each_workpiece_once(model, workpieces, shapes):
+    index = WorkpieceFeatureIndex(subscribe=False)
+    index.build(workpieces)
+    strategy = MLMatchingStrategy(model, feature_index=index)
+
+    for _ in range(3):
+        strategy.find_best_matches(workpieces, [Contour(shape) for shape in shapes])
+
+    assert index.extractions == len(workpieces)
+
+
+def test_index_refreshes_changed_and_removed_workpieces(workpieces, shapes):
+    index = WorkpieceFeatureIndex(subscribe=False)
+    index.build(workpieces)
+
+    workpieces[0].contour = circle((100, 100), 30)
+    entries = index.get_entries(workpieces)
+    np.testing.assert_allclose(entries[0].features, extract_similarity_features(Contour(workpieces[0].contour).get()))
+    assert index.extractions == len(workpieces) + 1
+
+    index.on_workpiece_deleted(1)
+    assert 1 not in index
+    assert len(index) == len(workpieces) - 1
+
+    index.on_workpiece_saved(FakeWorkpiece(7, shapes[0]))
+    assert 7 in index
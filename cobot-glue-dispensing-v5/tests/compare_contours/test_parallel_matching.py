@@ -0,0 +1,135 @@
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from modules.contour_matching.CompareContours import match_workpieces
+from modules.contour_matching.alignment.alignment_cache import AlignmentCache
+from modules.contour_matching.alignment import contour_aligner
+from modules.contour_matching.alignment.contour_aligner import align_contours_generic
+from modules.contour_matching.matching.best_match_result import BestMatchResult
+from modules.contour_matching.parallel_executor import MatchingExecutor
+from modules.shared.core.ContourStandartized import Contour
+
+
+def make_l_shape(cx, cy):
+    pts = np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 160], [0, 160]], dtype=np.float32)
+    return (pts + [cx - 80, cy - 60]).reshape(-1, 1, 2)
+
+
+class FakeWorkpiece:
+    def __init__(self, workpieceId):
+        self.workpieceId = workpieceId
+
+
+class AreaStrategy:
+    """Matches a contour to workpiece 'big' or 'small' by area and records the worker threads."""
+
+    def __init__(self):
+        self.threads = set()
+
+    def find_best_matches(self, workpieces, contours):
+        self.threads.add(threading.current_thread().name)
+        results = []
+        for contour in contours:
+            big = contour.getArea() > 1000
+            wp = workpieces[0] if big else None
+            results.append(BestMatchResult(workpiece=wp, confidence=0.9 if big else 0.1,
+                                           result="SAME" if big else "DIFFERENT",
+                                           centroid_diff=(0, 0), rotation_diff=0.0, contour_angle=0.0,
+                                           workpiece_id="big" if big else None))
+        return results
+
+
+def square(x, size):
+    return np.array([[x, 0], [x + size, 0], [x + size, size], [x, size]], dtype=np.float32).reshape(-1, 1, 2)
+
+
+def test_executor_map_keeps_order():
+    executor = MatchingExecutor("thread", max_workers=4)
+    try:
+        assert executor.map(lambda x: x * x, range(20)) == [x * x for x in range(20)]
+    finally:
+        executor.shutdown()
+
+
+def test_split_is_contiguous_and_balanced():
+    executor = MatchingExecutor("thread", max_workers=3)
+
+    chunks = executor.split(list(range(10)))
+
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert MatchingExecutor("serial").split([1, 2]) == [[1, 2]]
+    assert executor.split([]) == []
+
+
+def test_invalid_executor_kind():
+    with pytest.raises(ValueError):
+        MatchingExecutor("gpu")
+
+
+def test_parallel_matching_matches_serial_order():
+    contours = [square(i * 100, 50 if i % 3 else 20) for i in range(10)]
+    workpieces = [FakeWorkpiece("big")]
+    executor = MatchingExecutor("thread", max_workers=4)
+    strategy = AreaStrategy()
+    try:
+        serial = match_workpieces(workpieces, contours, AreaStrategy())
+        parallel = match_workpieces(workpieces, contours, strategy, executor)
+    finally:
+        executor.shutdown()
+
+    assert [m.new_contour.tolist() for m in parallel[0]] == [m.new_contour.tolist() for m in serial[0]]
+    assert [c.get().tolist() for c in parallel[1]] == [c.get().tolist() for c in serial[1]]
+    assert all(name.startswith("ContourMatching") for name in strategy.threads)
+
+
+def test_parallel_alignment_matches_serial():
+    references = [make_l_shape(300 + 200 * i, 400) for i in range(4)]
+    rotations = [10.0, -25.0, 40.0, 0.0]
+
+    def run(executor, cache):
+        targets = [Contour(make_l_shape(400, 400)) for _ in references]
+        sprays = [[Contour(make_l_shape(400, 400))] for _ in references]
+        align_contours_generic(targets, references, spray_contours_list=sprays,
+                               rotation_diffs=list(rotations),
+                               translation_diffs=[(200 * i - 100, 0) for i in range(4)],
+                               alignment_cache=cache,
+                               cache_keys=[AlignmentCache.signature(r, 1) for r in references],
+                               executor=executor)
+        return targets, sprays
+
+    serial_targets, serial_sprays = run(None, AlignmentCache())
+    executor = MatchingExecutor("thread", max_workers=4)
+    cache = AlignmentCache()
+    try:
+        parallel_targets, parallel_sprays = run(executor, cache)
+    finally:
+        executor.shutdown()
+
+    for a, b in zip(serial_targets, parallel_targets):
+        assert np.allclose(a.get(), b.get())
+    for a, b in zip(serial_sprays, parallel_sprays):
+        assert np.allclose(a[0].get(), b[0].get())
+    assert cache.get_stats()["entries"] == 4
+
+
+def test_parallel_alignment_keeps_the_reference_overlap_on_cache_hits():
+    references = [make_l_shape(300 + 200 * i, 400) for i in range(2)]
+    keys = [AlignmentCache.signature(r, 1) for r in references]
+    cache = AlignmentCache()
+    for key in keys:
+        cache.put(key, 15.0, 0.97)
+
+    executor = MatchingExecutor("thread", max_workers=2)
+    try:
+        with patch.object(contour_aligner, "_refine_alignment_with_mask", return_value=(16.0, 0.95)):
+            align_contours_generic([Contour(make_l_shape(400, 400)) for _ in references], references,
+                                   alignment_cache=cache, cache_keys=keys, executor=executor)
+    finally:
+        executor.shutdown()
+
+    for key in keys:
+        assert cache.get(key).rotation == 16.0
+        assert cache.get(key).overlap == pytest.approx(0.97)
@@ -0,0 +1,98 @@
+from unittest.mock import Mock
+
+import numpy as np
+
+from modules.contour_matching.CompareContours import prepare_data_for_alignment
+from modules.contour_matching.alignment.workpiece_update import copy_workpiece_for_update, update_workpiece_data
+from modules.contour_matching.debug.debug_plot_writer import DebugPlotWriter
+from modules.contour_matching.matching.match_info import MatchInfo
+from modules.contour_matching.matching.strategies.geometric_matching_strategy import GeometricMatchingStrategy
+from modules.shared.core.ContourStandartized import Contour
+
+
+def square(x, size):
+    return np.array([[x, 0], [x + size, 0], [x + size, size], [x, size]], dtype=np.float32).reshape(-1, 1, 2)
+
+
+class FakeWorkpiece:
+    def __init__(self):
+        self.workpieceId = 3
+        self.contour = square(0, 100)
+        self.sprayPattern = {
+            "Contour": [{"contour": square(10, 80), "settings": {"speed": 1}}],
+            "Fill": [{"contour": square(20, 60), "settings": {}}],
+        }
+        self.pickupPoint = "50.00,50.00"
+
+    def get_main_contour(self):
+        return self.contour
+
+    def get_spray_pattern_contours(self):
+        return self.sprayPattern["Contour"]
+
+    def get_spray_pattern_fills(self):
+        return self.sprayPattern["Fill"]
+
+
+def test_production_strategy_does_not_plot_or_print(capsys):
+    writer = Mock()
+    strategy = GeometricMatchingStrategy(debug_writer=writer)
+
+    best = strategy.find_best_match([FakeWorkpiece()], Contour(square(300, 100)))
+
+    assert best.result == "SAME"
+    writer.submit.assert_not_called()
+    assert capsys.readouterr().out == ""
+
+
+def test_debug_plots_are_sampled_and_written_in_background(tmp_path):
+    writer = DebugPlotWriter(output_dir=tmp_path, sample_every=2)
+    strategy = GeometricMatchingStrategy(debug=True, debug_writer=writer)
+
+    for _ in range(4):
+        strategy._getSimilarity(square(0, 100), square(0, 95))
+    writer.flush()
+
+    assert len(list(tmp_path.glob("similarity_debug_*.png"))) == 2
+    assert writer.get_stats()["written"] == 2
+    assert writer.get_stats()["skipped"] == 2
+
+
+def test_writer_drops_plots_when_full():
+    writer = DebugPlotWriter(sample_every=1, max_pending=1)
+    writer._thread = Mock()  # keep the queue from being drained
+
+    assert writer.submit(print, "first")
+    assert not writer.submit(print, "second")
+    assert writer.get_stats()["dropped"] == 1
+
+
+def test_prepare_data_leaves_workpiece_untouched():
+    workpiece = FakeWorkpiece()
+    original = workpiece.contour.copy()
+    match = MatchInfo(workpiece=workpiece, new_contour=square(300, 100).reshape(-1, 2),
+                      centroid_diff=(300, 0), rotation_diff=0.0, contour_orientation=0.0)
+
+    prepared = prepare_data_for_alignment([match])[0]
+    prepared.contourObj.translate(5, 5)
+    prepared.sprayContourObjs[0].translate(5, 5)
+
+    assert prepared.workpiece is workpiece
+    assert np.array_equal(workpiece.contour, original)
+    assert np.array_equal(workpiece.sprayPattern["Contour"][0]["contour"], square(10, 80))
+
+
+def test_workpiece_copy_isolates_the_update():
+    workpiece = FakeWorkpiece()
+    updated = copy_workpiece_for_update(workpiece)
+
+    update_workpiece_data(updated, Contour(square(300, 100)), [Contour(square(310, 80))],
+                          [Contour(square(320, 60))], [1.0, 2.0])
+    updated.sprayPattern["Contour"][0]["settings"]["speed"] = 2
+
+    assert np.array_equal(workpiece.contour, square(0, 100))
+    assert np.array_equal(workpiece.sprayPattern["Contour"][0]["contour"], square(10, 80))
+    assert np.array_equal(workpiece.sprayPattern["Fill"][0]["contour"], square(20, 60))
+    assert workpiece.sprayPattern["Contour"][0]["settings"]["speed"] == 1
+    assert workpiece.pickupPoint == "50.00,50.00"
+    assert updated.pickupPoint == "1.00,2.00"
@@ -42,6 +42,7 @@ def mock_robot_service():
     robot.get_current_position = MagicMock(return_value=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
     robot.get_current_velocity = MagicMock(return_value=100.0)
     robot.get_current_acceleration = MagicMock(return_value=0.0)
+    robot.get_latest_telemetry = MagicMock(return_value=None)  # No telemetry, use the getters
     robot.stop_motion = MagicMock(return_value=None)
     robot.is_motion_complete = MagicMock(return_value=False)
 
@@ -87,3 +87,29 @@ class TestHandleMovingToFirstPointState:
         next_state = handle_moving_to_first_point_state(context, resume=True)
         assert next_state == GlueProcessState.STOPPED
 
+
+    def test_pause_transition_wakes_the_wait(self, context_with_paths, mock_state_machine):
+        """A PAUSED transition cancels the wait right away, without a monitor thread"""
+        import threading
+        import time
+        from core.services.robot_service.impl.position_monitor import PositionMonitor
+
+        context = context_with_paths
+        context.current_settings = {GlueSettingKey.REACH_START_THRESHOLD.value: 1.0}
+        context.state_machine = mock_state_machine
+        mock_state_machine.current_state = GlueProcessState.MOVING_TO_FIRST_POINT
+        monitor = PositionMonitor()
+        context.robot_service._waitForRobotToReachPosition = (
+            lambda end_point, threshold, delay, timeout, cancellation_token:
+            monitor.wait_for_position(end_point, threshold, timeout, cancellation_token)
+        )
+        threading.Timer(0.05, mock_state_machine.transition, args=(GlueProcessState.PAUSED,)).start()
+        threads_before = threading.active_count()
+
+        start = time.monotonic()
+        next_state = handle_moving_to_first_point_state(context, resume=False)
+
+        assert next_state == GlueProcessState.PAUSED
+        assert time.monotonic() - start < 5
+        assert threading.active_count() <= threads_before
+        assert mock_state_machine._transition_listeners == []
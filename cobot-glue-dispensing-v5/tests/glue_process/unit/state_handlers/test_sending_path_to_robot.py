@@ -109,3 +109,84 @@ class TestHandleSendingPathToRobotState:
         assert context.current_path_index == 1
         assert context.current_path == ["dummy"]
         assert context.current_settings == {"velocity": 5}
+
+
+class TestHandleSendingPathAsSpline:
+
+    @pytest.fixture
+    def spline_context(self, context_with_paths):
+        context = context_with_paths
+        context.use_spline_streaming = True
+        context.current_settings = {RobotSettingKey.VELOCITY.value: 10, RobotSettingKey.ACCELERATION.value: 30}
+        context.state_machine = Mock()
+        context.state_machine.state = GlueProcessState.EXECUTING_PATH
+        robot = context.robot_service.robot
+        robot.start_spline = Mock(return_value=0)
+        robot.add_spline_point = Mock(return_value=0)
+        robot.end_spline = Mock(return_value=0)
+        robot.move_liner = Mock(return_value=0)
+        return context
+
+    def test_spline_happy_path(self, spline_context, logger_context):
+        robot = spline_context.robot_service.robot
+
+        next_state = handle_send_path_to_robot(spline_context, logger_context)
+
+        assert next_state == GlueProcessState.WAIT_FOR_PATH_COMPLETION
+        robot.start_spline.assert_called_once()
+        assert robot.add_spline_point.call_count == len(spline_context.current_path)
+        last_flags = [c.kwargs["last"] for c in robot.add_spline_point.call_args_list]
+        assert last_flags == [False, False, True]
+        assert all(c.kwargs["ovl"] == 10 for c in robot.add_spline_point.call_args_list)
+        robot.end_spline.assert_called_once()
+        robot.move_liner.assert_not_called()
+
+    def test_single_point_path_uses_move_liner(self, spline_context, logger_context):
+        spline_context.current_path = spline_context.current_path[:1]
+        robot = spline_context.robot_service.robot
+
+        next_state = handle_send_path_to_robot(spline_context, logger_context)
+
+        assert next_state == GlueProcessState.WAIT_FOR_PATH_COMPLETION
+        robot.move_liner.assert_called_once()
+        robot.start_spline.assert_not_called()
+
+    def test_spline_point_failure_stops_motion(self, spline_context, logger_context):
+        spline_context.robot_service.robot.add_spline_point = Mock(side_effect=[0, 14])
+
+        next_state = handle_send_path_to_robot(spline_context, logger_context)
+
+        assert next_state == GlueProcessState.ERROR
+        spline_context.robot_service.stop_motion.assert_called_once()
+        spline_context.robot_service.robot.end_spline.assert_not_called()
+
+    def test_spline_end_failure(self, spline_context, logger_context):
+        spline_context.robot_service.robot.end_spline = Mock(return_value=1)
+
+        next_state = handle_send_path_to_robot(spline_context, logger_context)
+
+        assert next_state == GlueProcessState.ERROR
+
+    def test_paused_during_upload_resumes_from_segment_start(self, spline_context, logger_context):
+        spline_context.current_point_index = 2
+        sm = spline_context.state_machine
+
+        def pause_after_first_point(**kwargs):
+            sm.state = GlueProcessState.PAUSED
+            return 0
+
+        spline_context.robot_service.robot.add_spline_point = Mock(side_effect=pause_after_first_point)
+
+        next_state = handle_send_path_to_robot(spline_context, logger_context)
+
+        assert next_state == GlueProcessState.PAUSED
+        assert spline_context.current_point_index == 2
+        spline_context.robot_service.robot.end_spline.assert_not_called()
+
+    def test_stopped_during_upload(self, spline_context, logger_context):
+        spline_context.state_machine.state = GlueProcessState.STOPPED
+
+        next_state = handle_send_path_to_robot(spline_context, logger_context)
+
+        assert next_state == GlueProcessState.STOPPED
+        spline_context.robot_service.robot.add_spline_point.assert_not_called()
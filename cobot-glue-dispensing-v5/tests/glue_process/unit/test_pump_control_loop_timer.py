@@ -0,0 +1,128 @@
+"""
+Unit tests for the fixed-rate pump control loop.
+Uses a fake clock so deadlines, jitter and overruns are deterministic.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from applications.glue_dispensing_application.glue_process.dynamicPumpSpeedAdjustment import (
+    ControlLoopTimer, PumpThreadWithResult, adjustPumpSpeedDynamically
+)
+
+
+class FakeClock:
+    """Clock whose time only advances through sleep() or explicit advance()."""
+
+    def __init__(self, oversleep=0.0):
+        self.now = 0.0
+        self.oversleep = oversleep
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration + self.oversleep
+
+    def advance(self, duration):
+        self.now += duration
+
+
+class TestControlLoopTimer:
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            ControlLoopTimer(0)
+
+    def test_sleeps_until_deadline_without_drift(self):
+        clock = FakeClock()
+        timer = ControlLoopTimer(100, clock=clock, sleep=clock.sleep)
+        timer.start()
+
+        for _ in range(5):
+            clock.advance(0.004)  # 4 ms of work in a 10 ms period
+            timer.wait_for_next_cycle()
+
+        assert clock.sleeps == pytest.approx([0.006] * 5)
+        assert clock.now == pytest.approx(0.05)
+        stats = timer.get_stats()
+        assert stats["cycles"] == 5
+        assert stats["overruns"] == 0
+        assert stats["max_jitter_ms"] == pytest.approx(0.0)
+        assert stats["max_cycle_time_ms"] == pytest.approx(4.0)
+
+    def test_records_jitter_and_compensates_next_sleep(self):
+        clock = FakeClock(oversleep=0.001)
+        timer = ControlLoopTimer(100, clock=clock, sleep=clock.sleep)
+        timer.start()
+
+        timer.wait_for_next_cycle()
+        timer.wait_for_next_cycle()
+
+        # Second sleep is shortened by the 1 ms the first wake-up was late
+        assert clock.sleeps == pytest.approx([0.010, 0.009])
+        stats = timer.get_stats()
+        assert stats["mean_jitter_ms"] == pytest.approx(1.0)
+        assert stats["max_jitter_ms"] == pytest.approx(1.0)
+
+    def test_overrun_reanchors_schedule(self):
+        clock = FakeClock()
+        timer = ControlLoopTimer(100, clock=clock, sleep=clock.sleep)
+        timer.start()
+
+        clock.advance(0.035)  # missed three deadlines
+        timer.wait_for_next_cycle()
+        assert clock.sleeps == []
+
+        clock.advance(0.002)
+        timer.wait_for_next_cycle()
+
+        assert clock.sleeps == pytest.approx([0.008])
+        stats = timer.get_stats()
+        assert stats["cycles"] == 2
+        assert stats["overruns"] == 1
+        assert stats["max_cycle_time_ms"] == pytest.approx(35.0)
+
+
+class TestAdjustPumpSpeedDynamically:
+
+    @patch("applications.glue_dispensing_application.glue_process.dynamicPumpSpeedAdjustment.files")
+    def test_one_pump_update_per_cycle(self, mock_files, mock_robot_service, mock_glue_service):
+        path = [[0, 0, 0, 0, 0, 0], [10, 0, 0, 0, 0, 0], [20, 0, 0, 0, 0, 0]]
+        clock = FakeClock()
+        timer = ControlLoopTimer(50, clock=clock, sleep=clock.sleep)
+
+        # Robot advances one path point every two control cycles
+        def current_position():
+            cycle = round(clock.now / timer.period)
+            return path[min(cycle // 2, len(path) - 1)]
+
+        mock_robot_service.get_current_position = Mock(side_effect=current_position)
+
+        success, progress = adjustPumpSpeedDynamically(
+            mock_glue_service, mock_robot_service, 1.0, 0.0, 0, path, 1.0, loop_timer=timer
+        )
+
+        assert success is True
+        assert progress == 2
+        assert mock_glue_service.adjustMotorSpeed.call_count == 4
+        assert timer.get_stats()["cycles"] == 4
+        assert clock.sleeps == pytest.approx([0.02] * 4)
+
+
+class TestPumpThreadWithResult:
+
+    def test_returns_loop_stats(self):
+        timer = ControlLoopTimer(50)
+        thread = PumpThreadWithResult(target=lambda: (True, 3), loop_timer=timer)
+        thread.start()
+        thread.join()
+
+        assert thread.result == (True, 3)
+        assert thread.get_loop_stats()["rate_hz"] == 50
+
+    def test_no_timer_returns_none(self):
+        thread = PumpThreadWithResult(target=lambda: (True, 0))
+        assert thread.get_loop_stats() is None
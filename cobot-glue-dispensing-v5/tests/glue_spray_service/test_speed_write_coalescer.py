@@ -0,0 +1,137 @@
+"""
+Unit tests for SpeedWriteCoalescer.
+Covers deadband suppression, latest-value coalescing of concurrent commands and stats.
+"""
+
+import threading
+
+import pytest
+
+from applications.glue_dispensing_application.services.glueSprayService.motorControl.speed_write_coalescer import (
+    SpeedWriteCoalescer
+)
+
+
+class RecordingWriter:
+    """Write callback that records (motor_address, speed) and returns a fixed result."""
+
+    def __init__(self, result=True):
+        self.result = result
+        self.writes = []
+
+    def __call__(self, motor_address, speed):
+        self.writes.append((motor_address, speed))
+        return self.result
+
+
+class TestDeadband:
+
+    def test_rejects_negative_deadband(self):
+        with pytest.raises(ValueError):
+            SpeedWriteCoalescer(deadband=-1)
+
+    def test_first_command_is_always_written(self):
+        coalescer = SpeedWriteCoalescer(deadband=100)
+        writer = RecordingWriter()
+
+        assert coalescer.submit(0, 5000, writer) is True
+        assert writer.writes == [(0, 5000)]
+
+    def test_identical_and_nearby_speeds_are_suppressed(self):
+        coalescer = SpeedWriteCoalescer(deadband=50)
+        writer = RecordingWriter()
+
+        coalescer.submit(0, 5000, writer)
+        coalescer.submit(0, 5000, writer)
+        coalescer.submit(0, 5050, writer)
+        coalescer.submit(0, 4951, writer)
+        coalescer.submit(0, 5051, writer)
+
+        assert writer.writes == [(0, 5000), (0, 5051)]
+        stats = coalescer.get_stats()
+        assert stats["writes_issued"] == 2
+        assert stats["suppressed_deadband"] == 3
+        assert stats["suppressed_total"] == 3
+
+    def test_zero_speed_is_never_suppressed(self):
+        coalescer = SpeedWriteCoalescer(deadband=100)
+        writer = RecordingWriter()
+
+        coalescer.submit(0, 30, writer)
+        coalescer.submit(0, 0, writer)
+        coalescer.submit(0, 0, writer)
+
+        assert writer.writes == [(0, 30), (0, 0)]
+
+    def test_deadband_is_tracked_per_motor(self):
+        coalescer = SpeedWriteCoalescer(deadband=50)
+        writer = RecordingWriter()
+
+        coalescer.submit(0, 5000, writer)
+        coalescer.submit(2, 5000, writer)
+
+        assert writer.writes == [(0, 5000), (2, 5000)]
+
+    def test_failed_write_is_retried(self):
+        coalescer = SpeedWriteCoalescer(deadband=50)
+        writer = RecordingWriter(result=False)
+
+        assert coalescer.submit(0, 5000, writer) is False
+        assert coalescer.submit(0, 5000, writer) is False
+        assert len(writer.writes) == 2
+
+    def test_invalidate_forces_next_write(self):
+        coalescer = SpeedWriteCoalescer(deadband=50)
+        writer = RecordingWriter()
+
+        coalescer.submit(0, 5000, writer)
+        coalescer.invalidate(0)
+        coalescer.submit(0, 5000, writer)
+
+        assert writer.writes == [(0, 5000), (0, 5000)]
+
+
+class TestCoalescing:
+
+    def test_commands_during_write_keep_only_newest(self):
+        coalescer = SpeedWriteCoalescer(deadband=0)
+        write_started = threading.Event()
+        release_write = threading.Event()
+        writes = []
+
+        def slow_writer(motor_address, speed):
+            writes.append(speed)
+            if len(writes) == 1:
+                write_started.set()
+                release_write.wait(timeout=2.0)
+            return True
+
+        first = threading.Thread(target=coalescer.submit, args=(0, 1000, slow_writer))
+        first.start()
+        assert write_started.wait(timeout=2.0)
+
+        # Bus is busy: these are parked, only the last one survives
+        assert coalescer.submit(0, 2000, slow_writer) is True
+        assert coalescer.submit(0, 3000, slow_writer) is True
+        assert coalescer.submit(0, 4000, slow_writer) is True
+
+        release_write.set()
+        first.join(timeout=2.0)
+
+        assert writes == [1000, 4000]
+        stats = coalescer.get_stats()
+        assert stats["writes_issued"] == 2
+        assert stats["suppressed_superseded"] == 2
+
+    def test_writer_exception_releases_motor(self):
+        coalescer = SpeedWriteCoalescer()
+
+        def failing_writer(motor_address, speed):
+            raise RuntimeError("bus error")
+
+        with pytest.raises(RuntimeError):
+            coalescer.submit(0, 1000, failing_writer)
+
+        writer = RecordingWriter()
+        assert coalescer.submit(0, 1000, writer) is True
+        assert writer.writes == [(0, 1000)]
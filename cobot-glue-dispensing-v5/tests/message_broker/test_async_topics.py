@@ -0,0 +1,165 @@
+"""
+Unit tests for MessageBroker async topic delivery.
+Covers worker-thread delivery, overflow policies and unchanged request() semantics.
+"""
+
+import threading
+
+import pytest
+
+from modules.shared.MessageBroker import MessageBroker, OverflowPolicy
+
+TOPIC = "test/async-topic"
+
+
+class BlockingSubscriber:
+    """Subscriber that blocks on its first message until released."""
+
+    def __init__(self):
+        self.received = []
+        self.threads = []
+        self.first_started = threading.Event()
+        self.release = threading.Event()
+        self.done = threading.Event()
+        self.expected = None
+
+    def __call__(self, message):
+        self.threads.append(threading.current_thread())
+        if not self.received:
+            self.first_started.set()
+            self.release.wait(timeout=2.0)
+        self.received.append(message)
+        if self.expected is not None and len(self.received) >= self.expected:
+            self.done.set()
+
+
+@pytest.fixture
+def broker():
+    broker = MessageBroker()
+    yield broker
+    broker.stop_async_topics()
+    broker.clear_all()
+
+
+def test_sync_topic_delivers_on_publisher_thread(broker):
+    subscriber = BlockingSubscriber()
+    subscriber.release.set()
+    broker.subscribe(TOPIC, subscriber)
+
+    broker.publish(TOPIC, 1)
+
+    assert subscriber.received == [1]
+    assert subscriber.threads == [threading.current_thread()]
+    assert broker.get_async_topic_stats(TOPIC) is None
+
+
+def test_async_topic_delivers_on_worker_thread(broker):
+    subscriber = BlockingSubscriber()
+    subscriber.release.set()
+    subscriber.expected = 3
+    broker.subscribe(TOPIC, subscriber)
+    broker.configure_async_topic(TOPIC, max_queue_size=8)
+
+    for i in range(3):
+        broker.publish(TOPIC, i)
+
+    assert subscriber.done.wait(timeout=2.0)
+    assert subscriber.received == [0, 1, 2]
+    assert all(t is not threading.current_thread() for t in subscriber.threads)
+    assert broker.is_async_topic(TOPIC)
+
+
+def _publish_while_busy(broker, subscriber, messages):
+    broker.publish(TOPIC, "first")
+    assert subscriber.first_started.wait(timeout=2.0)
+    for message in messages:
+        broker.publish(TOPIC, message)
+
+
+def test_drop_oldest_keeps_newest(broker):
+    subscriber = BlockingSubscriber()
+    subscriber.expected = 3
+    broker.subscribe(TOPIC, subscriber)
+    broker.configure_async_topic(TOPIC, max_queue_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+    _publish_while_busy(broker, subscriber, ["a", "b", "c", "d"])
+    subscriber.release.set()
+
+    assert subscriber.done.wait(timeout=2.0)
+    assert subscriber.received == ["first", "c", "d"]
+    assert broker.get_async_topic_stats(TOPIC)["dropped"] == 2
+
+
+def test_drop_newest_keeps_queued(broker):
+    subscriber = BlockingSubscriber()
+    subscriber.expected = 3
+    broker.subscribe(TOPIC, subscriber)
+    broker.configure_async_topic(TOPIC, max_queue_size=2, overflow_policy=OverflowPolicy.DROP_NEWEST)
+
+    _publish_while_busy(broker, subscriber, ["a", "b", "c", "d"])
+    subscriber.release.set()
+
+    assert subscriber.done.wait(timeout=2.0)
+    assert subscriber.received == ["first", "a", "b"]
+    assert broker.get_async_topic_stats(TOPIC)["dropped"] == 2
+
+
+def test_block_waits_for_free_slot(broker):
+    subscriber = BlockingSubscriber()
+    subscriber.expected = 3
+    broker.subscribe(TOPIC, subscriber)
+    broker.configure_async_topic(TOPIC, max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK)
+
+    _publish_while_busy(broker, subscriber, ["a"])
+    publisher = threading.Thread(target=broker.publish, args=(TOPIC, "b"))
+    publisher.start()
+    publisher.join(timeout=0.1)
+    assert publisher.is_alive()  # queue is full, publisher blocks
+
+    subscriber.release.set()
+    publisher.join(timeout=2.0)
+
+    assert subscriber.done.wait(timeout=2.0)
+    assert subscriber.received == ["first", "a", "b"]
+    assert broker.get_async_topic_stats(TOPIC)["dropped"] == 0
+
+
+def test_block_timeout_drops_message(broker):
+    subscriber = BlockingSubscriber()
+    broker.subscribe(TOPIC, subscriber)
+    broker.configure_async_topic(TOPIC, max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK,
+                                 block_timeout=0.05)
+
+    _publish_while_busy(broker, subscriber, ["a", "b"])
+
+    assert broker.get_async_topic_stats(TOPIC)["dropped"] == 1
+    subscriber.release.set()
+
+
+def test_request_stays_synchronous(broker):
+    broker.configure_async_topic(TOPIC)
+
+    def responder(message):
+        return message * 2
+
+    broker.subscribe(TOPIC, responder)
+
+    assert broker.request(TOPIC, 21) == 42
+
+
+def test_configure_sync_topic_restores_direct_delivery(broker):
+    subscriber = BlockingSubscriber()
+    subscriber.release.set()
+    broker.subscribe(TOPIC, subscriber)
+    broker.configure_async_topic(TOPIC)
+    broker.configure_sync_topic(TOPIC)
+
+    broker.publish(TOPIC, 1)
+
+    assert subscriber.received == [1]
+    assert not broker.is_async_topic(TOPIC)
+
+
+def test_invalid_queue_size(broker):
+    with pytest.raises(ValueError):
+        broker.configure_async_topic(TOPIC, max_queue_size=0)
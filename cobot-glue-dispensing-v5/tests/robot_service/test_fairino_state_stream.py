@@ -0,0 +1,119 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from core.services.robot_service.impl.robot_monitor.fairino_monitor import FairinoRobotMonitor
+from core.services.robot_service.impl.robot_monitor.fairino_state_stream import (
+    StatePacketParser, encode_packet, FairinoState
+)
+from libs.fairino.linux.fairino.Robot import RobotStatePkg
+
+
+def make_packet(i, speed=50.0, motion_done=0):
+    packet = RobotStatePkg()
+    packet.frame_cnt = i
+    for axis in range(6):
+        packet.tl_cur_pos[axis] = 100.0 * axis + i
+        packet.jt_cur_pos[axis] = float(axis)
+    packet.actual_TCP_CmpSpeed[0] = speed
+    packet.motion_done = motion_done
+    return encode_packet(packet)
+
+
+def chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_parser_handles_split_frames_garbage_and_bad_checksums():
+    corrupted = bytearray(make_packet(99))
+    corrupted[40] ^= 0xFF
+    stream = b"\x00\x5a\x13" + make_packet(1) + bytes(corrupted) + b"junk" + make_packet(2) + make_packet(3)
+    parser = StatePacketParser()
+
+    packets = [p for chunk in chunks(stream, 97) for p in parser.feed(chunk)]
+
+    assert [p.frame_cnt for p in packets] == [1, 2, 3]
+    assert list(packets[1].tl_cur_pos) == [2.0, 102.0, 202.0, 302.0, 402.0, 502.0]
+    assert parser.checksum_errors >= 1
+
+
+def test_short_frames_are_zero_padded():
+    frame = bytearray(make_packet(5)[:200])
+    frame[3:5] = (200 - 7).to_bytes(2, "little")
+    checksum = sum(frame[:-2]) & 0xFFFF
+    frame[-2:] = checksum.to_bytes(2, "little")
+
+    packets = StatePacketParser().feed(bytes(frame))
+
+    assert len(packets) == 1
+    assert packets[0].frame_cnt == 5
+    assert packets[0].motion_done == 0
+
+
+class StateServer:
+    """Local stand-in for the controller's port 20004 that replays recorded packets."""
+
+    def __init__(self, frames, close_after=True):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.frames = frames
+        self.close_after = close_after
+        self.done = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        conn, _ = self.server.accept()
+        self.conn = conn
+        for chunk in chunks(b"".join(self.frames), 300):
+            conn.sendall(chunk)
+            time.sleep(0.001)
+        if self.close_after:
+            conn.close()
+        self.done.set()
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_monitor_reports_every_streamed_packet():
+    frames = [make_packet(i, speed=10.0 * i, motion_done=int(i == 19)) for i in range(20)]
+    server = StateServer(frames, close_after=False)
+    samples = []
+    monitor = FairinoRobotMonitor("127.0.0.1", port=server.port)
+    assert monitor.robot is None
+
+    monitor.start(lambda pos, vel, acc, ts, error=False: samples.append((pos, vel, acc, error)))
+    try:
+        assert wait_for(lambda: len(samples) >= 20)
+    finally:
+        monitor.stop()
+
+    assert not any(error for _, _, _, error in samples)
+    assert [pos[0] for pos, _, _, _ in samples] == [float(i) for i in range(20)]
+    assert [vel for _, vel, _, _ in samples] == [10.0 * i for i in range(20)]
+    assert samples[-1][2] == pytest.approx(10.0)
+    assert isinstance(monitor.get_latest_state(), FairinoState)
+    assert monitor.get_latest_state().motion_done
+    assert monitor.get_latest_state().joint_positions == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_monitor_reports_error_when_stream_drops():
+    server = StateServer([make_packet(0)])
+    samples = []
+    monitor = FairinoRobotMonitor("127.0.0.1", port=server.port)
+
+    monitor.start(lambda pos, vel, acc, ts, error=False: samples.append(error))
+    try:
+        assert wait_for(lambda: True in samples)
+    finally:
+        monitor.stop()
+
+    assert samples[0] is False
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from core.services.robot_service.impl.base_robot_service import CancellationToken
+from core.services.robot_service.impl.position_monitor import PositionMonitor
+
+TARGET = [100.0, 200.0, 300.0, 180.0, 0.0, 0.0]
+
+
+def feed_later(monitor, position, delay=0.05):
+    timer = threading.Timer(delay, monitor.on_position, args=(position,))
+    timer.start()
+    return timer
+
+
+def test_wait_is_woken_by_matching_sample():
+    monitor = PositionMonitor()
+    monitor.on_position([0.0, 0.0, 0.0, 180.0, 0.0, 0.0])
+    feed_later(monitor, [100.5, 200.0, 300.0, 180.0, 0.0, 0.0])
+
+    start = time.monotonic()
+    assert monitor.wait_for_position(TARGET, threshold=1.0, timeout=5)
+    assert time.monotonic() - start < 1.0
+    assert monitor.get_pending_count() == 0
+
+
+def test_sample_outside_threshold_does_not_wake():
+    monitor = PositionMonitor()
+    feed_later(monitor, [105.0, 200.0, 300.0, 180.0, 0.0, 0.0])
+
+    assert not monitor.wait_for_position(TARGET, threshold=1.0, timeout=0.2)
+    assert monitor.get_pending_count() == 0
+
+
+def test_already_at_target_returns_immediately():
+    monitor = PositionMonitor()
+    monitor.on_position(TARGET)
+
+    waiter = monitor.register(TARGET, threshold=1.0)
+
+    assert waiter.reached and waiter.wait(timeout=0)
+    assert monitor.get_pending_count() == 0
+
+
+def test_cancellation_wakes_the_wait():
+    monitor = PositionMonitor()
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel, args=("State changed to PAUSED",)).start()
+
+    start = time.monotonic()
+    assert not monitor.wait_for_position(TARGET, threshold=1.0, timeout=5, cancellation_token=token)
+    assert time.monotonic() - start < 1.0
+    assert token.get_cancellation_reason() == "State changed to PAUSED"
+
+
+def test_cancel_callbacks_run_once_and_immediately_when_already_cancelled():
+    token = CancellationToken()
+    calls = []
+    token.add_cancel_callback(calls.append)
+    token.cancel("first")
+    token.cancel("second")
+    token.add_cancel_callback(calls.append)
+
+    assert calls == ["first", "second"]
@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from communication_layer.api.v1.topics import RobotTopics
+from core.services.robot_service.impl.RobotStateManager import RobotStateManager
+from core.services.robot_service.impl.telemetry_ring import TelemetryRing
+from modules.shared.MessageBroker import MessageBroker
+
+
+def pose(x):
+    return [x, 2 * x, 300.0, 180.0, 0.0, 0.0]
+
+
+def test_latest_and_after():
+    ring = TelemetryRing(capacity=8)
+    assert ring.latest() is None
+
+    for i in range(3):
+        ring.push(pose(i), velocity=10.0 * i, acceleration=1.0, timestamp=100.0 + i)
+
+    latest = ring.latest()
+    assert latest.seq == 3
+    assert latest.position == pose(2)
+    assert latest.velocity == 20.0
+    assert [s.seq for s in ring.after(1)] == [2, 3]
+    assert [s.timestamp for s in ring.since(100.5)] == [101.0, 102.0]
+
+
+def test_wrapped_ring_only_returns_retained_samples():
+    ring = TelemetryRing(capacity=4)
+    for i in range(10):
+        ring.push(pose(i), 0.0, 0.0, float(i))
+
+    samples = ring.after(0)
+    assert [s.seq for s in samples] == [8, 9, 10]
+    assert [s.position[0] for s in samples] == [7.0, 8.0, 9.0]
+    assert [s.seq for s in ring.after(0, max_samples=2)] == [9, 10]
+
+
+def test_interpolate_between_samples():
+    ring = TelemetryRing()
+    ring.push(pose(0), velocity=0.0, acceleration=0.0, timestamp=10.0)
+    ring.push(pose(10), velocity=100.0, acceleration=0.0, timestamp=11.0)
+
+    sample = ring.interpolate(10.25)
+    assert sample.position[0] == pytest.approx(2.5)
+    assert sample.position[1] == pytest.approx(5.0)
+    assert sample.velocity == pytest.approx(25.0)
+    assert ring.interpolate(12.0).position == pose(10)
+    assert ring.interpolate(9.0) is None
+
+
+def test_readers_never_see_torn_samples():
+    ring = TelemetryRing(capacity=16)
+    stop = threading.Event()
+    torn = []
+
+    def reader():
+        while not stop.is_set():
+            for sample in ring.after(0):
+                if sample.position != pose(sample.timestamp) or sample.velocity != sample.timestamp:
+                    torn.append(sample)
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for i in range(20000):
+        ring.push(pose(float(i)), float(i), 0.0, float(i))
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert torn == []
+
+
+class FakeMonitor:
+    def set_data_callback(self, callback):
+        self.callback = callback
+
+
+def test_trajectory_points_are_transformed_off_the_monitor_thread():
+    broker = MessageBroker()
+    points = []
+    request_threads = []
+
+    def transform(message):
+        request_threads.append(threading.current_thread())
+        return message["x"] * 2, message["y"] * 2
+
+    def on_point(point):
+        points.append(point)
+
+    broker.subscribe("vision/transformToCamera", transform)
+    broker.subscribe(RobotTopics.TRAJECTORY_POINT, on_point)
+    manager = RobotStateManager(FakeMonitor())
+    try:
+        manager.trajectory_update = True
+        manager.monitor.callback(pose(0), 0.0, 0.0, time.time())  # stationary, not published
+        manager.monitor.callback(pose(80), 50.0, 0.0, time.time())
+
+        deadline = time.time() + 2
+        while not points and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        manager.trajectory_update = False
+        broker.unsubscribe("vision/transformToCamera", transform)
+        broker.unsubscribe(RobotTopics.TRAJECTORY_POINT, on_point)
+
+    assert points == [{"x": 100, "y": 200}]
+    assert request_threads[0] is not threading.main_thread()
+    assert manager.get_latest_telemetry().position == pose(80)
+
+
+def test_trajectory_publishes_only_the_newest_sample_per_interval():
+    broker = MessageBroker()
+    requests = []
+
+    def transform(message):
+        requests.append(message)
+        return message["x"], message["y"]
+
+    broker.subscribe("vision/transformToCamera", transform)
+    manager = RobotStateManager(FakeMonitor())
+    try:
+        manager.trajectory_update = True
+        for i in range(1, 41):  # a burst of state stream samples within one interval
+            manager.monitor.callback(pose(i), 50.0, 0.0, time.time())
+
+        deadline = time.time() + 2
+        while not any(r["x"] == 40 for r in requests) and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        manager.trajectory_update = False
+        broker.unsubscribe("vision/transformToCamera", transform)
+
+    assert 1 <= len(requests) <= 2
+    assert requests[-1] == {"x": 40, "y": 80}
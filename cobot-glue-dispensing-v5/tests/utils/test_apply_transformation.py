@@ -0,0 +1,50 @@
+import cv2
+import numpy as np
+import pytest
+
+from modules.utils import utils
+
+H = np.array([[0.5, 0.02, -120.0],
+              [-0.01, 0.49, 310.0],
+              [1e-5, -2e-5, 1.0]], dtype=np.float32)
+
+
+def reference(contour, offset=(0.0, 0.0)):
+    points = cv2.perspectiveTransform(np.array(contour, dtype=np.float64).reshape(-1, 1, 2), H.astype(np.float64))
+    return points.reshape(-1, 2) + offset
+
+
+def test_batched_contours_match_perspective_transform():
+    rng = np.random.default_rng(0)
+    contours = [rng.uniform(0, 1280, size=(n, 1, 2)) for n in (5, 1, 300)]
+
+    transformed = utils.get_homography_transform(H).transform_contours(contours, offset=(-2.5, 78.0))
+
+    assert [len(points) for points in transformed] == [5, 1, 300]
+    for contour, points in zip(contours, transformed):
+        assert points == pytest.approx(reference(contour, (-2.5, 78.0)), abs=1e-5)
+
+
+def test_apply_transformation_keeps_nested_list_layout():
+    contours = [[(0, 0), (100, 0), (100, 50)], [(10, 10)]]
+
+    with_offset = utils.applyTransformation(H, contours)
+    without_offset = utils.applyTransformation(H, contours, apply_transducer_offset=False)
+
+    assert np.array(with_offset[0]).shape == (3, 1, 2)
+    assert with_offset[1] == [[list(reference(contours[1], (utils.TRANSDUCER_X_OFFSET, utils.TRANSDUCER_Y_OFFSET))
+                                    .round(6)[0])]]
+    assert np.array(without_offset[0]).reshape(-1, 2) == pytest.approx(reference(contours[0]), abs=1e-5)
+
+
+def test_transform_is_cached_per_homography():
+    first = utils.get_homography_transform(H)
+
+    assert utils.get_homography_transform(H.copy()) is first
+    assert utils.get_homography_transform(np.eye(3)) is not first
+
+
+def test_apply_transformation_does_not_print(capsys):
+    utils.applyTransformation(H, [np.zeros((50, 1, 2), dtype=np.float32)])
+
+    assert capsys.readouterr().out == ""
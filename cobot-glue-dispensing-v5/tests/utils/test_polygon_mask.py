@@ -0,0 +1,61 @@
+import cv2
+import numpy as np
+import pytest
+
+from modules.utils.contours import PolygonMask, is_contour_inside_polygon
+
+SQUARE = np.array([[100, 100], [300, 100], [300, 250], [100, 250]], dtype=np.float32)
+L_SHAPE = np.array([[0, 0], [200, 0], [200, 80], [80, 80], [80, 200], [0, 200]], dtype=np.float32)
+
+
+def contour(points):
+    return np.array(points, dtype=np.int32).reshape(-1, 1, 2)
+
+
+def test_matches_point_polygon_test_away_from_edges():
+    mask = PolygonMask(L_SHAPE)
+    rng = np.random.default_rng(0)
+    points = rng.integers(-20, 220, size=(2000, 2))
+
+    distances = np.array([cv2.pointPolygonTest(L_SHAPE, (float(x), float(y)), True) for x, y in points])
+    expected = distances >= 0
+    clear_of_edge = np.abs(distances) > 1.0
+
+    result = mask.contains_points(points)
+
+    assert np.array_equal(result[clear_of_edge], expected[clear_of_edge])
+
+
+def test_edge_points_count_as_inside():
+    mask = PolygonMask(SQUARE)
+
+    assert mask.contains_contour(contour([[100, 100], [300, 100], [300, 250], [100, 250]]))
+
+
+def test_contour_crossing_the_border_is_rejected():
+    mask = PolygonMask(SQUARE)
+
+    assert mask.contains_contour(contour([[150, 150], [200, 150], [200, 200]]))
+    assert not mask.contains_contour(contour([[150, 150], [350, 150], [200, 200]]))
+    assert not mask.contains_contour(contour([[10, 10], [20, 10], [20, 20]]))
+
+
+def test_concave_polygon_checks_every_point():
+    mask = PolygonMask(L_SHAPE)
+
+    # Bounding box corners are all inside the L, but the contour cuts the notch
+    assert not mask.is_convex
+    assert not mask.contains_contour(contour([[10, 10], [70, 10], [150, 150], [10, 70]]))
+    assert mask.contains_contour(contour([[10, 10], [150, 10], [10, 150]]))
+
+
+def test_degenerate_polygon_raises():
+    with pytest.raises(ValueError):
+        PolygonMask([[0, 0], [10, 10]])
+
+
+def test_is_contour_inside_polygon_with_corners():
+    corners = [(100, 100), (300, 100), (300, 250), (100, 250)]
+
+    assert is_contour_inside_polygon(contour([[150, 150], [200, 150], [200, 200]]), *corners)
+    assert not is_contour_inside_polygon(contour([[150, 150], [350, 150], [200, 200]]), *corners)
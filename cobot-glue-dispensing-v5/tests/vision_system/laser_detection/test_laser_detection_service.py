@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 from modules.VisionSystem.laser_detection.laser_detection_service import LaserDetectionService
 from modules.VisionSystem.laser_detection.laser_detector import LaserDetector
 from modules.VisionSystem.laser_detection.config import LaserDetectionConfig
+from modules.VisionSystem.frame_ring_buffer import FrameRingBuffer
 from modules.shared.tools.Laser import Laser
 
 
@@ -23,6 +24,20 @@ def mock_vision_service():
     return Mock()
 
 
+def stream_frames(mock_vision_service, frame):
+    """Make the mocked vision service deliver a new frame on every wait_for_frame call."""
+    buffer = FrameRingBuffer(capacity=4)
+    buffer.push(frame)
+
+    def wait_for_frame(after_id=0, timeout=None):
+        buffer.push(frame)
+        return buffer.wait_for_frame(after_id=after_id, timeout=timeout)
+
+    mock_vision_service.getLatestFramePacket.side_effect = buffer.get_latest
+    mock_vision_service.wait_for_frame.side_effect = wait_for_frame
+    return buffer
+
+
 @pytest.fixture
 def detection_service(mock_detector, mock_laser, mock_vision_service):
     config = LaserDetectionConfig()
@@ -77,8 +92,8 @@ def test_detect_success(mock_sleep, detection_service, dummy_frame, mock_detecto
     samples = detection_service.config.detection_samples
 
     # Prepare vision service to return frames
-    frames = [dummy_frame for _ in range(samples)]
-    mock_vision_service.latest_frame = dummy_frame
+    buffer = stream_frames(mock_vision_service, dummy_frame)
+    first_id = buffer.latest_id
 
     # Mock detector to return a valid point
     mock_detector.detect_laser_line.return_value = (np.ones((10, 10), np.uint8), (5, 5), (5, 5))
@@ -92,6 +107,8 @@ def test_detect_success(mock_sleep, detection_service, dummy_frame, mock_detecto
     assert closest == (5, 5)
     np.testing.assert_array_equal(detection_service.last_on_frame, dummy_frame)
     np.testing.assert_array_equal(detection_service.last_off_frame, dummy_frame)
+    # Every sample must be a distinct frame newer than the one present before detection
+    assert buffer.latest_id == first_id + 2 * samples
 
 
 @patch("time.sleep", return_value=None)
@@ -99,7 +116,7 @@ def test_detect_failure_retries(mock_sleep, detection_service, dummy_frame, mock
     samples = detection_service.config.detection_samples
 
     # Vision service always returns frames
-    mock_vision_service.latest_frame = dummy_frame
+    stream_frames(mock_vision_service, dummy_frame)
 
     # Detector fails to detect (closest is None)
     mock_detector.detect_laser_line.return_value = (np.ones((10, 10), np.uint8), (5, 5), None)
@@ -114,8 +131,9 @@ def test_detect_failure_retries(mock_sleep, detection_service, dummy_frame, mock
 
 @patch("time.sleep", return_value=None)
 def test_detect_insufficient_frames(mock_sleep, detection_service, dummy_frame, mock_detector, mock_vision_service):
-    # Vision service returns None for frames -> insufficient frames
-    mock_vision_service.latest_frame = None
+    # Vision service never delivers a new frame -> insufficient frames
+    mock_vision_service.getLatestFramePacket.return_value = None
+    mock_vision_service.wait_for_frame.return_value = None
 
     mask, bright, closest = detection_service.detect()
 
@@ -41,6 +41,20 @@ def test_subpixel_quadratic_flat(detector):
     arr = np.array([5,5,5], dtype=float)
     assert detector.subpixel_quadratic(1, arr) == 1.0
 
+def test_subpixel_quadratic_peaks_matches_per_row(detector):
+    rng = np.random.default_rng(0)
+    profiles = rng.integers(0, 40, size=(64, 48)).astype(np.float32)
+    profiles[:, 0] += 100  # peaks on the edges are not refined
+    profiles[3, :] = 5     # below min_intensity
+    profiles[7, 10:13] = [200, 200, 200]  # plateau, first index wins
+    peaks = detector.subpixel_quadratic_peaks(profiles, min_intensity=10)
+
+    for i, row in enumerate(profiles):
+        if np.max(row) > 10:
+            assert peaks[i] == np.float32(detector.subpixel_quadratic(np.argmax(row), row))
+        else:
+            assert np.isnan(peaks[i])
+
 # -------------------------------------------------
 # Detect laser line
 # -------------------------------------------------
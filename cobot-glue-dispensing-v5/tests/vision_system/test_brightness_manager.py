@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from core.model.settings.CameraSettings import CameraSettings
+from modules.VisionSystem.brightness_manager import BrightnessManager
+
+AREA = [[100, 100], [180, 100], [180, 160], [100, 160]]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeVisionSystem:
+    def __init__(self, target=120):
+        self.camera_settings = CameraSettings()
+        self.camera_settings.get_brightness_area_points = lambda: AREA
+        self.camera_settings.get_target_brightness = lambda: target
+        self.image = None
+
+
+def make_manager(rate_hz=5.0, target=120):
+    clock = FakeClock()
+    manager = BrightnessManager(FakeVisionSystem(target), control_rate_hz=rate_hz, clock=clock)
+    return manager, clock
+
+
+def frame(level):
+    return np.full((240, 320, 3), level, dtype=np.uint8)
+
+
+def run_frames(manager, clock, level, count, dt=1 / 30):
+    for _ in range(count):
+        clock.now += dt
+        manager.vision_system.image = frame(level)
+        manager.adjust_brightness()
+
+
+def test_measures_only_the_brightness_area():
+    manager, _ = make_manager()
+    image = frame(50)
+    image[100:161, 100:181] = 200
+
+    assert manager.measure_brightness(image) == pytest.approx(200.0)
+    assert manager.measure_brightness(image, adjustment=-20) == pytest.approx(180.0)
+
+
+def test_converges_and_then_stops_updating():
+    manager, clock = make_manager()
+
+    run_frames(manager, clock, level=80, count=90)
+    stats = manager.get_stats()
+
+    assert stats["converged"]
+    assert manager.vision_system.image[130, 140, 0] == pytest.approx(120, abs=2)
+    assert stats["updates"] < 10
+
+    updates_after_convergence = stats["updates"]
+    run_frames(manager, clock, level=80, count=90)
+    assert manager.get_stats()["updates"] == updates_after_convergence
+
+
+def test_update_rate_is_limited():
+    manager, clock = make_manager(rate_hz=5.0)
+
+    run_frames(manager, clock, level=20, count=30)  # one second of frames, never converged
+
+    assert manager.get_stats()["updates"] <= 6
+    assert manager.get_stats()["frames"] == 30
+
+
+def test_drift_triggers_new_update():
+    manager, clock = make_manager()
+    run_frames(manager, clock, level=80, count=90)
+    updates = manager.get_stats()["updates"]
+
+    run_frames(manager, clock, level=140, count=30)
+
+    assert manager.get_stats()["updates"] > updates
+    assert manager.get_stats()["adjustment"] < 0
+
+
+def test_target_change_triggers_update():
+    manager, clock = make_manager()
+    run_frames(manager, clock, level=80, count=90)
+    updates = manager.get_stats()["updates"]
+
+    manager.brightnessController.target = 100
+    run_frames(manager, clock, level=80, count=1)
+
+    assert manager.get_stats()["updates"] == updates + 1
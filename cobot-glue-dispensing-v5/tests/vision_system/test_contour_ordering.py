@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from modules.VisionSystem.contour_ordering import order_by_proximity, improve_order_two_opt, path_length
+
+
+def brute_force_order(points, start_point):
+    """The original O(n^2) nearest-neighbour walk"""
+    remaining = list(range(len(points)))
+    current = start_point
+    order = []
+    while remaining:
+        nearest = min(remaining, key=lambda i: (points[i][0] - current[0]) ** 2 + (points[i][1] - current[1]) ** 2)
+        order.append(nearest)
+        current = points[nearest]
+        remaining.remove(nearest)
+    return order
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force_nearest_neighbour(seed):
+    rng = np.random.default_rng(seed)
+    points = [tuple(p) for p in rng.integers(0, 1280, size=(60, 2))]
+
+    assert order_by_proximity(points, (0, 0)) == brute_force_order(points, (0, 0))
+
+
+def test_clustered_points_and_duplicates():
+    points = [(10, 10), (10, 10), (11, 10), (900, 700), (901, 700), (10, 12)]
+
+    assert order_by_proximity(points, (0, 0)) == brute_force_order(points, (0, 0))
+
+
+def test_empty_and_single():
+    assert order_by_proximity([], (0, 0)) == []
+    assert order_by_proximity([(5, 5)], (0, 0)) == [0]
+
+
+def test_two_opt_never_lengthens_the_path():
+    rng = np.random.default_rng(42)
+    points = rng.integers(0, 1000, size=(50, 2))
+    greedy = order_by_proximity(points, (0, 0))
+
+    improved = improve_order_two_opt(points, greedy, (0, 0))
+
+    assert sorted(improved) == list(range(len(points)))
+    assert path_length(points, improved, (0, 0)) <= path_length(points, greedy, (0, 0)) + 1e-9
+
+
+def test_two_opt_removes_crossing():
+    points = [(0, 10), (10, 0), (10, 10), (0, 20)]
+    crossing = [1, 0, 2, 3]
+
+    improved = improve_order_two_opt(points, crossing, (0, 0))
+
+    assert path_length(points, improved, (0, 0)) < path_length(points, crossing, (0, 0))
+
+
+def test_path_length_includes_start():
+    assert path_length([(3, 4), (3, 10)], [0, 1], (0, 0)) == pytest.approx(11.0)
+    assert path_length([], [], (0, 0)) == 0.0
+    assert math.isfinite(path_length([(1, 1)], [0], (0, 0)))
@@ -0,0 +1,100 @@
+import cv2
+import numpy as np
+
+from core.model.settings.CameraSettings import CameraSettings
+from modules.VisionSystem.data_loading import DataManager
+from modules.VisionSystem.frame_metrics import FrameMetrics, STAGE_PUBLISH_THRESH
+from modules.VisionSystem.handlers.contour_detection_handler import findContours, get_detection_roi
+
+WIDTH, HEIGHT = 640, 480
+SPRAY_AREA = np.array([[200, 150], [440, 150], [440, 330], [200, 330]], dtype=np.float32)
+
+
+class FakePublisher:
+    def __init__(self):
+        self.thresh_images = []
+
+    def publish_thresh_image(self, image):
+        self.thresh_images.append(image)
+
+
+class FakeVisionSystem:
+    def __init__(self, storage_path, roi_enabled=True, external=False):
+        self.camera_settings = CameraSettings()
+        self.metrics = FrameMetrics()
+        self.message_publisher = FakePublisher()
+        self.threshold_by_area = "spray"
+        self.contour_roi_enabled = roi_enabled
+        self.contour_retrieval_external = external
+        self.data_manager = DataManager(self, False, None, storage_path=storage_path)
+        self.data_manager.sprayAreaPoints = SPRAY_AREA
+
+    def get_thresh_by_area(self, area):
+        return 127
+
+
+def make_image():
+    """White background with dark parts inside, outside and across the spray area"""
+    image = np.full((HEIGHT, WIDTH, 3), 255, dtype=np.uint8)
+    cv2.rectangle(image, (250, 200), (300, 260), (0, 0, 0), -1)
+    cv2.rectangle(image, (340, 190), (400, 300), (0, 0, 0), -1)
+    cv2.rectangle(image, (355, 220), (385, 270), (255, 255, 255), -1)  # hole
+    cv2.rectangle(image, (20, 20), (80, 80), (0, 0, 0), -1)
+    cv2.rectangle(image, (420, 300), (500, 360), (0, 0, 0), -1)
+    return image
+
+
+def boxes(contours):
+    return sorted(cv2.boundingRect(c) for c in contours)
+
+
+def inside_spray_area(contours):
+    return [c for c in contours
+            if all(cv2.pointPolygonTest(SPRAY_AREA, (float(p[0][0]), float(p[0][1])), False) >= 0 for p in c)]
+
+
+def test_roi_covers_spray_area_with_margin(tmp_path):
+    vision_system = FakeVisionSystem(str(tmp_path))
+
+    x, y, w, h = get_detection_roi(vision_system, WIDTH, HEIGHT)
+
+    assert x < 200 and y < 150
+    assert x + w > 440 and y + h > 330
+    assert w < WIDTH and h < HEIGHT
+
+
+def test_roi_disabled_or_missing_spray_area_uses_full_frame(tmp_path):
+    assert get_detection_roi(FakeVisionSystem(str(tmp_path), roi_enabled=False), WIDTH, HEIGHT) is None
+
+    vision_system = FakeVisionSystem(str(tmp_path))
+    vision_system.data_manager.sprayAreaPoints = None
+    assert get_detection_roi(vision_system, WIDTH, HEIGHT) is None
+
+
+def test_roi_contours_match_full_frame_inside_spray_area(tmp_path):
+    image = make_image()
+    full = findContours(FakeVisionSystem(str(tmp_path), roi_enabled=False), image)
+    roi_system = FakeVisionSystem(str(tmp_path))
+    cropped = findContours(roi_system, image)
+
+    assert boxes(inside_spray_area(cropped)) == boxes(inside_spray_area(full))
+    assert len(cropped) < len(full)
+    assert roi_system.message_publisher.thresh_images[0].shape == (HEIGHT, WIDTH)
+
+
+def test_external_retrieval_skips_holes(tmp_path):
+    image = make_image()
+    tree = findContours(FakeVisionSystem(str(tmp_path)), image)
+    external = findContours(FakeVisionSystem(str(tmp_path), external=True), image)
+
+    assert len(external) < len(tree)
+
+
+def test_threshold_publish_is_timed_as_its_own_stage(tmp_path):
+    vision_system = FakeVisionSystem(str(tmp_path))
+
+    findContours(vision_system, make_image())
+
+    stages = vision_system.metrics.snapshot()["stages_ms"]
+    assert stages[STAGE_PUBLISH_THRESH]["count"] == 1
+    assert "publish" not in stages
@@ -0,0 +1,70 @@
+import cv2
+import numpy as np
+import pytest
+
+from modules.VisionSystem.correction_maps import build_correction_maps, OPTIMAL_CAMERA_MATRIX_ALPHA
+
+WIDTH, HEIGHT = 320, 240
+CAMERA_MATRIX = np.array([[300.0, 0.0, 160.0],
+                          [0.0, 302.0, 120.0],
+                          [0.0, 0.0, 1.0]])
+DIST_COEFFS = np.array([[-0.25, 0.08, 0.001, -0.001, -0.01]])
+PERSPECTIVE_MATRIX = np.array([[1.02, 0.03, -4.0],
+                               [0.01, 0.98, 3.0],
+                               [2e-5, 3e-5, 1.0]])
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, 255, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+    return cv2.GaussianBlur(noise, (15, 15), 0)
+
+
+def reference_correction(image, perspective_matrix):
+    size = (WIDTH, HEIGHT)
+    new_matrix, _ = cv2.getOptimalNewCameraMatrix(CAMERA_MATRIX, DIST_COEFFS, size,
+                                                  OPTIMAL_CAMERA_MATRIX_ALPHA, size)
+    corrected = cv2.undistort(image, CAMERA_MATRIX, DIST_COEFFS, None, new_matrix)
+    if perspective_matrix is not None:
+        corrected = cv2.warpPerspective(corrected, perspective_matrix, size)
+    return corrected
+
+
+def interior(image, margin=10):
+    return image[margin:-margin, margin:-margin].astype(np.int32)
+
+
+def test_undistort_only_matches_cv2_undistort(image):
+    maps = build_correction_maps(CAMERA_MATRIX, DIST_COEFFS, None, WIDTH, HEIGHT)
+
+    result = maps.apply(image)
+
+    expected = reference_correction(image, None)
+    assert result.shape == expected.shape
+    assert np.abs(interior(result) - interior(expected)).max() <= 1
+
+
+@pytest.mark.parametrize("fixed_point", [True, False])
+def test_fused_maps_match_undistort_then_warp(image, fixed_point):
+    maps = build_correction_maps(CAMERA_MATRIX, DIST_COEFFS, PERSPECTIVE_MATRIX,
+                                 WIDTH, HEIGHT, fixed_point=fixed_point)
+
+    result = maps.apply(image)
+
+    expected = reference_correction(image, PERSPECTIVE_MATRIX)
+    # A single interpolation differs from two chained ones only by rounding noise
+    assert np.abs(interior(result) - interior(expected)).mean() < 1.0
+
+
+def test_fixed_point_maps_use_compact_type():
+    maps = build_correction_maps(CAMERA_MATRIX, DIST_COEFFS, PERSPECTIVE_MATRIX, WIDTH, HEIGHT)
+
+    assert maps.map1.dtype == np.int16
+    assert maps.map1.shape == (HEIGHT, WIDTH, 2)
+    assert maps.size == (WIDTH, HEIGHT)
+
+
+def test_missing_calibration_raises():
+    with pytest.raises(ValueError):
+        build_correction_maps(None, DIST_COEFFS, None, WIDTH, HEIGHT)
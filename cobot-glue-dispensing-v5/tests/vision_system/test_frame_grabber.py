@@ -0,0 +1,178 @@
+import threading
+
+import numpy as np
+
+from modules.VisionSystem.frame_grabber import FrameGrabber
+
+
+class FakeCamera:
+    """Camera that returns numbered frames, optionally gated so the test controls the pace."""
+
+    def __init__(self, gated=False, fail_first=0):
+        self.count = 0
+        self.gated = gated
+        self.fail_first = fail_first
+        self.gate = threading.Semaphore(0)
+
+    def capture(self):
+        if self.gated and not self.gate.acquire(timeout=0.05):
+            return None
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            return None
+        self.count += 1
+        return np.full((2, 2, 3), self.count % 256, dtype=np.uint8)
+
+    def release_frames(self, n):
+        for _ in range(n):
+            self.gate.release()
+
+
+def wait_until(predicate, timeout=2.0):
+    done = threading.Event()
+    deadline = threading.Timer(timeout, done.set)
+    deadline.start()
+    try:
+        while not done.is_set():
+            if predicate():
+                return True
+            done.wait(0.001)
+        return predicate()
+    finally:
+        deadline.cancel()
+
+
+def test_get_frame_returns_captured_frames_in_order():
+    camera = FakeCamera(gated=True)
+    grabber = FrameGrabber(camera)
+    grabber.start()
+    try:
+        camera.release_frames(1)
+        first = grabber.get_frame(timeout=2.0)
+        camera.release_frames(1)
+        second = grabber.get_frame(timeout=2.0)
+    finally:
+        grabber.stop()
+
+    assert (first.frame_id, second.frame_id) == (1, 2)
+    assert second.frame[0, 0, 0] == 2
+    assert grabber.get_stats()["dropped"] == 0
+
+
+def test_stale_frames_are_dropped_and_counted():
+    camera = FakeCamera(gated=True)
+    grabber = FrameGrabber(camera)
+    grabber.start()
+    try:
+        camera.release_frames(3)
+        assert wait_until(lambda: grabber.get_stats()["captured"] == 3)
+        packet = grabber.get_frame(timeout=2.0)
+    finally:
+        grabber.stop()
+
+    assert packet.frame_id == 3
+    stats = grabber.get_stats()
+    assert stats["dropped"] == 2
+    assert stats["delivered"] == 1
+
+
+def test_failed_captures_are_counted_and_retried():
+    camera = FakeCamera(gated=True, fail_first=2)
+    grabber = FrameGrabber(camera, retry_delay=0.001)
+    grabber.start()
+    try:
+        camera.release_frames(3)
+        packet = grabber.get_frame(timeout=2.0)
+    finally:
+        grabber.stop()
+
+    assert packet.frame_id == 1
+    assert grabber.get_stats()["capture_failures"] >= 2
+
+
+def test_get_frame_times_out_without_frames():
+    camera = FakeCamera(gated=True)
+    grabber = FrameGrabber(camera)
+    grabber.start()
+    try:
+        assert grabber.get_frame(timeout=0.05) is None
+    finally:
+        grabber.stop()
+
+
+def test_stop_wakes_waiting_consumer():
+    grabber = FrameGrabber(FakeCamera(gated=True))
+    grabber.start()
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(grabber.get_frame()))
+    consumer.start()
+
+    grabber.stop()
+    consumer.join(timeout=2.0)
+
+    assert not consumer.is_alive()
+    assert result == [None]
+    assert not grabber.is_running
+
+
+class SizedCamera:
+    def __init__(self, width, height):
+        self.shape = (height, width, 3)
+        self.closed = False
+
+    def capture(self):
+        return None if self.closed else np.zeros(self.shape, dtype=np.uint8)
+
+    def close(self):
+        self.closed = True
+
+
+def test_grabber_follows_camera_replacement():
+    holder = {"camera": SizedCamera(4, 2)}
+    grabber = FrameGrabber(lambda: holder["camera"])
+    grabber.start()
+    try:
+        assert grabber.get_frame(timeout=1.0).frame.shape == (2, 4, 3)
+
+        holder["camera"] = SizedCamera(8, 6)
+
+        assert wait_until(lambda: (packet := grabber.get_frame(timeout=0.05)) is not None
+                          and packet.frame.shape == (6, 8, 3))
+    finally:
+        grabber.stop()
+
+
+def test_settings_update_restarts_capture_on_the_new_camera(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from core.model.settings.enums.CameraSettingKey import CameraSettingKey
+    from modules.VisionSystem import settings_manager
+
+    monkeypatch.setattr(settings_manager, "Camera", lambda index, width, height: SizedCamera(width, height))
+    vision_system = MagicMock()
+    vision_system.camera_settings.updateSettings.return_value = (True, "")
+    vision_system.camera_settings.get_camera_width.return_value = 8
+    vision_system.camera_settings.get_camera_height.return_value = 6
+    old_camera = SizedCamera(4, 2)
+    vision_system.camera = old_camera
+
+    def start():
+        vision_system.frame_grabber = FrameGrabber(lambda: vision_system.camera)
+        vision_system.frame_grabber.start()
+
+    def stop():
+        vision_system.frame_grabber.stop()
+        vision_system.frame_grabber = None
+
+    vision_system.start_pipelined_capture.side_effect = start
+    vision_system.stop_pipelined_capture.side_effect = stop
+    start()
+    try:
+        success, _ = settings_manager.SettingsManager().updateSettings(
+            vision_system, {CameraSettingKey.WIDTH.value: 8}, False, None)
+
+        assert success
+        assert old_camera.closed
+        assert vision_system.frame_grabber.get_frame(timeout=1.0).frame.shape == (6, 8, 3)
+    finally:
+        vision_system.frame_grabber.stop()
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from modules.VisionSystem.frame_metrics import FrameMetrics, RollingHistogram, STAGE_CAPTURE, STAGE_PUBLISH_FRAME
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_histogram_percentiles():
+    histogram = RollingHistogram(window_size=100)
+    for value in range(1, 101):
+        histogram.add(float(value))
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 100
+    assert summary["p50"] == 50.0
+    assert summary["p95"] == 95.0
+    assert summary["p99"] == 99.0
+    assert summary["max"] == 100.0
+    assert summary["mean"] == pytest.approx(50.5)
+
+
+def test_histogram_keeps_only_window():
+    histogram = RollingHistogram(window_size=3)
+    for value in [100.0, 1.0, 2.0, 3.0]:
+        histogram.add(value)
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 3
+    assert summary["max"] == 3.0
+    assert histogram.total_count == 4
+
+
+def test_empty_histogram_summary():
+    assert RollingHistogram().summary()["count"] == 0
+
+
+def test_stage_records_milliseconds():
+    clock = FakeClock()
+    metrics = FrameMetrics(clock=clock)
+
+    with metrics.stage(STAGE_CAPTURE):
+        clock.now += 0.012
+
+    stages = metrics.snapshot()["stages_ms"]
+    assert stages[STAGE_CAPTURE]["p50"] == pytest.approx(12.0)
+
+
+def test_stage_records_even_if_block_raises():
+    clock = FakeClock()
+    metrics = FrameMetrics(clock=clock)
+
+    with pytest.raises(RuntimeError):
+        with metrics.stage(STAGE_PUBLISH_FRAME):
+            clock.now += 0.001
+            raise RuntimeError("subscriber failed")
+
+    assert metrics.snapshot()["stages_ms"][STAGE_PUBLISH_FRAME]["count"] == 1
+
+
+def test_fps_published_once_per_interval():
+    clock = FakeClock()
+    published = []
+    metrics = FrameMetrics(publish=published.append, publish_interval=1.0, clock=clock)
+
+    for _ in range(30):
+        clock.now += 0.025
+        metrics.frame_done()
+    assert published == []
+
+    for _ in range(10):
+        clock.now += 0.025
+        metrics.frame_done()
+
+    assert len(published) == 1
+    assert published[0]["fps"] == pytest.approx(40.0)
+    assert published[0]["frames"] == 40
+
+
+def test_disabled_metrics_record_nothing():
+    clock = FakeClock()
+    metrics = FrameMetrics(clock=clock)
+    metrics.enabled = False
+
+    with metrics.stage(STAGE_CAPTURE):
+        clock.now += 1.0
+    metrics.frame_done()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["stages_ms"] == {}
+    assert snapshot["frames"] == 0
+
+
+def test_dump_writes_snapshot(tmp_path):
+    metrics = FrameMetrics()
+    metrics.record(STAGE_CAPTURE, 0.005)
+    path = tmp_path / "metrics.json"
+
+    metrics.dump(str(path))
+
+    with open(path) as f:
+        data = json.load(f)
+    assert data["stages_ms"][STAGE_CAPTURE]["p99"] == pytest.approx(5.0)
@@ -0,0 +1,89 @@
+import threading
+
+import numpy as np
+import pytest
+
+from modules.VisionSystem.frame_ring_buffer import FrameRingBuffer
+
+
+def make_frame(value):
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def test_push_assigns_increasing_ids():
+    buffer = FrameRingBuffer(capacity=3)
+    assert buffer.latest_id == 0
+    assert buffer.get_latest() is None
+
+    ids = [buffer.push(make_frame(i)) for i in range(5)]
+
+    assert ids == [1, 2, 3, 4, 5]
+    packet = buffer.get_latest()
+    assert packet.frame_id == 5
+    assert packet.frame[0, 0, 0] == 4
+
+
+def test_push_stores_frames_without_copying():
+    buffer = FrameRingBuffer(capacity=2)
+    frame = make_frame(7)
+    frame_id = buffer.push(frame, timestamp=12.5)
+
+    packet = buffer.get(frame_id)
+    assert packet.frame is frame
+    assert packet.timestamp == 12.5
+
+
+def test_overwritten_frames_are_not_returned():
+    buffer = FrameRingBuffer(capacity=2)
+    for i in range(3):
+        buffer.push(make_frame(i))
+
+    assert buffer.get(1) is None
+    assert buffer.get(2).frame[0, 0, 0] == 1
+    assert buffer.get(4) is None
+
+
+def test_wait_for_frame_returns_immediately_when_newer_frame_exists():
+    buffer = FrameRingBuffer()
+    buffer.push(make_frame(1))
+    buffer.push(make_frame(2))
+
+    packet = buffer.wait_for_frame(after_id=1, timeout=0)
+
+    assert packet.frame_id == 2
+
+
+def test_wait_for_frame_times_out_without_new_frame():
+    buffer = FrameRingBuffer()
+    last_id = buffer.push(make_frame(1))
+
+    assert buffer.wait_for_frame(after_id=last_id, timeout=0.01) is None
+
+
+def test_wait_for_frame_wakes_up_on_push():
+    buffer = FrameRingBuffer()
+    result = {}
+
+    def consumer():
+        result["packet"] = buffer.wait_for_frame(after_id=0, timeout=2.0)
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    buffer.push(make_frame(9))
+    thread.join(timeout=2.0)
+
+    assert result["packet"].frame_id == 1
+
+
+def test_clear_keeps_ids_monotonic():
+    buffer = FrameRingBuffer(capacity=2)
+    buffer.push(make_frame(1))
+    buffer.clear()
+
+    assert buffer.get_latest() is None
+    assert buffer.push(make_frame(2)) == 2
+
+
+def test_invalid_capacity_raises():
+    with pytest.raises(ValueError):
+        FrameRingBuffer(capacity=0)
@@ -0,0 +1,152 @@
+"""
+Unit tests for GlueWorkpieceJsonRepository.
+Covers the ID index, incremental reloads and single-file saves.
+"""
+
+import json
+import os
+
+import pytest
+
+from applications.glue_dispensing_application.repositories.workpiece.glue_workpiece_json_repository import (
+    GlueWorkpieceJsonRepository
+)
+from modules.shared.core.interfaces.JsonSerializable import JsonSerializable
+
+
+class SimpleWorkpiece(JsonSerializable):
+    """Minimal serializable workpiece that counts deserializations."""
+
+    deserialize_calls = 0
+
+    def __init__(self, workpieceId, name):
+        self.workpieceId = workpieceId
+        self.name = name
+
+    @staticmethod
+    def serialize(workpiece):
+        return {"workpieceId": workpiece.workpieceId, "name": workpiece.name}
+
+    @staticmethod
+    def deserialize(data):
+        SimpleWorkpiece.deserialize_calls += 1
+        return SimpleWorkpiece(data["workpieceId"], data["name"])
+
+
+@pytest.fixture
+def storage(tmp_path):
+    SimpleWorkpiece.deserialize_calls = 0
+    return str(tmp_path)
+
+
+def make_repository(storage):
+    return GlueWorkpieceJsonRepository(storage, [], SimpleWorkpiece)
+
+
+def workpiece_files(storage):
+    found = []
+    for root, _, files in os.walk(storage):
+        found.extend(os.path.join(root, f) for f in files
+                     if f.endswith(GlueWorkpieceJsonRepository.WORKPIECE_FILE_SUFFIX))
+    return found
+
+
+def test_save_new_and_lookup_by_id(storage):
+    repo = make_repository(storage)
+
+    success, _ = repo.save_workpiece(SimpleWorkpiece("1", "first"))
+
+    assert success
+    assert repo.get_workpiece_by_id("1").name == "first"
+    assert repo.get_workpiece_by_id(1).name == "first"
+    assert repo.get_workpiece_by_id("missing") is None
+    assert len(workpiece_files(storage)) == 1
+
+
+def test_update_overwrites_only_its_file(storage):
+    repo = make_repository(storage)
+    repo.save_workpiece(SimpleWorkpiece("1", "first"))
+    repo.save_workpiece(SimpleWorkpiece("2", "second"))
+    files_before = sorted(workpiece_files(storage))
+
+    success, message = repo.save_workpiece(SimpleWorkpiece("1", "renamed"))
+
+    assert success
+    assert message == "Workpiece updated successfully"
+    assert sorted(workpiece_files(storage)) == files_before
+    assert [wp.name for wp in repo.data] == ["renamed", "second"]
+    assert not [f for f in os.listdir(os.path.dirname(files_before[0])) if f.startswith(".tmp_")]
+
+
+def test_reopened_repository_finds_saved_workpiece(storage):
+    repo = make_repository(storage)
+    repo.save_workpiece(SimpleWorkpiece("7", "indexed"))
+
+    reopened = make_repository(storage)
+
+    assert reopened.get_workpiece_by_id("7").name == "indexed"
+    assert [f for f in os.listdir(storage) if not os.path.isdir(os.path.join(storage, f))] == []
+
+
+def test_reload_parses_only_changed_files(storage):
+    repo = make_repository(storage)
+    repo.save_workpiece(SimpleWorkpiece("1", "first"))
+    repo.save_workpiece(SimpleWorkpiece("2", "second"))
+    SimpleWorkpiece.deserialize_calls = 0
+
+    repo.loadData()
+    assert SimpleWorkpiece.deserialize_calls == 0
+
+    # Change one file behind the repository's back
+    changed = repo._path_by_id["2"]
+    changed_path = os.path.join(storage, changed)
+    with open(changed_path, "w") as f:
+        json.dump({"workpieceId": "2", "name": "edited on disk"}, f)
+    os.utime(changed_path, ns=(0, 0))
+
+    repo.data = repo.loadData()
+
+    assert SimpleWorkpiece.deserialize_calls == 1
+    assert repo.get_workpiece_by_id("2").name == "edited on disk"
+    assert repo.get_workpiece_by_id("1").name == "first"
+
+
+def test_delete_removes_file_and_index_entry(storage):
+    repo = make_repository(storage)
+    repo.save_workpiece(SimpleWorkpiece("1", "first"))
+
+    success, _ = repo.deleteWorkpiece("1")
+
+    assert success
+    assert repo.get_workpiece_by_id("1") is None
+    assert repo.data == []
+    assert workpiece_files(storage) == []
+    assert make_repository(storage).data == []
+
+
+def test_delete_unknown_id(storage):
+    repo = make_repository(storage)
+
+    success, _ = repo.deleteWorkpiece("nope")
+
+    assert not success
+
+
+def test_feature_index_subscribed_before_load_is_built_at_load(storage):
+    from modules.contour_matching.matching.workpiece_feature_index import WorkpieceFeatureIndex
+
+    class ContourWorkpiece(SimpleWorkpiece):
+        @staticmethod
+        def deserialize(data):
+            return ContourWorkpiece(data["workpieceId"], data["name"])
+
+        def get_main_contour(self):
+            return [[0, 0], [10, 0], [10, 10], [0, 10]]
+
+    GlueWorkpieceJsonRepository(storage, [], ContourWorkpiece).save_workpiece(ContourWorkpiece("1", "first"))
+    index = WorkpieceFeatureIndex(feature_extractor=lambda contour: [len(contour)])
+
+    GlueWorkpieceJsonRepository(storage, [], ContourWorkpiece)
+
+    assert "1" in index
+    assert index.extractions == 1